@@ -62,6 +62,7 @@ def _add_common_gui_args(subparser: argparse.ArgumentParser) -> None:
     subparser.add_argument("--mode", choices=["battle", "zone", "manual"], default="battle")
     subparser.add_argument("--history", type=int, default=5)
     subparser.add_argument("--battle-timeout", type=float, default=20.0)
+    subparser.add_argument("--max-fps", type=float, default=10.0)
 
 
 def _normalize_argv(argv: list[str]) -> list[str]:
@@ -1,15 +1,24 @@
+from .equipment_cache import EquipmentProfileCache
 from .fame_tracker import FameTracker
-from .item_resolver import ItemResolver, load_item_resolver
+from .item_resolver import (
+    AsyncItemResolver,
+    ItemResolver,
+    load_item_resolver,
+    load_item_resolver_async,
+)
 from .name_registry import NameRegistry
 from .map_resolver import MapResolver, load_map_resolver
 from .party_registry import PartyRegistry
 from .types import DomainState
 
 __all__ = [
+    "AsyncItemResolver",
     "DomainState",
+    "EquipmentProfileCache",
     "FameTracker",
     "ItemResolver",
     "load_item_resolver",
+    "load_item_resolver_async",
     "NameRegistry",
     "MapResolver",
     "load_map_resolver",
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+
+from albion_dps.domain.item_resolver import WeaponInfo
+from albion_dps.domain.name_registry import NameRegistry
+
+
+class ItemLookup(Protocol):
+    def role_for_items(self, item_ids: Iterable[int]) -> str | None:
+        ...
+
+    def weapon_category_for_items(self, item_ids: Iterable[int]) -> str | None:
+        ...
+
+    def weapon_info_for_items(self, item_ids: Iterable[int]) -> WeaponInfo | None:
+        ...
+
+
+@dataclass(frozen=True)
+class EquipmentProfile:
+    version: int
+    resolver_ready: bool
+    role: str | None
+    weapon: WeaponInfo | None
+
+
+class EquipmentProfileCache:
+    """Per-entity role/weapon resolution keyed by equipment version.
+
+    Profiles are resolved when the name registry reports an equipment change
+    (on the producer thread), so scoreboard rebuilds only do dict lookups.
+    Entries resolved before a background resolver finished loading are
+    refreshed once it becomes ready.
+    """
+
+    def __init__(self, names: NameRegistry, resolver: ItemLookup) -> None:
+        self._names = names
+        self._resolver = resolver
+        self._profiles: dict[int, EquipmentProfile] = {}
+        self._lock = threading.Lock()
+        names.equipment_listener = self.observe_equipment
+
+    def observe_equipment(self, entity_id: int, version: int, items: list[int]) -> None:
+        profile = self._build(version, items)
+        with self._lock:
+            current = self._profiles.get(entity_id)
+            if current is not None and current.version > version:
+                return
+            self._profiles[entity_id] = profile
+
+    def role_for(self, entity_id: int) -> str | None:
+        profile = self._profile(entity_id)
+        return profile.role if profile is not None else None
+
+    def weapon_for(self, entity_id: int) -> WeaponInfo | None:
+        profile = self._profile(entity_id)
+        return profile.weapon if profile is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+    def _profile(self, entity_id: int) -> EquipmentProfile | None:
+        version = self._names.equipment_version(entity_id)
+        if version <= 0:
+            return None
+        profile = self._profiles.get(entity_id)
+        if (
+            profile is not None
+            and profile.version == version
+            and profile.resolver_ready == self._resolver_ready()
+        ):
+            return profile
+        # Missed or stale entry (e.g. resolver finished loading): resolve once
+        # and keep the result until the equipment version moves again.
+        self.observe_equipment(entity_id, version, self._names.items_for(entity_id))
+        return self._profiles.get(entity_id)
+
+    def _build(self, version: int, items: list[int]) -> EquipmentProfile:
+        ready = self._resolver_ready()
+        role = self._resolver.weapon_category_for_items(items)
+        if not role:
+            role = self._resolver.role_for_items(items)
+        return EquipmentProfile(
+            version=version,
+            resolver_ready=ready,
+            role=role,
+            weapon=self._resolver.weapon_info_for_items(items),
+        )
+
+    def _resolver_ready(self) -> bool:
+        ready = getattr(self._resolver, "ready", None)
+        if callable(ready):
+            return bool(ready())
+        return True
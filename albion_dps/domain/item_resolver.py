@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import bisect
 import json
 import logging
 import os
+import threading
+from array import array
 from dataclasses import dataclass, field
 import re
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
 
 ENV_INDEXED_ITEMS = "ALBION_DPS_INDEXED_ITEMS"
@@ -79,6 +82,7 @@ class ItemResolver:
     index_to_name: dict[int, str] = field(default_factory=dict)
     unique_to_subcategory: dict[str, str] = field(default_factory=dict)
     unique_to_category: dict[str, str] = field(default_factory=dict)
+    item_index: "IndexedItemsIndex | None" = None
 
     def role_for_items(self, item_ids: Iterable[int]) -> str | None:
         unique = self._mainhand_unique(item_ids)
@@ -123,7 +127,7 @@ class ItemResolver:
         for item_id in item_ids:
             if not isinstance(item_id, int) or item_id <= 0:
                 continue
-            unique = self.index_to_unique.get(item_id)
+            unique = self._unique_for_index(item_id)
             if not unique:
                 continue
             name = self.index_to_name.get(item_id)
@@ -142,24 +146,132 @@ class ItemResolver:
         for item_id in item_ids:
             if not isinstance(item_id, int) or item_id <= 0:
                 continue
-            unique = self.index_to_unique.get(item_id)
+            unique = self._unique_for_index(item_id)
             if unique:
                 return unique
         return None
 
+    def _unique_for_index(self, item_id: int) -> str | None:
+        unique = self.index_to_unique.get(item_id)
+        if unique is not None or self.item_index is None:
+            return unique
+        unique, name = self.item_index.resolve(item_id)
+        if unique:
+            # Cache the hit so each seen index is decoded from disk only once.
+            self.index_to_unique[item_id] = unique
+            if name:
+                self.index_to_name[item_id] = name
+        return unique
+
+
+class IndexedItemsIndex:
+    """Byte-offset index over an ``indexedItems.json`` record array.
+
+    Only item indices and record spans are kept in memory; a record is decoded
+    from disk the first time its index is looked up.
+    """
+
+    def __init__(self, path: Path, indices: array, offsets: array, lengths: array) -> None:
+        self.path = path
+        self._indices = indices
+        self._offsets = offsets
+        self._lengths = lengths
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def resolve(self, item_id: int) -> tuple[str | None, str | None]:
+        pos = bisect.bisect_left(self._indices, item_id)
+        if pos >= len(self._indices) or self._indices[pos] != item_id:
+            return None, None
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self._offsets[pos])
+                raw = handle.read(self._lengths[pos])
+            record = json.loads(raw)
+        except (OSError, ValueError):
+            return None, None
+        parsed = _parse_indexed_record(record)
+        if parsed is None:
+            return None, None
+        _index, unique, name = parsed
+        return unique, name
+
+
+class AsyncItemResolver:
+    """Item resolver whose databases are loaded on a background thread.
+
+    Every lookup answers ``None`` until loading has finished, so callers can
+    start rendering before the item databases are available.
+    """
+
+    def __init__(self, loader: Callable[[], ItemResolver]) -> None:
+        self._loader = loader
+        self._resolver: ItemResolver | None = None
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "AsyncItemResolver":
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(
+            target=self._load,
+            daemon=True,
+            name="acd-item-resolver",
+        )
+        self._thread.start()
+        return self
+
+    def ready(self) -> bool:
+        return self._resolver is not None
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self._done.wait(timeout)
+        return self.ready()
+
+    def role_for_items(self, item_ids: Iterable[int]) -> str | None:
+        resolver = self._resolver
+        return resolver.role_for_items(item_ids) if resolver is not None else None
+
+    def subcategory_for_items(self, item_ids: Iterable[int]) -> str | None:
+        resolver = self._resolver
+        return resolver.subcategory_for_items(item_ids) if resolver is not None else None
+
+    def weapon_category_for_items(self, item_ids: Iterable[int]) -> str | None:
+        resolver = self._resolver
+        return resolver.weapon_category_for_items(item_ids) if resolver is not None else None
+
+    def weapon_info_for_items(self, item_ids: Iterable[int]) -> "WeaponInfo | None":
+        resolver = self._resolver
+        return resolver.weapon_info_for_items(item_ids) if resolver is not None else None
+
+    def _load(self) -> None:
+        try:
+            self._resolver = self._loader()
+        except Exception:
+            logging.getLogger(__name__).exception("Background item database load failed")
+        finally:
+            self._done.set()
+
 
 def load_item_resolver(
     *,
     indexed_path: str | Path | None = None,
     items_path: str | Path | None = None,
     category_path: str | Path | None = None,
+    on_demand: bool = False,
     logger: logging.Logger | None = None,
 ) -> ItemResolver:
     resolver = ItemResolver()
     logger = logger or logging.getLogger(__name__)
 
     indexed = _resolve_path(indexed_path, ENV_INDEXED_ITEMS, DEFAULT_INDEXED_PATHS)
-    if indexed:
+    item_index = None
+    if indexed and on_demand:
+        item_index = _build_indexed_items_index(indexed, logger=logger)
+    if item_index is not None:
+        resolver.item_index = item_index
+    elif indexed:
         index_map, name_map = _load_indexed_items(indexed, logger=logger)
         resolver.index_to_unique = index_map
         resolver.index_to_name = name_map
@@ -181,6 +293,26 @@ def load_item_resolver(
     return resolver
 
 
+def load_item_resolver_async(
+    *,
+    indexed_path: str | Path | None = None,
+    items_path: str | Path | None = None,
+    category_path: str | Path | None = None,
+    on_demand: bool = False,
+    logger: logging.Logger | None = None,
+) -> AsyncItemResolver:
+    def loader() -> ItemResolver:
+        return load_item_resolver(
+            indexed_path=indexed_path,
+            items_path=items_path,
+            category_path=category_path,
+            on_demand=on_demand,
+            logger=logger,
+        )
+
+    return AsyncItemResolver(loader).start()
+
+
 def _resolve_path(
     provided: str | Path | None,
     env_key: str,
@@ -206,25 +338,83 @@ def _load_indexed_items(
     index_map: dict[int, str] = {}
     name_map: dict[int, str] = {}
     for record in _iter_records(data):
-        if not isinstance(record, dict):
+        parsed = _parse_indexed_record(record)
+        if parsed is None:
             continue
-        lower = {str(k).lower(): v for k, v in record.items()}
-        unique = lower.get("uniquename")
-        index = lower.get("index")
-        name = _pick_localized_name(lower.get("localizednames") or lower.get("localizedname"))
-        if isinstance(unique, str) and unique and index is not None:
-            try:
-                index_value = int(index)
-            except (TypeError, ValueError):
-                continue
-            index_map[index_value] = unique
-            if isinstance(name, str) and name:
-                name_map[index_value] = name
+        index_value, unique, name = parsed
+        index_map[index_value] = unique
+        if name:
+            name_map[index_value] = name
     if not index_map:
         logger.warning("Indexed items file loaded but produced no entries: %s", path)
     return index_map, name_map
 
 
+def _parse_indexed_record(record: Any) -> tuple[int, str, str | None] | None:
+    if not isinstance(record, dict):
+        return None
+    lower = {str(k).lower(): v for k, v in record.items()}
+    unique = lower.get("uniquename")
+    index = lower.get("index")
+    if not isinstance(unique, str) or not unique or index is None:
+        return None
+    try:
+        index_value = int(index)
+    except (TypeError, ValueError):
+        return None
+    name = _pick_localized_name(lower.get("localizednames") or lower.get("localizedname"))
+    return index_value, unique, name if isinstance(name, str) and name else None
+
+
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+def _build_indexed_items_index(path: Path, *, logger: logging.Logger) -> IndexedItemsIndex | None:
+    """Scan a top-level JSON record array once and remember where each record lives.
+
+    Returns ``None`` for other layouts so the caller can fall back to a full load.
+    """
+    try:
+        raw = path.read_bytes()
+        text = raw.decode("utf-8-sig")
+    except Exception:
+        logger.exception("Failed to read indexed items: %s", path)
+        return None
+    prefix_bytes = len(raw) - len(text.encode("utf-8"))
+    del raw
+    decoder = json.JSONDecoder()
+    spans: list[tuple[int, int, int]] = []
+    pos = _JSON_WS_RE.match(text, 0).end()
+    if not text.startswith("[", pos):
+        return None
+    pos = _JSON_WS_RE.match(text, pos + 1).end()
+    byte_pos = prefix_bytes + len(text[:pos].encode("utf-8"))
+    try:
+        while pos < len(text) and text[pos] != "]":
+            record, end = decoder.raw_decode(text, pos)
+            byte_len = len(text[pos:end].encode("utf-8"))
+            parsed = _parse_indexed_record(record)
+            if parsed is not None:
+                spans.append((parsed[0], byte_pos, byte_len))
+            next_pos = _JSON_WS_RE.match(text, end).end()
+            if text.startswith(",", next_pos):
+                next_pos = _JSON_WS_RE.match(text, next_pos + 1).end()
+            byte_pos += byte_len + len(text[end:next_pos].encode("utf-8"))
+            pos = next_pos
+    except ValueError:
+        logger.warning("Indexed items file is not a plain record array, loading eagerly: %s", path)
+        return None
+    if not spans:
+        logger.warning("Indexed items file loaded but produced no entries: %s", path)
+    spans.sort()
+    return IndexedItemsIndex(
+        path,
+        array("q", (span[0] for span in spans)),
+        array("q", (span[1] for span in spans)),
+        array("q", (span[2] for span in spans)),
+    )
+
+
 def _load_items(path: Path, *, logger: logging.Logger) -> dict[str, str]:
     data = _load_json(path, logger=logger)
     mapping: dict[str, str] = {}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 from albion_dps.models import PhotonMessage
 from albion_dps.protocol.protocol16 import Protocol16Error, decode_event_data
@@ -41,6 +42,9 @@ class NameRegistry:
     _strong_id_names: dict[int, str] = field(default_factory=dict)
     _item_names: dict[int, set[str]] = field(default_factory=dict)
     _entity_items: dict[int, list[int]] = field(default_factory=dict)
+    _equipment_versions: dict[int, int] = field(default_factory=dict)
+    _names_version: int = 0
+    equipment_listener: Callable[[int, int, list[int]], None] | None = None
 
     def observe(self, message: PhotonMessage) -> None:
         if message.event_code is None:
@@ -64,6 +68,10 @@ class NameRegistry:
                 merged[entity_id] = name
         return merged
 
+    def names_version(self) -> int:
+        """Counter bumped whenever `snapshot()` may return something different."""
+        return self._names_version
+
     def lookup(self, entity_id: int) -> str | None:
         name = self._names.get(entity_id)
         if name is not None:
@@ -91,6 +99,9 @@ class NameRegistry:
             return []
         return list(items)
 
+    def equipment_version(self, entity_id: int) -> int:
+        return self._equipment_versions.get(entity_id, 0)
+
     def _apply_event(self, parameters: dict[int, object]) -> None:
         self._apply_party_roster(parameters)
         self._apply_guid_link(parameters)
@@ -109,7 +120,7 @@ class NameRegistry:
             if isinstance(entity_id, int) and isinstance(items, list):
                 filtered = [item for item in items if isinstance(item, int) and item > 0]
                 if filtered:
-                    self._entity_items[entity_id] = filtered
+                    self._set_entity_items(entity_id, filtered)
         if subtype == NAME_SUBTYPE_CHARACTER_INFO:
             name = parameters.get(NAME_SUBTYPE_CHARACTER_NAME_KEY)
             if isinstance(name, str) and name:
@@ -130,7 +141,7 @@ class NameRegistry:
             if isinstance(entity_id, int) and isinstance(items, list):
                 filtered = [item for item in items if isinstance(item, int) and item > 0]
                 if filtered:
-                    self._entity_items[entity_id] = filtered
+                    self._set_entity_items(entity_id, filtered)
                     self._infer_name_from_items(entity_id)
         if subtype == NAME_SUBTYPE_ID_NAME:
             self._store(parameters.get(NAME_ID_KEY), parameters.get(NAME_SUBTYPE_NAME_KEY), weak=True)
@@ -144,6 +155,15 @@ class NameRegistry:
 
         self._store(raw_id, raw_name)
 
+    def _set_entity_items(self, entity_id: int, items: list[int]) -> None:
+        if self._entity_items.get(entity_id) == items:
+            return
+        self._entity_items[entity_id] = items
+        version = self._equipment_versions.get(entity_id, 0) + 1
+        self._equipment_versions[entity_id] = version
+        if self.equipment_listener is not None:
+            self.equipment_listener(entity_id, version, list(items))
+
     def _store(self, entity_id: object, name: object, *, weak: bool = False) -> None:
         if isinstance(entity_id, int) and isinstance(name, str) and name:
             if weak:
@@ -165,14 +185,30 @@ class NameRegistry:
                             continue
                         if self._names.get(weak_id) == name:
                             self._names.pop(weak_id, None)
+                            self._names_version += 1
                     weak_ids.intersection_update(strong_ids)
-            self._names[entity_id] = name
+            if self._names.get(entity_id) != name:
+                self._names[entity_id] = name
+                self._names_version += 1
             return
         if isinstance(entity_id, int) and _is_guid(name):
-            self._id_guids[entity_id] = bytes(name)
+            self._link_guid(entity_id, name)
             return
         if _is_guid(entity_id) and isinstance(name, str) and name:
-            self._guid_names[bytes(entity_id)] = name
+            self._name_guid(entity_id, name)
+
+    def _link_guid(self, entity_id: int, guid: object) -> None:
+        # Only real changes move the version, so snapshot deltas skip the name table.
+        value = bytes(guid)
+        if self._id_guids.get(entity_id) != value:
+            self._id_guids[entity_id] = value
+            self._names_version += 1
+
+    def _name_guid(self, guid: object, name: str) -> None:
+        key = bytes(guid)
+        if self._guid_names.get(key) != name:
+            self._guid_names[key] = name
+            self._names_version += 1
 
     def _apply_guid_link(self, parameters: dict[int, object]) -> None:
         guid = parameters.get(3)
@@ -182,7 +218,7 @@ class NameRegistry:
         if not isinstance(entity_id, int) or entity_id <= 0:
             entity_id = None
         if guid is not None and entity_id is not None:
-            self._id_guids[entity_id] = bytes(guid)
+            self._link_guid(entity_id, guid)
             return
 
         subtype = parameters.get(252)
@@ -199,7 +235,7 @@ class NameRegistry:
                 continue
             if not _is_guid(candidate_guid):
                 continue
-            self._id_guids[candidate_id] = bytes(candidate_guid)
+            self._link_guid(candidate_id, candidate_guid)
             return
 
     def _apply_party_roster(self, parameters: dict[int, object]) -> None:
@@ -208,7 +244,7 @@ class NameRegistry:
             guid = parameters.get(1)
             name = parameters.get(2)
             if _is_guid(guid) and isinstance(name, str) and name:
-                self._guid_names[bytes(guid)] = name
+                self._name_guid(guid, name)
             return
 
         if subtype not in (227, 229, NAME_PARTY_JOINED_SUBTYPE):
@@ -233,7 +269,7 @@ class NameRegistry:
             return
         for guid, name in zip(guids, names):
             if _is_guid(guid) and isinstance(name, str) and name:
-                self._guid_names[bytes(guid)] = name
+                self._name_guid(guid, name)
 
     def _infer_name_from_items(self, entity_id: int) -> None:
         items = self._entity_items.get(entity_id)
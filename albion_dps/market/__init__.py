@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from albion_dps.market.aod_client import (
+    AODataBatchStats,
     AODataClient,
+    AODataConnectionPool,
+    AODataHTTPError,
+    AODataRateLimiter,
     AODataRequestStats,
     MarketChartPoint,
     MarketPriceRecord,
@@ -10,16 +14,21 @@ from albion_dps.market.cache import CacheEntry, SQLiteCache
 from albion_dps.market.catalog import CatalogIssue, DEFAULT_RECIPES_PATH, RecipeCatalog
 from albion_dps.market.engine import (
     BatchCraftRequest,
+    CompiledCatalog,
     OutputValuation,
+    RecipeProfitRow,
     build_craft_run,
     build_craft_runs_batch,
     build_input_lines,
     build_output_lines,
+    compile_catalog,
     compute_output_valuations,
     compute_batch_profit,
     compute_profit_breakdown,
     compute_run_profit,
     effective_return_fraction,
+    scan_catalog_profits,
+    sum_profit_breakdowns,
 )
 from albion_dps.market.migration import convert_legacy_recipe_rows, migrate_recipe_file
 from albion_dps.market.models import (
@@ -43,6 +52,8 @@ from albion_dps.market.planner import (
     build_selling_entries,
     build_shopping_entries,
 )
+from albion_dps.market.prefetch import PrefetchProgress, prefetch_prices
+from albion_dps.market.price_index import PriceIndex
 from albion_dps.market.recipes_from_items import (
     RecipesFromItemsReport,
     extract_recipes_from_items_json,
@@ -53,7 +64,11 @@ from albion_dps.market.service import MarketDataService, MarketFetchMeta
 from albion_dps.market.setup import sanitized_setup, validate_setup
 
 __all__ = [
+    "AODataBatchStats",
     "AODataClient",
+    "AODataConnectionPool",
+    "AODataHTTPError",
+    "AODataRateLimiter",
     "AODataRequestStats",
     "aggregate_selling",
     "aggregate_shopping",
@@ -66,6 +81,8 @@ __all__ = [
     "build_shopping_entries",
     "CacheEntry",
     "CatalogIssue",
+    "compile_catalog",
+    "CompiledCatalog",
     "compute_profit_breakdown",
     "compute_batch_profit",
     "compute_output_valuations",
@@ -88,16 +105,22 @@ __all__ = [
     "migrate_recipe_file",
     "OutputLine",
     "OutputValuation",
+    "prefetch_prices",
+    "PrefetchProgress",
+    "PriceIndex",
     "PriceType",
     "ProfitBreakdown",
     "Recipe",
     "RecipeCatalog",
     "RecipeComponent",
     "RecipeOutput",
+    "RecipeProfitRow",
     "RecipesFromItemsReport",
     "SellingEntry",
     "ShoppingEntry",
     "sanitized_setup",
+    "scan_catalog_profits",
     "SQLiteCache",
+    "sum_profit_breakdowns",
     "validate_setup",
 ]
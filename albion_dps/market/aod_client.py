@@ -1,13 +1,18 @@
 ﻿from __future__ import annotations
 
+import base64
+import http.client
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date
-from typing import Callable
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping
+from urllib.parse import SplitResult, unquote, urlencode, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass, proxy_bypass_environment
 
 from albion_dps.market.models import MarketRegion
 
@@ -18,6 +23,12 @@ REGION_HOSTS: dict[MarketRegion, str] = {
     MarketRegion.EAST: "east.albion-online-data.com",
 }
 
+# AO Data's published per-IP limits: (requests, window seconds).
+AODATA_RATE_LIMITS: tuple[tuple[int, float], ...] = ((180, 60.0), (300, 300.0))
+
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
 
 @dataclass(frozen=True)
 class MarketPriceRecord:
@@ -37,6 +48,17 @@ class MarketChartPoint:
     avg_price: int
 
 
+@dataclass(frozen=True)
+class AODataBatchStats:
+    url: str
+    item_count: int
+    attempts: int
+    elapsed_ms: float
+    success: bool
+    error: str
+    rate_limit_wait_ms: float = 0.0
+
+
 @dataclass(frozen=True)
 class AODataRequestStats:
     endpoint: str
@@ -45,6 +67,197 @@ class AODataRequestStats:
     elapsed_ms: float
     success: bool
     error: str
+    batches: tuple[AODataBatchStats, ...] = ()
+
+
+class AODataHTTPError(RuntimeError):
+    """Non-2xx AO Data response; keeps the ``HTTP Error <code>: <reason>`` wording."""
+
+    def __init__(self, status: int, reason: str, *, retry_after: float | None = None) -> None:
+        super().__init__(f"HTTP Error {status}: {reason}")
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AODataRateLimiter:
+    """Per-host token buckets for AO Data's published request limits."""
+
+    def __init__(
+        self,
+        limits: tuple[tuple[int, float], ...] = AODATA_RATE_LIMITS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._limits = tuple((max(1, int(count)), max(1e-6, float(period))) for count, period in limits)
+        self._clock = clock
+        self._sleep = sleeper
+        self._lock = threading.Lock()
+        # host -> ([tokens per window], last refill time, blocked until)
+        self._hosts: dict[str, tuple[list[float], float, float]] = {}
+
+    def acquire(self, host: str, *, background: bool = False) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                tokens, blocked_until = self._refill(host, now)
+                wait = max(0.0, blocked_until - now)
+                for idx, (count, period) in enumerate(self._limits):
+                    wait = max(wait, (1.0 - tokens[idx]) * period / count)
+                # Background callers never reserve ahead, so foreground requests arriving meanwhile go first.
+                reserved = not background or wait <= 0
+                if reserved:
+                    # Foreground tokens may go negative: later callers then wait behind this reservation.
+                    tokens = [value - 1.0 for value in tokens]
+                self._hosts[host] = (tokens, now, blocked_until)
+            if wait > 0:
+                self._sleep(wait)
+                waited += wait
+            if reserved:
+                return waited
+
+    def block(self, host: str, seconds: float) -> None:
+        with self._lock:
+            now = self._clock()
+            tokens, blocked_until = self._refill(host, now)
+            self._hosts[host] = (tokens, now, max(blocked_until, now + max(0.0, seconds)))
+
+    def _refill(self, host: str, now: float) -> tuple[list[float], float]:
+        tokens, updated, blocked_until = self._hosts.get(
+            host, ([float(count) for count, _ in self._limits], now, now)
+        )
+        refilled = [
+            min(float(count), value + (now - updated) * count / period)
+            for value, (count, period) in zip(tokens, self._limits)
+        ]
+        return refilled, blocked_until
+
+
+class AODataConnectionPool:
+    """Keep-alive HTTP(S) connections to AO Data that honour system proxies and follow redirects."""
+
+    def __init__(
+        self,
+        *,
+        max_idle_per_host: int = 4,
+        proxies: Mapping[str, str] | None = None,
+    ) -> None:
+        self._max_idle_per_host = max(1, int(max_idle_per_host))
+        self._proxies = dict(getproxies() if proxies is None else proxies)
+        # System bypass rules only apply to the system proxies.
+        self._use_system_bypass = proxies is None
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+
+    @property
+    def connections_opened(self) -> int:
+        return self._connections_opened
+
+    def fetch_json(self, url: str, timeout_seconds: float, user_agent: str) -> object:
+        headers = {"User-Agent": user_agent, "Accept": "application/json", "Connection": "keep-alive"}
+        for _ in range(_MAX_REDIRECTS + 1):
+            response = self._request(url, timeout_seconds, headers)
+            if response.status in _REDIRECT_STATUSES and response.location:
+                url = urljoin(url, response.location)
+                continue
+            if response.status >= 300:
+                raise AODataHTTPError(response.status, response.reason, retry_after=response.retry_after)
+            return json.loads(response.body.decode("utf-8"))
+        raise AODataHTTPError(
+            response.status,
+            f"{response.reason} (more than {_MAX_REDIRECTS} redirects, last to {url})",
+        )
+
+    def _request(self, url: str, timeout_seconds: float, headers: dict[str, str]) -> _Response:
+        parts = urlsplit(url)
+        proxy = self._proxy_for(parts)
+        if proxy is not None and parts.scheme == "http":
+            # Plain HTTP proxies take the absolute URL; HTTPS is tunnelled.
+            target = url
+            headers = {**headers, **_proxy_auth_headers(proxy)}
+        else:
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+        pool_key = (parts.scheme, parts.netloc)
+        conn, reused = self._acquire(pool_key, timeout_seconds)
+        try:
+            try:
+                response = _send_request(conn, target, headers)
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                conn.close()
+                if not reused:
+                    raise
+                conn, _ = self._acquire(pool_key, timeout_seconds, fresh=True)
+                response = _send_request(conn, target, headers)
+        except Exception:
+            conn.close()
+            raise
+        if response.keep_alive:
+            self._release(pool_key, conn)
+        else:
+            conn.close()
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _acquire(
+        self,
+        pool_key: tuple[str, str],
+        timeout_seconds: float,
+        *,
+        fresh: bool = False,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(pool_key)
+                if idle:
+                    conn = idle.pop()
+                    # http.client applies `timeout` only when connecting; update the open socket.
+                    conn.timeout = timeout_seconds
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout_seconds)
+                    return conn, True
+        scheme, netloc = pool_key
+        connection_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        parts = urlsplit(f"{scheme}://{netloc}")
+        proxy = self._proxy_for(parts)
+        if proxy is None:
+            conn = connection_cls(netloc, timeout=timeout_seconds)
+        elif scheme == "https":
+            conn = connection_cls(proxy.hostname or "", proxy.port, timeout=timeout_seconds)
+            conn.set_tunnel(parts.hostname or "", parts.port, headers=_proxy_auth_headers(proxy))
+        else:
+            conn = http.client.HTTPConnection(proxy.hostname or "", proxy.port, timeout=timeout_seconds)
+        with self._lock:
+            self._connections_opened += 1
+        return conn, False
+
+    def _proxy_for(self, parts: SplitResult) -> SplitResult | None:
+        proxy = self._proxies.get(parts.scheme)
+        host = parts.hostname or ""
+        if not proxy or not host:
+            return None
+        if self._use_system_bypass:
+            if proxy_bypass(host):
+                return None
+        elif proxy_bypass_environment(host, self._proxies):
+            return None
+        return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+    def _release(self, pool_key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(pool_key, [])
+            if len(idle) < self._max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
 
 
 class AODataClient:
@@ -59,18 +272,37 @@ class AODataClient:
         retry_backoff_factor: float = 2.0,
         retry_backoff_max_seconds: float = 2.0,
         max_prices_url_length: int = 1800,
+        max_concurrency: int = 4,
+        base_urls: dict[MarketRegion, str] | None = None,
+        rate_limiter: AODataRateLimiter | None = None,
+        max_rate_limit_retries: int = 3,
+        rate_limit_default_wait_seconds: float = 5.0,
         sleeper: Callable[[float], None] | None = None,
         logger: logging.Logger | None = None,
     ) -> None:
         self._timeout_seconds = timeout_seconds
         self._user_agent = user_agent
-        self._fetch_json = fetch_json or _default_fetch_json
+        self._max_concurrency = max(1, int(max_concurrency))
+        # Global limit on in-flight requests, shared by every fetch on this client.
+        self._request_slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._pool: AODataConnectionPool | None = None
+        if fetch_json is None:
+            self._pool = AODataConnectionPool(max_idle_per_host=self._max_concurrency)
+            fetch_json = self._pool.fetch_json
+        self._fetch_json = fetch_json
+        self._base_urls = dict(base_urls or {})
+        # Per-host prices URL limits learned from 414 responses (lower than the configured one).
+        self._learned_url_limits: dict[str, int] = {}
+        self._learned_url_limits_lock = threading.Lock()
         self._max_retries = max(0, int(max_retries))
         self._retry_backoff_initial_seconds = max(0.0, float(retry_backoff_initial_seconds))
         self._retry_backoff_factor = max(1.0, float(retry_backoff_factor))
         self._retry_backoff_max_seconds = max(0.0, float(retry_backoff_max_seconds))
         self._max_prices_url_length = max(256, int(max_prices_url_length))
         self._sleep = sleeper or time.sleep
+        self._rate_limiter = rate_limiter or AODataRateLimiter(sleeper=self._sleep)
+        self._max_rate_limit_retries = max(0, int(max_rate_limit_retries))
+        self._rate_limit_default_wait_seconds = max(0.0, float(rate_limit_default_wait_seconds))
         self._log = logger or logging.getLogger(__name__)
         self._last_request_stats = AODataRequestStats(
             endpoint="",
@@ -85,6 +317,14 @@ class AODataClient:
     def last_request_stats(self) -> AODataRequestStats:
         return self._last_request_stats
 
+    @property
+    def connection_pool(self) -> AODataConnectionPool | None:
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+
     def fetch_prices(
         self,
         *,
@@ -92,6 +332,7 @@ class AODataClient:
         item_ids: list[str],
         locations: list[str],
         qualities: list[int] | None = None,
+        background: bool = False,
     ) -> list[MarketPriceRecord]:
         if not item_ids:
             return []
@@ -102,10 +343,40 @@ class AODataClient:
             "locations": ",".join(locations),
             "qualities": ",".join(str(x) for x in (qualities or [1])),
         }
-        out: list[MarketPriceRecord] = []
-        for item_batch in self._split_price_batches(base=base, item_ids=item_ids, params=params):
-            out.extend(self._fetch_prices_batch(base=base, item_ids=item_batch, params=params))
-        return out
+        batches = self._split_price_batches(base=base, item_ids=item_ids, params=params)
+        started = time.perf_counter()
+        batch_stats: list[list[AODataBatchStats]] = [[] for _ in batches]
+
+        def fetch_batch(idx: int) -> list[MarketPriceRecord]:
+            return self._fetch_prices_batch(
+                base=base,
+                item_ids=batches[idx],
+                params=params,
+                stats_out=batch_stats[idx],
+                background=background,
+            )
+
+        error: Exception | None = None
+        try:
+            if len(batches) <= 1 or self._max_concurrency <= 1:
+                results = [fetch_batch(idx) for idx in range(len(batches))]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self._max_concurrency, len(batches)),
+                    thread_name_prefix="acd-aod-fetch",
+                ) as executor:
+                    # map() yields in submission order, so rows merge deterministically.
+                    results = list(executor.map(fetch_batch, range(len(batches))))
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._last_request_stats = _merge_batch_stats(
+                [stats for per_batch in batch_stats for stats in per_batch],
+                elapsed_ms=(time.perf_counter() - started) * 1000.0,
+                error=error,
+            )
+        return [row for rows in results for row in rows]
 
     def fetch_charts(
         self,
@@ -133,20 +404,49 @@ class AODataClient:
         return _normalize_charts(data)
 
     def _base_url(self, region: MarketRegion) -> str:
+        override = self._base_urls.get(region)
+        if override:
+            return override.rstrip("/")
         host = REGION_HOSTS[region]
         return f"https://{host}"
 
-    def _fetch_with_retry(self, *, url: str, endpoint: str) -> object:
+    def _fetch_with_retry(
+        self,
+        *,
+        url: str,
+        endpoint: str,
+        item_count: int = 0,
+        stats_out: list[AODataBatchStats] | None = None,
+        background: bool = False,
+    ) -> object:
         max_attempts = self._max_retries + 1
         started = time.perf_counter()
         attempt = 0
         last_error: Exception | None = None
         backoff_seconds = self._retry_backoff_initial_seconds
+        host = urlsplit(url).netloc
+        rate_limited = 0
+        waited_seconds = 0.0
 
         while attempt < max_attempts:
             attempt += 1
             try:
-                payload = self._fetch_json(url, self._timeout_seconds, self._user_agent)
+                waited_seconds += self._rate_limiter.acquire(host, background=background)
+                with self._request_slots:
+                    payload = self._fetch_json(url, self._timeout_seconds, self._user_agent)
+                if stats_out is not None:
+                    stats_out.append(
+                        AODataBatchStats(
+                            url=url,
+                            item_count=item_count,
+                            attempts=attempt,
+                            elapsed_ms=(time.perf_counter() - started) * 1000.0,
+                            success=True,
+                            error="",
+                            rate_limit_wait_ms=waited_seconds * 1000.0,
+                        )
+                    )
+                    return payload
                 self._last_request_stats = AODataRequestStats(
                     endpoint=endpoint,
                     url=url,
@@ -158,6 +458,17 @@ class AODataClient:
                 return payload
             except Exception as exc:
                 last_error = exc
+                if _is_rate_limited_error(exc) and rate_limited < self._max_rate_limit_retries:
+                    # 429: pause the host and queue the request again without using an attempt.
+                    rate_limited += 1
+                    attempt -= 1
+                    retry_after = getattr(exc, "retry_after", None)
+                    self._rate_limiter.block(
+                        host,
+                        retry_after if retry_after is not None else self._rate_limit_default_wait_seconds,
+                    )
+                    self._log.debug("AO Data rate limited (%s), retry_after=%s, url=%s", endpoint, retry_after, url)
+                    continue
                 if attempt >= max_attempts:
                     break
                 if backoff_seconds > 0:
@@ -176,6 +487,21 @@ class AODataClient:
                 )
 
         error_message = str(last_error) if last_error is not None else "unknown fetch error"
+        if stats_out is not None:
+            stats_out.append(
+                AODataBatchStats(
+                    url=url,
+                    item_count=item_count,
+                    attempts=max_attempts,
+                    elapsed_ms=(time.perf_counter() - started) * 1000.0,
+                    success=False,
+                    error=error_message,
+                    rate_limit_wait_ms=waited_seconds * 1000.0,
+                )
+            )
+            raise RuntimeError(
+                f"AO Data {endpoint} request failed after {max_attempts} attempts: {error_message}"
+            )
         self._last_request_stats = AODataRequestStats(
             endpoint=endpoint,
             url=url,
@@ -193,36 +519,82 @@ class AODataClient:
         item_ids: list[str],
         params: dict[str, str],
     ) -> list[list[str]]:
+        # Single pass over running lengths: a batch URL is the empty-ids URL plus
+        # the ids joined by commas (ids are not percent-encoded).
+        limit = self._prices_url_limit(base)
+        fixed_length = len(self._build_prices_url(base=base, item_ids=[], params=params))
         batches: list[list[str]] = []
         current: list[str] = []
+        length = fixed_length
         for item_id in item_ids:
-            candidate = current + [item_id]
-            if len(current) > 0 and len(self._build_prices_url(base=base, item_ids=candidate, params=params)) > self._max_prices_url_length:
+            added = len(item_id) + (1 if current else 0)
+            if current and length + added > limit:
                 batches.append(current)
                 current = [item_id]
+                length = fixed_length + len(item_id)
             else:
-                current = candidate
+                current.append(item_id)
+                length += added
         if current:
             batches.append(current)
         return batches
 
+    def _prices_url_limit(self, base: str) -> int:
+        with self._learned_url_limits_lock:
+            learned = self._learned_url_limits.get(base)
+        if learned is None:
+            return self._max_prices_url_length
+        return min(self._max_prices_url_length, learned)
+
+    def _learn_prices_url_limit(self, base: str, limit: int) -> None:
+        with self._learned_url_limits_lock:
+            current = self._learned_url_limits.get(base)
+            if current is None or limit < current:
+                self._learned_url_limits[base] = limit
+                self._log.debug("AO Data prices URL limit for %s lowered to %d", base, limit)
+
     def _fetch_prices_batch(
         self,
         *,
         base: str,
         item_ids: list[str],
         params: dict[str, str],
+        stats_out: list[AODataBatchStats],
+        background: bool = False,
     ) -> list[MarketPriceRecord]:
         url = self._build_prices_url(base=base, item_ids=item_ids, params=params)
         try:
-            data = self._fetch_with_retry(url=url, endpoint="prices")
+            data = self._fetch_with_retry(
+                url=url,
+                endpoint="prices",
+                item_count=len(item_ids),
+                stats_out=stats_out,
+                background=background,
+            )
             return _normalize_prices(data)
         except RuntimeError as exc:
             if len(item_ids) <= 1 or not _is_uri_too_large_error(exc):
                 raise
+            # Bisect, then remember the longest URL the host accepted (or at
+            # least one byte under the rejected one) for later splits.
+            first_sub_batch = len(stats_out)
             midpoint = max(1, len(item_ids) // 2)
-            left = self._fetch_prices_batch(base=base, item_ids=item_ids[:midpoint], params=params)
-            right = self._fetch_prices_batch(base=base, item_ids=item_ids[midpoint:], params=params)
+            left = self._fetch_prices_batch(
+                base=base,
+                item_ids=item_ids[:midpoint],
+                params=params,
+                stats_out=stats_out,
+                background=background,
+            )
+            right = self._fetch_prices_batch(
+                base=base,
+                item_ids=item_ids[midpoint:],
+                params=params,
+                stats_out=stats_out,
+                background=background,
+            )
+            accepted = [len(stats.url) for stats in stats_out[first_sub_batch:] if stats.success]
+            self._learn_prices_url_limit(base, max(accepted) if accepted else len(url) - 1)
             return left + right
 
     @staticmethod
@@ -284,11 +656,79 @@ def _as_int(value: object, *, default: int) -> int:
         return default
 
 
-def _default_fetch_json(url: str, timeout_seconds: float, user_agent: str) -> object:
-    request = Request(url, headers={"User-Agent": user_agent})
-    with urlopen(request, timeout=timeout_seconds) as response:
-        payload = response.read().decode("utf-8")
-    return json.loads(payload)
+@dataclass(frozen=True)
+class _Response:
+    status: int
+    reason: str
+    body: bytes
+    keep_alive: bool
+    retry_after: float | None
+    location: str | None
+
+
+def _send_request(
+    conn: http.client.HTTPConnection,
+    target: str,
+    headers: dict[str, str],
+) -> _Response:
+    conn.request("GET", target, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    return _Response(
+        status=response.status,
+        reason=response.reason,
+        body=body,
+        keep_alive=not response.will_close,
+        retry_after=_parse_retry_after(response.getheader("Retry-After")),
+        location=response.getheader("Location"),
+    )
+
+
+def _proxy_auth_headers(proxy: SplitResult) -> dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _is_rate_limited_error(exc: Exception) -> bool:
+    return getattr(exc, "status", None) == 429
+
+
+def _merge_batch_stats(
+    batches: list[AODataBatchStats],
+    *,
+    elapsed_ms: float,
+    error: Exception | None,
+) -> AODataRequestStats:
+    # Failed entries followed by a successful bisection still count as success.
+    return AODataRequestStats(
+        endpoint="prices",
+        url=batches[0].url if batches else "",
+        attempts=sum(stats.attempts for stats in batches),
+        elapsed_ms=elapsed_ms,
+        success=error is None,
+        error=str(error) if error is not None else "",
+        batches=tuple(batches),
+    )
 
 
 def _is_uri_too_large_error(exc: Exception) -> bool:
@@ -2,9 +2,41 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 import time
+import zlib
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Mapping
+
+# SQLite's default host-parameter limit is 999; stay well below it for IN (...) lookups.
+_SELECT_CHUNK_SIZE = 500
+
+# Compressed payloads are one version byte followed by the zlib-deflated JSON.
+PAYLOAD_ZLIB_JSON_V1 = 1
+_ZLIB_LEVEL = 6
+# Short payloads (single price records) barely shrink and decode slower when compressed.
+DEFAULT_COMPRESS_MIN_BYTES = 512
+
+_UPSERT_SQL = """
+    INSERT INTO market_cache(cache_key, payload_json, payload_blob, expires_at, updated_at, accessed_at)
+    VALUES(?, ?, ?, ?, ?, ?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+      payload_json=excluded.payload_json,
+      payload_blob=excluded.payload_blob,
+      expires_at=excluded.expires_at,
+      updated_at=excluded.updated_at,
+      accessed_at=excluded.accessed_at
+"""
+
+# Stored size of a row in bytes; TEXT LENGTH() would count characters.
+_ROW_BYTES_SQL = (
+    "LENGTH(CAST(cache_key AS BLOB)) + LENGTH(CAST(payload_json AS BLOB))"
+    " + COALESCE(LENGTH(payload_blob), 0)"
+)
+
+# (cache_key, payload_json, payload_blob, expires_at, updated_at, accessed_at)
+_Row = tuple[str, str, bytes | None, float, float, float]
 
 
 @dataclass(frozen=True)
@@ -20,15 +52,52 @@ class CacheEntry:
 
 
 class SQLiteCache:
-    def __init__(self, path: Path) -> None:
+    """SQLite-backed key/value cache, usable from any thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        background_writes: bool = False,
+        commit_interval: float = 0.25,
+        compress: bool = False,
+        compress_min_bytes: int = DEFAULT_COMPRESS_MIN_BYTES,
+        max_bytes: int | None = None,
+        maintenance_interval: float = 60.0,
+    ) -> None:
         self._path = path
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(path))
+        self._lock = threading.RLock()
+        # Statements from worker threads are serialized through self._lock.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._compress = compress
+        self._compress_min_bytes = max(0, int(compress_min_bytes))
+        self._max_bytes = max_bytes if max_bytes is None else max(0, int(max_bytes))
+        self._needs_vacuum = False
         self._init_schema()
+        self._commit_interval = max(0.0, commit_interval)
+        self._maintenance_interval = max(0.0, maintenance_interval)
+        self._last_maintenance = time.monotonic()
+        # Read times are batched here and written during maintenance.
+        self._accessed: dict[str, float] = {}
+        # Latest-wins queue of rows for the writer thread; reads see it first.
+        self._pending: dict[str, _Row] = {}
+        self._pending_cond = threading.Condition()
+        self._closing = False
+        self._writer: threading.Thread | None = None
+        if background_writes:
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="acd-market-cache-writer",
+                daemon=True,
+            )
+            self._writer.start()
 
     def _init_schema(self) -> None:
+        # Must precede table creation to take effect on a new database file.
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS market_cache (
@@ -39,63 +108,213 @@ class SQLiteCache:
             )
             """
         )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(market_cache)")}
+        if "payload_blob" not in columns:
+            self._conn.execute("ALTER TABLE market_cache ADD COLUMN payload_blob BLOB")
+        if "accessed_at" not in columns:
+            self._conn.execute("ALTER TABLE market_cache ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE market_cache SET accessed_at=updated_at")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS market_cache_accessed_at ON market_cache(accessed_at)"
+        )
         self._conn.commit()
+        if self._max_bytes is not None:
+            auto_vacuum = self._conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            # Databases created before auto_vacuum was enabled need one full
+            # VACUUM; it can take seconds, so `maintain` runs it off startup.
+            self._needs_vacuum = int(auto_vacuum) != 2
 
     def set(self, key: str, payload: object, ttl_seconds: float) -> None:
+        self.set_many({key: payload}, ttl_seconds=ttl_seconds)
+
+    def set_many(self, entries: Mapping[str, object], ttl_seconds: float) -> None:
+        if not entries:
+            return
         now = time.time()
         expires_at = now + max(0.0, ttl_seconds)
-        payload_json = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        self._conn.execute(
-            """
-            INSERT INTO market_cache(cache_key, payload_json, expires_at, updated_at)
-            VALUES(?, ?, ?, ?)
-            ON CONFLICT(cache_key) DO UPDATE SET
-              payload_json=excluded.payload_json,
-              expires_at=excluded.expires_at,
-              updated_at=excluded.updated_at
-            """,
-            (key, payload_json, expires_at, now),
-        )
-        self._conn.commit()
+        rows = [
+            (key, *self._encode(payload), expires_at, now, now)
+            for key, payload in entries.items()
+        ]
+        if self._writer is None:
+            self._write_rows(rows)
+            self._maybe_maintain()
+            return
+        with self._pending_cond:
+            for row in rows:
+                self._pending[row[0]] = row
+            self._pending_cond.notify()
 
     def get_entry(self, key: str, *, allow_expired: bool = False) -> CacheEntry | None:
-        row = self._conn.execute(
-            """
-            SELECT cache_key, payload_json, expires_at, updated_at
-            FROM market_cache
-            WHERE cache_key=?
-            """,
-            (key,),
-        ).fetchone()
-        if row is None:
-            return None
-        payload = json.loads(row[1])
-        entry = CacheEntry(
-            key=row[0],
-            payload=payload,
-            expires_at=float(row[2]),
-            updated_at=float(row[3]),
-        )
-        if entry.expired and not allow_expired:
-            return None
-        return entry
+        return self.get_many([key], allow_expired=allow_expired).get(key)
+
+    def get_many(self, keys: Iterable[str], *, allow_expired: bool = False) -> dict[str, CacheEntry]:
+        wanted = list(dict.fromkeys(keys))
+        rows: dict[str, _Row] = {}
+        with self._pending_cond:
+            for key in wanted:
+                row = self._pending.get(key)
+                if row is not None:
+                    rows[key] = row
+        remaining = [key for key in wanted if key not in rows]
+        with self._lock:
+            for start in range(0, len(remaining), _SELECT_CHUNK_SIZE):
+                chunk = remaining[start : start + _SELECT_CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                for row in self._conn.execute(
+                    f"""
+                    SELECT cache_key, payload_json, payload_blob, expires_at, updated_at
+                    FROM market_cache
+                    WHERE cache_key IN ({placeholders})
+                    """,
+                    chunk,
+                ):
+                    rows[row[0]] = row
+        entries: dict[str, CacheEntry] = {}
+        for key in wanted:
+            row = rows.get(key)
+            if row is None:
+                continue
+            try:
+                payload = _decode(row[1], row[2])
+            except (ValueError, zlib.error):
+                # Unknown encoding version or corrupt blob: treat as a miss.
+                continue
+            entry = CacheEntry(
+                key=row[0],
+                payload=payload,
+                expires_at=float(row[3]),
+                updated_at=float(row[4]),
+            )
+            if entry.expired and not allow_expired:
+                continue
+            entries[key] = entry
+        if entries and self._max_bytes is not None:
+            now = time.time()
+            with self._pending_cond:
+                self._accessed.update(dict.fromkeys(entries, now))
+        return entries
 
     def delete(self, key: str) -> int:
-        cur = self._conn.execute("DELETE FROM market_cache WHERE cache_key=?", (key,))
-        self._conn.commit()
+        self.flush()
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM market_cache WHERE cache_key=?", (key,))
+            self._conn.commit()
         return int(cur.rowcount)
 
     def clear_expired(self, *, now: float | None = None) -> int:
+        self.flush()
         timestamp = time.time() if now is None else now
-        cur = self._conn.execute(
-            "DELETE FROM market_cache WHERE expires_at <= ?",
-            (timestamp,),
-        )
-        self._conn.commit()
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM market_cache WHERE expires_at <= ?",
+                (timestamp,),
+            )
+            self._conn.commit()
         return int(cur.rowcount)
 
+    def payload_bytes(self) -> int:
+        """Total stored key and payload bytes, the quantity `max_bytes` caps."""
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT COALESCE(SUM({_ROW_BYTES_SQL}), 0) FROM market_cache"
+            ).fetchone()
+        return int(row[0])
+
+    def maintain(self) -> int:
+        """Persist read times, evict LRU rows over `max_bytes`; returns rows evicted."""
+        self.flush()
+        self._last_maintenance = time.monotonic()
+        with self._pending_cond:
+            accessed = self._accessed
+            self._accessed = {}
+        evicted = 0
+        with self._lock:
+            with self._conn:
+                if accessed:
+                    self._conn.executemany(
+                        "UPDATE market_cache SET accessed_at=? WHERE cache_key=? AND accessed_at<?",
+                        [(ts, key, ts) for key, ts in accessed.items()],
+                    )
+            if self._max_bytes is None:
+                return 0
+            if self._needs_vacuum:
+                # Converts the file to incremental auto-vacuum; later runs only
+                # need `PRAGMA incremental_vacuum` after evicting.
+                self._conn.execute("VACUUM")
+                self._needs_vacuum = False
+            excess = self.payload_bytes() - self._max_bytes
+            if excess <= 0:
+                return 0
+            victims: list[tuple[str]] = []
+            for key, size in self._conn.execute(
+                f"SELECT cache_key, {_ROW_BYTES_SQL} FROM market_cache ORDER BY accessed_at ASC"
+            ):
+                if excess <= 0:
+                    break
+                victims.append((key,))
+                excess -= int(size)
+            with self._conn:
+                self._conn.executemany("DELETE FROM market_cache WHERE cache_key=?", victims)
+            evicted = len(victims)
+            self._conn.execute("PRAGMA incremental_vacuum")
+        return evicted
+
+    def flush(self) -> None:
+        # Hold the connection lock across the hand-off so readers never see a
+        # row that has left the queue but is not committed yet.
+        with self._lock:
+            with self._pending_cond:
+                rows = list(self._pending.values())
+                self._pending.clear()
+            self._write_rows(rows)
+
     def close(self) -> None:
-        self._conn.close()
+        if self._writer is not None:
+            with self._pending_cond:
+                self._closing = True
+                self._pending_cond.notify()
+            self._writer.join()
+            self._writer = None
+        if self._max_bytes is not None:
+            self.maintain()
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def _encode(self, payload: object) -> tuple[str, bytes | None]:
+        payload_json = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        if not self._compress or len(payload_json) < self._compress_min_bytes:
+            return payload_json, None
+        blob = bytes((PAYLOAD_ZLIB_JSON_V1,)) + zlib.compress(payload_json.encode("utf-8"), _ZLIB_LEVEL)
+        return "", blob
+
+    def _maybe_maintain(self) -> None:
+        if self._max_bytes is None:
+            return
+        if time.monotonic() - self._last_maintenance >= self._maintenance_interval:
+            self.maintain()
+
+    def _write_rows(self, rows: list[_Row]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_UPSERT_SQL, rows)
+
+    def _writer_loop(self) -> None:
+        # Commits queued rows in one transaction every commit_interval seconds.
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._closing:
+                    self._pending_cond.wait()
+                if self._closing:
+                    return
+            # Let a burst of writes accumulate, then commit it as one transaction.
+            time.sleep(self._commit_interval)
+            self.flush()
+            self._maybe_maintain()
 
     def __enter__(self) -> "SQLiteCache":
         return self
@@ -103,3 +322,11 @@ class SQLiteCache:
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
 
+
+def _decode(payload_json: str, payload_blob: bytes | None) -> object:
+    if payload_blob is None:
+        return json.loads(payload_json)
+    version = payload_blob[0]
+    if version != PAYLOAD_ZLIB_JSON_V1:
+        raise ValueError(f"unsupported cache payload version: {version}")
+    return json.loads(zlib.decompress(payload_blob[1:]).decode("utf-8"))
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-import re
+import heapq
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Iterable, Mapping
 
 from albion_dps.market.aod_client import MarketPriceRecord
 from albion_dps.market.models import (
     CraftRun,
     CraftSetup,
     InputLine,
+    ItemRef,
     OutputLine,
     PriceType,
     ProfitBreakdown,
     Recipe,
 )
+from albion_dps.market.price_index import PriceIndex
 from albion_dps.market.pricing import choose_unit_price
 
 
@@ -37,6 +43,70 @@ class OutputValuation:
     net_value: float
 
 
+@dataclass(frozen=True)
+class CompiledCatalog:
+    """Recipes flattened into sparse item x recipe columns for `scan_catalog_profits`.
+
+    Components of recipe ``r`` are entries ``component_offsets[r]`` to
+    ``component_offsets[r + 1]`` of the component columns (item index into
+    `item_ids`, quantity per craft, returnable flag); outputs are laid out the
+    same way. ``output_fee_bases`` holds the per-unit station fee base
+    (``item_value * 0.1125``), ``0`` for fee-free tiers and ``-1`` where the
+    item value must be estimated from the sell price.
+    """
+
+    recipes: tuple[Recipe, ...]
+    item_ids: tuple[str, ...]
+    component_offsets: array
+    component_items: array
+    component_quantities: array
+    component_returnable: array
+    output_offsets: array
+    output_items: array
+    output_quantities: array
+    output_fee_bases: array
+    focus_per_craft: array
+
+
+@dataclass(frozen=True)
+class RecipeProfitRow:
+    recipe: Recipe
+    craft_city: str
+    quality: int
+    runs: int
+    input_cost: float
+    return_savings: float
+    output_value: float
+    station_fee: float
+    market_tax: float
+    focus_used: float
+
+    @property
+    def net_profit(self) -> float:
+        return self.output_value - self.input_cost - self.station_fee - self.market_tax
+
+    @property
+    def margin_percent(self) -> float:
+        if self.input_cost <= 0:
+            return 0.0
+        return (self.net_profit / self.input_cost) * 100.0
+
+    @property
+    def silver_per_focus(self) -> float:
+        if self.focus_used <= 0:
+            return 0.0
+        return self.net_profit / self.focus_used
+
+
+SCAN_SORT_KEYS = ("margin", "profit", "silver_per_focus")
+
+# Below this many requests a process pool costs more to start (~100 ms) than it
+# saves; a serial run is ~40 us per request once quotes are indexed.
+PARALLEL_BATCH_MIN_REQUESTS = 2000
+# Shards per worker: enough to even out uneven recipes without paying per-task overhead.
+_SHARDS_PER_WORKER = 4
+
+
 @dataclass(frozen=True)
 class _LocationProductionProfile:
     crafting_base_bonus: float
@@ -51,7 +121,7 @@ def build_craft_run(
     recipe: Recipe,
     quantity: int,
     setup: CraftSetup,
-    price_index: dict[tuple[str, str, int], MarketPriceRecord],
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
     input_cities: dict[str, str] | None = None,
     output_cities: dict[str, str] | None = None,
     input_price_types: dict[str, PriceType] | None = None,
@@ -61,6 +131,7 @@ def build_craft_run(
 ) -> CraftRun:
     if quantity <= 0:
         raise ValueError("quantity must be > 0")
+    price_index = PriceIndex.of(price_index)
     inputs = build_input_lines(
         recipe=recipe,
         quantity=quantity,
@@ -92,8 +163,39 @@ def build_craft_runs_batch(
     *,
     setup: CraftSetup,
     requests: list[BatchCraftRequest],
-    price_index: dict[tuple[str, str, int], MarketPriceRecord],
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
+    max_workers: int | None = None,
+    chunk_size: int | None = None,
 ) -> tuple[CraftRun, ...]:
+    """Build one `CraftRun` per request, in request order.
+
+    With `max_workers` > 1 and at least `PARALLEL_BATCH_MIN_REQUESTS`
+    requests, the batch is split into contiguous shards of `chunk_size`
+    requests (by default about four per worker) and built in a process pool.
+    Each worker receives `setup` and a packed copy of the price index once,
+    through the pool initializer, and only shards travel per task. Results
+    are equal to the serial path.
+    """
+    requests = list(requests)
+    if max_workers is not None and max_workers > 1 and len(requests) >= PARALLEL_BATCH_MIN_REQUESTS:
+        return _build_craft_runs_parallel(
+            setup=setup,
+            requests=requests,
+            price_index=price_index,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
+    return _build_craft_runs_serial(setup=setup, requests=requests, price_index=price_index)
+
+
+def _build_craft_runs_serial(
+    *,
+    setup: CraftSetup,
+    requests: list[BatchCraftRequest],
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
+) -> tuple[CraftRun, ...]:
+    # Index quotes once for the whole batch instead of once per run.
+    price_index = PriceIndex.of(price_index)
     runs: list[CraftRun] = []
     for request in requests:
         runs.append(
@@ -113,17 +215,82 @@ def build_craft_runs_batch(
     return tuple(runs)
 
 
+def _build_craft_runs_parallel(
+    *,
+    setup: CraftSetup,
+    requests: list[BatchCraftRequest],
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
+    max_workers: int,
+    chunk_size: int | None,
+) -> tuple[CraftRun, ...]:
+    step = chunk_size or math.ceil(len(requests) / (max_workers * _SHARDS_PER_WORKER))
+    step = max(1, int(step))
+    shards = [requests[start : start + step] for start in range(0, len(requests), step)]
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(shards)),
+        initializer=_init_batch_worker,
+        initargs=(setup, _pack_price_index(price_index)),
+    ) as executor:
+        runs: list[CraftRun] = []
+        for shard_runs in executor.map(_run_batch_shard, shards):
+            runs.extend(shard_runs)
+    return tuple(runs)
+
+
+_PackedPriceIndex = tuple[tuple[tuple[str, str, int], tuple[str, str, int, int, int, str, str]], ...]
+
+# Per-process state of a batch worker, set once by `_init_batch_worker`.
+_batch_worker_state: tuple[CraftSetup, PriceIndex] | None = None
+
+
+def _pack_price_index(price_index: Mapping[tuple[str, str, int], MarketPriceRecord]) -> _PackedPriceIndex:
+    # Plain tuples pickle smaller and faster than dataclass instances; order is
+    # kept because quote fallback depends on it.
+    return tuple(
+        (
+            key,
+            (
+                record.item_id,
+                record.city,
+                record.quality,
+                record.sell_price_min,
+                record.buy_price_max,
+                record.sell_price_min_date,
+                record.buy_price_max_date,
+            ),
+        )
+        for key, record in price_index.items()
+    )
+
+
+def _unpack_price_index(packed: _PackedPriceIndex) -> PriceIndex:
+    return PriceIndex({key: MarketPriceRecord(*fields) for key, fields in packed})
+
+
+def _init_batch_worker(setup: CraftSetup, packed: _PackedPriceIndex) -> None:
+    global _batch_worker_state
+    _batch_worker_state = (setup, _unpack_price_index(packed))
+
+
+def _run_batch_shard(requests: list[BatchCraftRequest]) -> tuple[CraftRun, ...]:
+    if _batch_worker_state is None:
+        raise RuntimeError("batch worker is not initialized")
+    setup, price_index = _batch_worker_state
+    return _build_craft_runs_serial(setup=setup, requests=requests, price_index=price_index)
+
+
 def build_input_lines(
     *,
     recipe: Recipe,
     quantity: int,
     setup: CraftSetup,
-    price_index: dict[tuple[str, str, int], MarketPriceRecord],
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
     input_cities: dict[str, str],
     input_price_types: dict[str, PriceType],
     manual_input_prices: dict[str, int],
 ) -> list[InputLine]:
     lines: list[InputLine] = []
+    quotes = PriceIndex.of(price_index)
     return_fraction = effective_return_fraction(setup=setup, recipe=recipe)
     for component in recipe.components:
         city = (
@@ -133,12 +300,7 @@ def build_input_lines(
         )
         price_type = input_price_types.get(component.item.unique_name, PriceType.BUY_ORDER)
         manual_price = manual_input_prices.get(component.item.unique_name)
-        quote = _pick_quote(
-            price_index,
-            item_id=component.item.unique_name,
-            city=city,
-            quality=setup.quality,
-        )
+        quote = quotes.quote(component.item.unique_name, city, setup.quality)
         quantity_raw = component.quantity * float(quantity)
         if component.returnable:
             quantity_effective = quantity_raw * (1.0 - return_fraction)
@@ -196,12 +358,13 @@ def build_output_lines(
     recipe: Recipe,
     quantity: int,
     setup: CraftSetup,
-    price_index: dict[tuple[str, str, int], MarketPriceRecord],
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
     output_cities: dict[str, str],
     output_price_types: dict[str, PriceType],
     manual_output_prices: dict[str, int],
 ) -> list[OutputLine]:
     lines: list[OutputLine] = []
+    quotes = PriceIndex.of(price_index)
     for output in recipe.outputs:
         city = (
             output_cities.get(output.item.unique_name)
@@ -210,12 +373,7 @@ def build_output_lines(
         )
         price_type = output_price_types.get(output.item.unique_name, PriceType.SELL_ORDER)
         manual_price = manual_output_prices.get(output.item.unique_name)
-        quote = _pick_quote(
-            price_index,
-            item_id=output.item.unique_name,
-            city=city,
-            quality=setup.quality,
-        )
+        quote = quotes.quote(output.item.unique_name, city, setup.quality)
         unit_price = _select_price(
             quote=quote,
             price_type=price_type,
@@ -271,9 +429,12 @@ def compute_run_profit(run: CraftRun) -> ProfitBreakdown:
 
 
 def compute_batch_profit(runs: list[CraftRun] | tuple[CraftRun, ...]) -> ProfitBreakdown:
+    return sum_profit_breakdowns(compute_run_profit(run) for run in runs)
+
+
+def sum_profit_breakdowns(breakdowns: Iterable[ProfitBreakdown]) -> ProfitBreakdown:
     summary = ProfitBreakdown()
-    for run in runs:
-        breakdown = compute_run_profit(run)
+    for breakdown in breakdowns:
         summary.input_cost += breakdown.input_cost
         summary.output_value += breakdown.output_value
         summary.station_fee += breakdown.station_fee
@@ -282,6 +443,203 @@ def compute_batch_profit(runs: list[CraftRun] | tuple[CraftRun, ...]) -> ProfitB
     return summary
 
 
+def compile_catalog(recipes: Iterable[Recipe]) -> CompiledCatalog:
+    recipe_list = tuple(recipes)
+    item_slots: dict[str, int] = {}
+    component_offsets = array("l", [0])
+    component_items = array("l")
+    component_quantities = array("d")
+    component_returnable = array("b")
+    output_offsets = array("l", [0])
+    output_items = array("l")
+    output_quantities = array("d")
+    output_fee_bases = array("d")
+    focus_per_craft = array("d")
+    for recipe in recipe_list:
+        for component in recipe.components:
+            component_items.append(item_slots.setdefault(component.item.unique_name, len(item_slots)))
+            component_quantities.append(float(component.quantity))
+            component_returnable.append(1 if component.returnable else 0)
+        component_offsets.append(len(component_items))
+        for output in recipe.outputs:
+            output_items.append(item_slots.setdefault(output.item.unique_name, len(item_slots)))
+            output_quantities.append(float(output.quantity))
+            output_fee_bases.append(_station_fee_base(output.item))
+        output_offsets.append(len(output_items))
+        focus_per_craft.append(float(recipe.focus_per_craft))
+    return CompiledCatalog(
+        recipes=recipe_list,
+        item_ids=tuple(item_slots),
+        component_offsets=component_offsets,
+        component_items=component_items,
+        component_quantities=component_quantities,
+        component_returnable=component_returnable,
+        output_offsets=output_offsets,
+        output_items=output_items,
+        output_quantities=output_quantities,
+        output_fee_bases=output_fee_bases,
+        focus_per_craft=focus_per_craft,
+    )
+
+
+def scan_catalog_profits(
+    catalog: CompiledCatalog,
+    *,
+    setup: CraftSetup,
+    price_index: Mapping[tuple[str, str, int], MarketPriceRecord],
+    craft_cities: Iterable[str] | None = None,
+    qualities: Iterable[int] | None = None,
+    runs: int = 1,
+    buy_city: str = "",
+    sell_city: str = "",
+    input_price_type: PriceType = PriceType.BUY_ORDER,
+    output_price_type: PriceType = PriceType.SELL_ORDER,
+    sort_key: str = "margin",
+    limit: int = 50,
+    require_prices: bool = True,
+) -> list[RecipeProfitRow]:
+    """Top `limit` recipe x craft city x quality combinations by `sort_key`."""
+    if sort_key not in SCAN_SORT_KEYS:
+        raise ValueError(f"unknown sort key: {sort_key}")
+    if runs <= 0:
+        raise ValueError("runs must be > 0")
+    quotes = PriceIndex.of(price_index)
+    cities = list(dict.fromkeys(craft_cities or [setup.craft_city]))
+    quality_list = list(dict.fromkeys(int(x) for x in (qualities or [setup.quality])))
+    recipe_count = len(catalog.recipes)
+    fee_rate = max(0.0, float(setup.station_fee_percent)) / 100.0
+    tax_rate = float(setup.market_tax_percent) / 100.0
+    co, ci, cq, cr = (
+        catalog.component_offsets,
+        catalog.component_items,
+        catalog.component_quantities,
+        catalog.component_returnable,
+    )
+    oo, oi, oq, of = (
+        catalog.output_offsets,
+        catalog.output_items,
+        catalog.output_quantities,
+        catalog.output_fee_bases,
+    )
+    scale = float(runs)
+    scored: list[tuple[float, int, tuple[object, ...]]] = []
+    for city in cities:
+        city_setup = replace(setup, craft_city=city)
+        fractions = _scan_return_fractions(catalog, city_setup)
+        for quality in quality_list:
+            buy_prices = _scan_price_vector(
+                catalog, quotes, city=buy_city or city, quality=quality, price_type=input_price_type
+            )
+            sell_prices = _scan_price_vector(
+                catalog, quotes, city=sell_city or city, quality=quality, price_type=output_price_type
+            )
+            for r in range(recipe_count):
+                keep_fraction = 1.0 - fractions[r]
+                input_cost = 0.0
+                savings = 0.0
+                missing = False
+                for j in range(co[r], co[r + 1]):
+                    price = buy_prices[ci[j]]
+                    missing = missing or price <= 0
+                    quantity_raw = cq[j] * scale
+                    if cr[j]:
+                        input_cost += quantity_raw * keep_fraction * price
+                        savings += quantity_raw * fractions[r] * price
+                    else:
+                        input_cost += quantity_raw * price
+                output_value = 0.0
+                station_fee = 0.0
+                for j in range(oo[r], oo[r + 1]):
+                    price = sell_prices[oi[j]]
+                    missing = missing or price <= 0
+                    quantity = oq[j] * scale
+                    output_value += quantity * price
+                    fee_base = of[j]
+                    if fee_base < 0:
+                        fee_base = max(1, int(round(max(0.0, price) * 0.075))) * 0.1125
+                    station_fee += max(0.0, quantity) * fee_base * fee_rate
+                if require_prices and missing:
+                    continue
+                market_tax = max(0.0, output_value * tax_rate)
+                focus_used = catalog.focus_per_craft[r] * scale
+                net_profit = output_value - input_cost - station_fee - market_tax
+                if sort_key == "profit":
+                    score = net_profit
+                elif sort_key == "margin":
+                    score = (net_profit / input_cost) * 100.0 if input_cost > 0 else 0.0
+                elif focus_used > 0:
+                    score = net_profit / focus_used
+                else:
+                    continue
+                values = (r, city, quality, input_cost, savings, output_value, station_fee, market_tax, focus_used)
+                scored.append((score, -len(scored), values))
+    top = heapq.nlargest(max(0, int(limit)), scored)
+    return [
+        RecipeProfitRow(
+            recipe=catalog.recipes[r],
+            craft_city=city,
+            quality=quality,
+            runs=runs,
+            input_cost=input_cost,
+            return_savings=savings,
+            output_value=output_value,
+            station_fee=station_fee,
+            market_tax=market_tax,
+            focus_used=focus_used,
+        )
+        for _score, _order, (
+            r,
+            city,
+            quality,
+            input_cost,
+            savings,
+            output_value,
+            station_fee,
+            market_tax,
+            focus_used,
+        ) in top
+    ]
+
+
+def _scan_return_fractions(catalog: CompiledCatalog, setup: CraftSetup) -> array:
+    # The return rate depends on a recipe only through its refining and city-bonus flags.
+    by_flags: dict[tuple[bool, bool], float] = {}
+    fractions = array("d")
+    for recipe in catalog.recipes:
+        flags = (_is_refining_recipe(recipe), _has_city_bonus(setup=setup, recipe=recipe))
+        fraction = by_flags.get(flags)
+        if fraction is None:
+            fraction = by_flags[flags] = effective_return_fraction(setup=setup, recipe=recipe)
+        fractions.append(fraction)
+    return fractions
+
+
+def _scan_price_vector(
+    catalog: CompiledCatalog,
+    quotes: PriceIndex,
+    *,
+    city: str,
+    quality: int,
+    price_type: PriceType,
+) -> array:
+    return array(
+        "d",
+        (
+            float(_select_price(quote=quotes.quote(item_id, city, quality), price_type=price_type, manual_price=None))
+            for item_id in catalog.item_ids
+        ),
+    )
+
+
+def _station_fee_base(item: ItemRef) -> float:
+    if item.tier is not None and int(item.tier) <= 2:
+        return 0.0
+    item_value = int(item.item_value or 0)
+    if item_value <= 0:
+        return -1.0
+    return item_value * 0.1125
+
+
 def _compute_station_fee_total(
     *,
     output_lines: list[OutputLine] | tuple[OutputLine, ...],
@@ -612,40 +970,6 @@ _OUTLAND_REST_KEYS = {
     "morgana s rest",
 }
 
-_LEVEL_SUFFIX_RE = re.compile(r"_LEVEL(?P<level>\d+)$")
-
-
-def _pick_quote(
-    price_index: dict[tuple[str, str, int], MarketPriceRecord],
-    *,
-    item_id: str,
-    city: str,
-    quality: int,
-) -> MarketPriceRecord | None:
-    candidates = _item_id_candidates(item_id)
-    fallback: MarketPriceRecord | None = None
-    for candidate_id in candidates:
-        key = (candidate_id, city, quality)
-        quote = price_index.get(key)
-        if quote is not None:
-            if _quote_has_market_data(quote):
-                return quote
-            fallback = fallback or quote
-        key_q1 = (candidate_id, city, 1)
-        quote = price_index.get(key_q1)
-        if quote is not None:
-            if _quote_has_market_data(quote):
-                return quote
-            fallback = fallback or quote
-    for candidate_key, candidate in price_index.items():
-        if candidate_key[1] in {city} and candidate_key[0] in candidates:
-            if _quote_has_market_data(candidate):
-                return candidate
-            fallback = fallback or candidate
-    if fallback is not None:
-        return fallback
-    return None
-
 
 def _select_price(
     *,
@@ -673,60 +997,3 @@ def _select_price(
 
 def _has_manual_price(value: int | None) -> bool:
     return value is not None and int(value) > 0
-
-
-def _quote_has_market_data(quote: MarketPriceRecord) -> bool:
-    return int(quote.buy_price_max or 0) > 0 or int(quote.sell_price_min or 0) > 0
-
-
-def _item_id_candidates(item_id: str) -> tuple[str, ...]:
-    base = str(item_id or "").strip()
-    if not base:
-        return ()
-    out: list[str] = [base]
-
-    # AOData and in-game assets can encode enchant in several interchangeable forms:
-    # T4_METALBAR@3, T4_METALBAR_LEVEL3, T4_METALBAR_LEVEL3@3
-    core = base
-    had_at = "@" in base
-    enchant: int | None = None
-    if "@" in core:
-        maybe_core, maybe_enchant = core.rsplit("@", 1)
-        try:
-            enchant = int(maybe_enchant)
-            core = maybe_core
-        except ValueError:
-            pass
-
-    stem = core
-    level: int | None = None
-    level_match = _LEVEL_SUFFIX_RE.search(core)
-    had_level = level_match is not None
-    if level_match is not None:
-        stem = core[: level_match.start()]
-        try:
-            level = int(level_match.group("level"))
-        except (TypeError, ValueError):
-            level = None
-
-    if enchant is None and level is not None:
-        enchant = level
-    if level is None and enchant is not None:
-        level = enchant
-
-    if level is not None:
-        out.append(f"{stem}_LEVEL{level}")
-    # For *_LEVELN ids prefer *_LEVELN@N (canonical refined form) over *@N.
-    if enchant is not None and (had_at or not had_level):
-        out.append(f"{stem}@{enchant}")
-    if level is not None and enchant is not None:
-        out.append(f"{stem}_LEVEL{level}@{enchant}")
-    out.append(stem)
-    # keep order and uniqueness
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in out:
-        if value and value not in seen:
-            seen.add(value)
-            ordered.append(value)
-    return tuple(ordered)
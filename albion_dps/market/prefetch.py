@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from albion_dps.market.models import MarketRegion
+from albion_dps.market.service import DEFAULT_PRICE_TTL_SECONDS, MarketDataService
+
+
+DEFAULT_PREFETCH_CHUNK_SIZE = 100
+
+
+@dataclass(frozen=True)
+class PrefetchProgress:
+    total_items: int
+    done_items: int = 0
+    cached_keys: int = 0
+    fetched_keys: int = 0
+    failed_chunks: int = 0
+    elapsed_ms: float = 0.0
+    last_error: str = ""
+    cancelled: bool = False
+
+    @property
+    def finished(self) -> bool:
+        return self.cancelled or self.done_items >= self.total_items
+
+
+def prefetch_prices(
+    service: MarketDataService,
+    *,
+    region: MarketRegion,
+    item_ids: list[str],
+    locations: list[str],
+    qualities: list[int] | None = None,
+    chunk_size: int = DEFAULT_PREFETCH_CHUNK_SIZE,
+    ttl_seconds: float = DEFAULT_PRICE_TTL_SECONDS,
+    allow_stale: bool = False,
+    progress: Callable[[PrefetchProgress], None] | None = None,
+    cancelled: threading.Event | None = None,
+    wait_idle: Callable[[], None] | None = None,
+) -> PrefetchProgress:
+    """Warm the per-key price cache for `item_ids`, one chunk at a time."""
+    started = time.perf_counter()
+    wanted = list(dict.fromkeys(item_ids))
+    state = PrefetchProgress(total_items=len(wanted))
+    step = max(1, int(chunk_size))
+    for start in range(0, len(wanted), step):
+        if wait_idle is not None:
+            wait_idle()
+        if cancelled is not None and cancelled.is_set():
+            state = _advance(state, started, cancelled=True)
+            if progress is not None:
+                progress(state)
+            return state
+        chunk = wanted[start : start + step]
+        try:
+            service.get_prices(
+                region=region,
+                item_ids=chunk,
+                locations=locations,
+                qualities=qualities,
+                ttl_seconds=ttl_seconds,
+                allow_stale=allow_stale,
+                background=True,
+            )
+        except Exception as exc:
+            state = _advance(
+                state,
+                started,
+                items=len(chunk),
+                failed_chunks=1,
+                last_error=str(exc),
+            )
+        else:
+            meta = service.last_prices_meta
+            state = _advance(
+                state,
+                started,
+                items=len(chunk),
+                cached_keys=meta.cached_keys,
+                fetched_keys=meta.fetched_keys,
+            )
+        if progress is not None:
+            progress(state)
+    return state
+
+
+def _advance(
+    state: PrefetchProgress,
+    started: float,
+    *,
+    items: int = 0,
+    cached_keys: int = 0,
+    fetched_keys: int = 0,
+    failed_chunks: int = 0,
+    last_error: str = "",
+    cancelled: bool = False,
+) -> PrefetchProgress:
+    return PrefetchProgress(
+        total_items=state.total_items,
+        done_items=state.done_items + items,
+        cached_keys=state.cached_keys + cached_keys,
+        fetched_keys=state.fetched_keys + fetched_keys,
+        failed_chunks=state.failed_chunks + failed_chunks,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+        last_error=last_error or state.last_error,
+        cancelled=cancelled,
+    )
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterator, Mapping
+
+from albion_dps.market.aod_client import MarketPriceRecord
+from albion_dps.market.models import PriceType
+
+PriceIndexKey = tuple[str, str, int]
+
+_LEVEL_SUFFIX_RE = re.compile(r"_LEVEL(?P<level>\d+)$")
+
+# Which quote fields count as "has a price" when picking among candidates.
+_MODE_ANY = 0
+_MODE_BUY = 1
+_MODE_SELL = 2
+_MODE_ALL = 3
+
+
+class _CitySlot:
+    """Quotes of one item id in one city, plus the first match per mode in index order."""
+
+    __slots__ = ("by_quality", "first")
+
+    def __init__(self) -> None:
+        self.by_quality: dict[int, MarketPriceRecord] = {}
+        # mode -> (position in the source mapping, quote)
+        self.first: list[tuple[int, MarketPriceRecord] | None] = [None, None, None, None]
+
+
+class PriceIndex(Mapping[PriceIndexKey, MarketPriceRecord]):
+    """Read-only ``(item_id, city, quality) -> quote`` mapping with indexed lookup.
+
+    Quotes are grouped by item id and city once at construction, so `quote`
+    resolves enchant/level id variants with a few dict lookups instead of
+    scanning every entry. Results are memoized; the index must not be
+    mutated (build a new one when prices change).
+    """
+
+    def __init__(self, records: Mapping[PriceIndexKey, MarketPriceRecord] | None = None) -> None:
+        self._records: dict[PriceIndexKey, MarketPriceRecord] = dict(records or {})
+        self._slots: dict[str, dict[str, _CitySlot]] = {}
+        self._memo: dict[tuple[str, str, int, int], MarketPriceRecord | None] = {}
+        for position, ((item_id, city, quality), record) in enumerate(self._records.items()):
+            slot = self._slots.setdefault(item_id, {}).get(city)
+            if slot is None:
+                slot = self._slots[item_id][city] = _CitySlot()
+            slot.by_quality.setdefault(quality, record)
+            for mode in (_MODE_ANY, _MODE_BUY, _MODE_SELL, _MODE_ALL):
+                if slot.first[mode] is None and _has_price(record, mode):
+                    slot.first[mode] = (position, record)
+
+    @classmethod
+    def of(cls, records: Mapping[PriceIndexKey, MarketPriceRecord] | None) -> "PriceIndex":
+        """Return `records` if it already is a `PriceIndex`, else index it."""
+        if isinstance(records, PriceIndex):
+            return records
+        return cls(records)
+
+    def __getitem__(self, key: PriceIndexKey) -> MarketPriceRecord:
+        return self._records[key]
+
+    def __iter__(self) -> Iterator[PriceIndexKey]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def quote(
+        self,
+        item_id: str,
+        city: str,
+        quality: int,
+        *,
+        preferred_mode: str | None = None,
+    ) -> MarketPriceRecord | None:
+        """Best quote for `item_id` in `city`.
+
+        Tries every id variant at `quality`, then quality 1, then any quality
+        in index order, returning the first quote that has a price for
+        `preferred_mode` (buy/sell order, or either when None); otherwise the
+        first quote found at all.
+        """
+        mode = _mode_from_price_type(preferred_mode)
+        memo_key = (item_id, city, int(quality), mode)
+        try:
+            return self._memo[memo_key]
+        except KeyError:
+            pass
+        quote = self._resolve(item_id, city, int(quality), mode)
+        self._memo[memo_key] = quote
+        return quote
+
+    def _resolve(self, item_id: str, city: str, quality: int, mode: int) -> MarketPriceRecord | None:
+        slots = [
+            slot
+            for slot in (self._slots.get(candidate, {}).get(city) for candidate in item_id_candidates(item_id))
+            if slot is not None
+        ]
+        if not slots:
+            return None
+        qualities = (quality, 1) if quality != 1 else (1,)
+        fallback: MarketPriceRecord | None = None
+        for slot in slots:
+            for candidate_quality in qualities:
+                quote = slot.by_quality.get(candidate_quality)
+                if quote is None:
+                    continue
+                if _has_price(quote, mode):
+                    return quote
+                if fallback is None:
+                    fallback = quote
+        best = _earliest(slot.first[mode] for slot in slots)
+        if best is not None:
+            return best
+        if fallback is not None:
+            return fallback
+        return _earliest(slot.first[_MODE_ALL] for slot in slots)
+
+
+def _earliest(entries) -> MarketPriceRecord | None:
+    found: tuple[int, MarketPriceRecord] | None = None
+    for entry in entries:
+        if entry is not None and (found is None or entry[0] < found[0]):
+            found = entry
+    return None if found is None else found[1]
+
+
+def _mode_from_price_type(preferred_mode: str | None) -> int:
+    mode = str(preferred_mode or "").strip().lower()
+    if mode == PriceType.BUY_ORDER.value:
+        return _MODE_BUY
+    if mode == PriceType.SELL_ORDER.value:
+        return _MODE_SELL
+    if mode == PriceType.MANUAL.value:
+        return _MODE_ALL
+    return _MODE_ANY
+
+
+def _has_price(quote: MarketPriceRecord, mode: int) -> bool:
+    if mode == _MODE_BUY:
+        return int(quote.buy_price_max or 0) > 0
+    if mode == _MODE_SELL:
+        return int(quote.sell_price_min or 0) > 0
+    if mode == _MODE_ALL:
+        return True
+    return int(quote.buy_price_max or 0) > 0 or int(quote.sell_price_min or 0) > 0
+
+
+@lru_cache(maxsize=65536)
+def item_id_candidates(item_id: str) -> tuple[str, ...]:
+    """Market ids that may carry prices for `item_id`, most specific first."""
+    base = str(item_id or "").strip()
+    if not base:
+        return ()
+    out: list[str] = [base]
+
+    # AOData and in-game assets can encode enchant in several interchangeable forms:
+    # T4_METALBAR@3, T4_METALBAR_LEVEL3, T4_METALBAR_LEVEL3@3
+    core = base
+    had_at = "@" in base
+    enchant: int | None = None
+    if "@" in core:
+        maybe_core, maybe_enchant = core.rsplit("@", 1)
+        try:
+            enchant = int(maybe_enchant)
+            core = maybe_core
+        except ValueError:
+            pass
+
+    stem = core
+    level: int | None = None
+    level_match = _LEVEL_SUFFIX_RE.search(core)
+    had_level = level_match is not None
+    if level_match is not None:
+        stem = core[: level_match.start()]
+        try:
+            level = int(level_match.group("level"))
+        except (TypeError, ValueError):
+            level = None
+
+    if enchant is None and level is not None:
+        enchant = level
+    if level is None and enchant is not None:
+        level = enchant
+
+    if level is not None:
+        out.append(f"{stem}_LEVEL{level}")
+    # For *_LEVELN ids prefer *_LEVELN@N (canonical refined form) over *@N.
+    if enchant is not None and (had_at or not had_level):
+        out.append(f"{stem}@{enchant}")
+    if level is not None and enchant is not None:
+        out.append(f"{stem}_LEVEL{level}@{enchant}")
+    out.append(stem)
+    # keep order and uniqueness
+    return tuple(dict.fromkeys(value for value in out if value))
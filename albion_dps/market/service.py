@@ -2,22 +2,79 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 import time
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
+from typing import Callable, TypeVar
 
 from albion_dps.market.aod_client import AODataClient, MarketChartPoint, MarketPriceRecord
 from albion_dps.market.cache import SQLiteCache
 from albion_dps.market.models import MarketRegion
 
 
+PriceKey = tuple[str, str, int]
+
+# Live price rows are cached this long; reads that allow stale rows keep them afterwards.
+DEFAULT_PRICE_TTL_SECONDS = 120.0
+# Known-empty price keys expire sooner than prices: a row AO Data did not
+# return may still show up on the next fetch.
+DEFAULT_NEGATIVE_PRICE_TTL_SECONDS = 30.0
+
+_T = TypeVar("_T")
+
+
+class _SingleFlight:
+    """Coalesce identical concurrent calls: followers wait for the leader's result."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[object, "_Flight"] = {}
+
+    def run(self, key: object, fn: Callable[[], _T]) -> tuple[_T, bool]:
+        """Return ``(result, shared)``; ``shared`` is True when another caller fetched it."""
+        with self._lock:
+            flight = self._calls.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._calls[key] = flight
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            flight.done.set()
+        return flight.result, False
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: object = None
+        self.error: BaseException | None = None
+
+
 @dataclass(frozen=True)
 class MarketFetchMeta:
     source: str
     record_count: int
     elapsed_ms: float
     cache_key: str
+    cached_keys: int = 0
+    fetched_keys: int = 0
+    shared_fetches: int = 0
 
 
 class MarketDataService:
@@ -26,9 +83,14 @@ class MarketDataService:
         *,
         client: AODataClient | None = None,
         cache: SQLiteCache | None = None,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_PRICE_TTL_SECONDS,
     ) -> None:
         self.client = client or AODataClient()
         self.cache = cache
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._flights = _SingleFlight()
+        # Callers on worker threads (GUI fetches, prefetch) read their own last meta.
+        self._thread_meta = threading.local()
         self._last_prices_meta = MarketFetchMeta(
             source="none",
             record_count=0,
@@ -44,7 +106,8 @@ class MarketDataService:
 
     @property
     def last_prices_meta(self) -> MarketFetchMeta:
-        return self._last_prices_meta
+        """Meta of the calling thread's last `get_prices`, else the latest overall."""
+        return getattr(self._thread_meta, "prices", None) or self._last_prices_meta
 
     @property
     def last_charts_meta(self) -> MarketFetchMeta:
@@ -56,10 +119,20 @@ class MarketDataService:
         *,
         cache_path: Path,
         client: AODataClient | None = None,
+        background_writes: bool = False,
+        compress: bool = False,
+        max_bytes: int | None = None,
     ) -> "MarketDataService":
-        return cls(client=client, cache=SQLiteCache(cache_path))
+        cache = SQLiteCache(
+            cache_path,
+            background_writes=background_writes,
+            compress=compress,
+            max_bytes=max_bytes,
+        )
+        return cls(client=client, cache=cache)
 
     def close(self) -> None:
+        self.client.close()
         if self.cache is not None:
             self.cache.close()
 
@@ -70,60 +143,119 @@ class MarketDataService:
         item_ids: list[str],
         locations: list[str],
         qualities: list[int] | None = None,
-        ttl_seconds: float = 120.0,
+        ttl_seconds: float = DEFAULT_PRICE_TTL_SECONDS,
         allow_stale: bool = True,
         allow_cache: bool = True,
         allow_live: bool = True,
+        background: bool = False,
     ) -> list[MarketPriceRecord]:
+        """Price records for every (item, location, quality), fetching only uncached keys."""
         started = time.perf_counter()
+        resolved_qualities = sorted(set(qualities or [1]))
         cache_key = _cache_key(
             prefix="prices",
             payload={
                 "region": region.value,
                 "item_ids": sorted(item_ids),
                 "locations": sorted(locations),
-                "qualities": sorted(qualities or [1]),
+                "qualities": resolved_qualities,
             },
         )
-        if allow_cache:
-            cached = self._get_cached(cache_key, allow_stale=allow_stale)
-            if cached is not None:
-                payload_raw, source = cached
-                rows = [_to_price(x) for x in payload_raw if isinstance(x, dict)]
-                self._last_prices_meta = MarketFetchMeta(
-                    source=source,
-                    record_count=len(rows),
-                    elapsed_ms=(time.perf_counter() - started) * 1000.0,
-                    cache_key=cache_key,
-                )
-                return rows
-
-        if not allow_live:
-            self._last_prices_meta = MarketFetchMeta(
-                source="cache_miss",
-                record_count=0,
-                elapsed_ms=(time.perf_counter() - started) * 1000.0,
-                cache_key=cache_key,
+        wanted = [
+            (item_id, location, quality)
+            for item_id in dict.fromkeys(item_ids)
+            for location in dict.fromkeys(locations)
+            for quality in resolved_qualities
+        ]
+        found: dict[PriceKey, MarketPriceRecord] = {}
+        missing: list[PriceKey] = []
+        cached_keys = 0
+        any_stale = False
+        cached_prices = (
+            self._get_cached_prices(region, wanted, allow_stale=allow_stale) if allow_cache else {}
+        )
+        for key in wanted:
+            cached = cached_prices.get(key)
+            if cached is None:
+                missing.append(key)
+                continue
+            record, stale = cached
+            cached_keys += 1
+            any_stale = any_stale or stale
+            if record is not None:
+                found[key] = record
+
+        if missing and not allow_live:
+            source = "cache_miss" if not cached_keys else ("stale_cache" if any_stale else "cache")
+            return self._finish_prices(
+                list(found.values()), source, started, cache_key, cached_keys=cached_keys
+            )
+        if not missing:
+            source = "stale_cache" if any_stale else "cache"
+            return self._finish_prices(
+                list(found.values()), source, started, cache_key, cached_keys=cached_keys
             )
-            return []
 
-        rows = self.client.fetch_prices(
-            region=region,
-            item_ids=item_ids,
-            locations=locations,
-            qualities=qualities,
+        live_rows: list[MarketPriceRecord] = []
+        shared_fetches = 0
+        for batch_items, batch_locations, batch_qualities in _group_missing_price_keys(missing):
+            rows, shared = self._flights.run(
+                ("prices", region, tuple(batch_items), tuple(batch_locations), tuple(batch_qualities)),
+                lambda: self.client.fetch_prices(
+                    region=region,
+                    item_ids=batch_items,
+                    locations=batch_locations,
+                    qualities=batch_qualities,
+                    background=background,
+                ),
+            )
+            live_rows.extend(rows)
+            shared_fetches += int(shared)
+        live_by_key = {(row.item_id, row.city, row.quality): row for row in live_rows}
+        # Rows AO Data returned beyond the requested keys are cached as well.
+        self._put_cached_prices(region, live_by_key, ttl_seconds=ttl_seconds)
+        covered = {(item_id, city) for item_id, city, _quality in live_by_key}
+        known_empty = {
+            key: None for key in missing if key not in live_by_key and key[:2] in covered
+        }
+        self._put_cached_prices(
+            region,
+            known_empty,
+            ttl_seconds=min(ttl_seconds, self.negative_ttl_seconds),
         )
-        self._put_cached(
+        found.update(live_by_key)
+        return self._finish_prices(
+            list(found.values()),
+            "live" if not cached_keys else "cache+live",
+            started,
             cache_key,
-            [x.__dict__ for x in rows],
-            ttl_seconds=ttl_seconds,
+            cached_keys=cached_keys,
+            fetched_keys=len(missing),
+            shared_fetches=shared_fetches,
         )
-        self._last_prices_meta = MarketFetchMeta(
-            source="live",
+
+    def _finish_prices(
+        self,
+        rows: list[MarketPriceRecord],
+        source: str,
+        started: float,
+        cache_key: str,
+        *,
+        cached_keys: int = 0,
+        fetched_keys: int = 0,
+        shared_fetches: int = 0,
+    ) -> list[MarketPriceRecord]:
+        meta = MarketFetchMeta(
+            source=source,
             record_count=len(rows),
             elapsed_ms=(time.perf_counter() - started) * 1000.0,
             cache_key=cache_key,
+            cached_keys=cached_keys,
+            fetched_keys=fetched_keys,
+            shared_fetches=shared_fetches,
         )
+        self._last_prices_meta = meta
+        self._thread_meta.prices = meta
         return rows
 
     def get_price_index(
@@ -133,7 +265,7 @@ class MarketDataService:
         item_ids: list[str],
         locations: list[str],
         qualities: list[int] | None = None,
-        ttl_seconds: float = 120.0,
+        ttl_seconds: float = DEFAULT_PRICE_TTL_SECONDS,
         allow_stale: bool = True,
         allow_cache: bool = True,
         allow_live: bool = True,
@@ -192,14 +324,17 @@ class MarketDataService:
             )
             return rows
 
-        rows = self.client.fetch_charts(
-            region=region,
-            item_id=item_id,
-            location=location,
-            quality=quality,
-            date_from=date_from,
-            date_to=date_to,
-            time_scale=time_scale,
+        rows, shared = self._flights.run(
+            cache_key,
+            lambda: self.client.fetch_charts(
+                region=region,
+                item_id=item_id,
+                location=location,
+                quality=quality,
+                date_from=date_from,
+                date_to=date_to,
+                time_scale=time_scale,
+            ),
         )
         self._put_cached(
             cache_key,
@@ -211,6 +346,7 @@ class MarketDataService:
             record_count=len(rows),
             elapsed_ms=(time.perf_counter() - started) * 1000.0,
             cache_key=cache_key,
+            shared_fetches=int(shared),
         )
         return rows
 
@@ -235,6 +371,43 @@ class MarketDataService:
             return
         self.cache.set(key, payload, ttl_seconds=ttl_seconds)
 
+    def _get_cached_prices(
+        self,
+        region: MarketRegion,
+        keys: list[PriceKey],
+        *,
+        allow_stale: bool,
+    ) -> dict[PriceKey, tuple[MarketPriceRecord | None, bool]]:
+        """Cached record (`None` if known empty) and staleness for each cached key."""
+        if self.cache is None or not keys:
+            return {}
+        cache_keys = {_price_cache_key(region, key): key for key in keys}
+        entries = self.cache.get_many(cache_keys, allow_expired=allow_stale)
+        out: dict[PriceKey, tuple[MarketPriceRecord | None, bool]] = {}
+        for cache_key, entry in entries.items():
+            if not isinstance(entry.payload, dict):
+                continue
+            record = _to_price(entry.payload) if entry.payload else None
+            out[cache_keys[cache_key]] = (record, entry.expired)
+        return out
+
+    def _put_cached_prices(
+        self,
+        region: MarketRegion,
+        records: dict[PriceKey, MarketPriceRecord | None],
+        *,
+        ttl_seconds: float,
+    ) -> None:
+        if self.cache is None or not records:
+            return
+        self.cache.set_many(
+            {
+                _price_cache_key(region, key): record.__dict__ if record is not None else {}
+                for key, record in records.items()
+            },
+            ttl_seconds=ttl_seconds,
+        )
+
 
 def _cache_key(*, prefix: str, payload: dict[str, object]) -> str:
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
@@ -242,6 +415,34 @@ def _cache_key(*, prefix: str, payload: dict[str, object]) -> str:
     return f"market:{prefix}:{digest}"
 
 
+def _price_cache_key(region: MarketRegion, key: PriceKey) -> str:
+    item_id, city, quality = key
+    return f"market:price:{region.value}:{item_id}:{city}:{quality}"
+
+
+def _group_missing_price_keys(
+    keys: list[PriceKey],
+) -> list[tuple[list[str], list[str], list[int]]]:
+    """Group missing keys into few item x location x quality fetches.
+
+    Items missing the same (city, quality) combinations share one request,
+    e.g. all items of a newly planned recipe, or every item after a buy-city
+    change.
+    """
+    combos_by_item: dict[str, set[tuple[str, int]]] = {}
+    for item_id, city, quality in keys:
+        combos_by_item.setdefault(item_id, set()).add((city, quality))
+    items_by_combos: dict[frozenset[tuple[str, int]], list[str]] = {}
+    for item_id, combos in combos_by_item.items():
+        items_by_combos.setdefault(frozenset(combos), []).append(item_id)
+    groups: list[tuple[list[str], list[str], list[int]]] = []
+    for combos, group_items in items_by_combos.items():
+        locations = sorted({city for city, _ in combos})
+        qualities = sorted({quality for _, quality in combos})
+        groups.append((group_items, locations, qualities))
+    return groups
+
+
 def _to_price(row: dict[str, object]) -> MarketPriceRecord:
     return MarketPriceRecord(
         item_id=str(row.get("item_id") or ""),
@@ -1,5 +1,22 @@
 from .aggregate import RollingMeter
+from .array_meter import ArrayRollingMeter, MeterDelta, MeterTable
 from .session_meter import SessionMeter, SessionSummary
-from .types import Meter
+from .snapshot_delta import SnapshotAssembler, SnapshotDeltaEncoder, merge_snapshots
+from .timeline import SessionTimeline, TimelineRecorder
+from .types import Meter, WindowMeter
 
-__all__ = ["Meter", "RollingMeter", "SessionMeter", "SessionSummary"]
+__all__ = [
+    "ArrayRollingMeter",
+    "Meter",
+    "MeterDelta",
+    "MeterTable",
+    "RollingMeter",
+    "SessionMeter",
+    "SessionSummary",
+    "SessionTimeline",
+    "SnapshotAssembler",
+    "SnapshotDeltaEncoder",
+    "TimelineRecorder",
+    "WindowMeter",
+    "merge_snapshots",
+]
@@ -1,25 +1,38 @@
 from __future__ import annotations
 
-from collections import deque
+from array import array
 
+from albion_dps.meter.array_meter import MeterDelta, MeterTable
+from albion_dps.meter.window import make_window
 from albion_dps.models import CombatEvent, MeterSnapshot
 
 
 class RollingMeter:
     def __init__(
-        self, window_seconds: float = 10.0, session_timeout_seconds: float | None = 20.0
+        self,
+        window_seconds: float = 10.0,
+        session_timeout_seconds: float | None = 20.0,
+        *,
+        bucket_seconds: float | None = None,
     ) -> None:
         if window_seconds <= 0:
             raise ValueError("window_seconds must be positive")
         if session_timeout_seconds is not None and session_timeout_seconds <= 0:
             raise ValueError("session_timeout_seconds must be positive or None")
+        if bucket_seconds is not None and bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive or None")
         self._window_seconds = window_seconds
         self._session_timeout_seconds = session_timeout_seconds
         self._totals: dict[int, dict[str, float]] = {}
         self._rolling_damage: dict[int, float] = {}
         self._rolling_heal: dict[int, float] = {}
-        self._damage_events: deque[tuple[float, int, float]] = deque()
-        self._heal_events: deque[tuple[float, int, float]] = deque()
+        # Per-hit entries by default; fixed-width time buckets when
+        # ``bucket_seconds`` is set (see ``BucketWindow`` for the error bound).
+        self._damage_window = make_window(bucket_seconds)
+        self._heal_window = make_window(bucket_seconds)
+        # Sources touched since the last `snapshot_delta`.
+        self._dirty: set[int] = set()
+        self._reset_pending = False
         self._last_event_timestamp: float | None = None
         self._last_seen_timestamp: float | None = None
 
@@ -40,20 +53,21 @@ class RollingMeter:
             self._last_seen_timestamp = event.timestamp
 
         totals = self._totals.setdefault(event.source_id, {"damage": 0.0, "heal": 0.0})
+        self._dirty.add(event.source_id)
         amount = float(event.amount)
 
         if event.kind == "damage":
             totals["damage"] += amount
-            self._damage_events.append((event.timestamp, event.source_id, amount))
-            self._rolling_damage[event.source_id] = (
-                self._rolling_damage.get(event.source_id, 0.0) + amount
-            )
+            if self._damage_window.add(event.timestamp, event.source_id, amount):
+                self._rolling_damage[event.source_id] = (
+                    self._rolling_damage.get(event.source_id, 0.0) + amount
+                )
         elif event.kind == "heal":
             totals["heal"] += amount
-            self._heal_events.append((event.timestamp, event.source_id, amount))
-            self._rolling_heal[event.source_id] = (
-                self._rolling_heal.get(event.source_id, 0.0) + amount
-            )
+            if self._heal_window.add(event.timestamp, event.source_id, amount):
+                self._rolling_heal[event.source_id] = (
+                    self._rolling_heal.get(event.source_id, 0.0) + amount
+                )
         else:
             return
 
@@ -77,13 +91,7 @@ class RollingMeter:
             self._expire_old(self._last_seen_timestamp)
 
     def snapshot(self, now: float | None = None) -> MeterSnapshot:
-        if now is None:
-            now = self._last_seen_timestamp
-            if now is None:
-                now = self._last_event_timestamp or 0.0
-        elif self._last_seen_timestamp is None or now > self._last_seen_timestamp:
-            self._last_seen_timestamp = now
-        self._expire_old(now)
+        now = self._advance(now)
         totals: dict[int, dict[str, float]] = {}
         for source_id, stats in self._totals.items():
             dps = self._rolling_damage.get(source_id, 0.0) / self._window_seconds
@@ -96,17 +104,48 @@ class RollingMeter:
             }
         return MeterSnapshot(timestamp=now, totals=totals)
 
+    def snapshot_delta(self, now: float | None = None) -> MeterDelta:
+        """Rows of the sources touched since the previous delta (all rows after a reset)."""
+        now = self._advance(now)
+        reset = self._reset_pending
+        if reset:
+            source_ids = tuple(self._totals)
+        else:
+            source_ids = tuple(sorted(source_id for source_id in self._dirty if source_id in self._totals))
+        self._dirty.clear()
+        self._reset_pending = False
+        window = self._window_seconds
+        changed = MeterTable(
+            timestamp=now,
+            source_ids=source_ids,
+            damage=array("d", (self._totals[source_id]["damage"] for source_id in source_ids)),
+            heal=array("d", (self._totals[source_id]["heal"] for source_id in source_ids)),
+            dps=array("d", (self._rolling_damage.get(source_id, 0.0) / window for source_id in source_ids)),
+            hps=array("d", (self._rolling_heal.get(source_id, 0.0) / window for source_id in source_ids)),
+        )
+        return MeterDelta(reset=reset, changed=changed)
+
+    def _advance(self, now: float | None) -> float:
+        if now is None:
+            now = self._last_seen_timestamp
+            if now is None:
+                now = self._last_event_timestamp or 0.0
+        elif self._last_seen_timestamp is None or now > self._last_seen_timestamp:
+            self._last_seen_timestamp = now
+        self._expire_old(now)
+        return now
+
     def _expire_old(self, now: float) -> None:
         cutoff = now - self._window_seconds
-        while self._damage_events and self._damage_events[0][0] < cutoff:
-            _ts, source_id, amount = self._damage_events.popleft()
+        for source_id, amount in self._damage_window.expire(cutoff):
+            self._dirty.add(source_id)
             current = self._rolling_damage.get(source_id, 0.0) - amount
             if current <= 0:
                 self._rolling_damage.pop(source_id, None)
             else:
                 self._rolling_damage[source_id] = current
-        while self._heal_events and self._heal_events[0][0] < cutoff:
-            _ts, source_id, amount = self._heal_events.popleft()
+        for source_id, amount in self._heal_window.expire(cutoff):
+            self._dirty.add(source_id)
             current = self._rolling_heal.get(source_id, 0.0) - amount
             if current <= 0:
                 self._rolling_heal.pop(source_id, None)
@@ -117,7 +156,9 @@ class RollingMeter:
         self._totals.clear()
         self._rolling_damage.clear()
         self._rolling_heal.clear()
-        self._damage_events.clear()
-        self._heal_events.clear()
+        self._damage_window.clear()
+        self._heal_window.clear()
+        self._dirty.clear()
+        self._reset_pending = True
         self._last_event_timestamp = None
         self._last_seen_timestamp = now
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+
+from albion_dps.meter.window import make_window
+from albion_dps.models import CombatEvent, MeterSnapshot
+
+
+@dataclass(frozen=True)
+class MeterTable:
+    """Column-oriented meter state: one entry per source, aligned by position."""
+
+    timestamp: float
+    source_ids: tuple[int, ...]
+    damage: array
+    heal: array
+    dps: array
+    hps: array
+
+    def __len__(self) -> int:
+        return len(self.source_ids)
+
+    def to_totals(self) -> dict[int, dict[str, float]]:
+        return {
+            source_id: {
+                "damage": self.damage[pos],
+                "heal": self.heal[pos],
+                "dps": self.dps[pos],
+                "hps": self.hps[pos],
+            }
+            for pos, source_id in enumerate(self.source_ids)
+        }
+
+
+@dataclass(frozen=True)
+class MeterDelta:
+    """Rows changed since the previous delta; ``reset`` means drop prior state."""
+
+    reset: bool
+    changed: MeterTable
+
+    def apply(self, totals: dict[int, dict[str, float]]) -> dict[int, dict[str, float]]:
+        if self.reset:
+            totals.clear()
+        totals.update(self.changed.to_totals())
+        return totals
+
+
+class ArrayRollingMeter:
+    """`RollingMeter` replacement that keeps per-source state in dense arrays.
+
+    Each source id gets a slot on first sight; totals and rolling window sums
+    live in ``array('d')`` columns indexed by slot. Snapshots can be taken as
+    the usual nested dict, as one `MeterTable`, or as a `MeterDelta` holding
+    only the slots touched since the previous delta. ``bucket_seconds`` has
+    the same meaning as for `RollingMeter`.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 10.0,
+        session_timeout_seconds: float | None = 20.0,
+        *,
+        bucket_seconds: float | None = None,
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        if session_timeout_seconds is not None and session_timeout_seconds <= 0:
+            raise ValueError("session_timeout_seconds must be positive or None")
+        if bucket_seconds is not None and bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive or None")
+        self._window_seconds = window_seconds
+        self._session_timeout_seconds = session_timeout_seconds
+        self._slots: dict[int, int] = {}
+        self._source_ids: array = array("q")
+        self._damage: array = array("d")
+        self._heal: array = array("d")
+        self._rolling_damage: array = array("d")
+        self._rolling_heal: array = array("d")
+        self._damage_window = make_window(bucket_seconds)
+        self._heal_window = make_window(bucket_seconds)
+        self._dirty: set[int] = set()
+        self._reset_pending = False
+        self._last_event_timestamp: float | None = None
+        self._last_seen_timestamp: float | None = None
+
+    def push(self, event: CombatEvent) -> None:
+        if (
+            self._last_event_timestamp is not None
+            and self._session_timeout_seconds is not None
+        ):
+            if event.timestamp - self._last_event_timestamp >= self._session_timeout_seconds:
+                self._reset_state(now=event.timestamp)
+
+        if (
+            self._last_event_timestamp is None
+            or event.timestamp > self._last_event_timestamp
+        ):
+            self._last_event_timestamp = event.timestamp
+        if self._last_seen_timestamp is None or event.timestamp > self._last_seen_timestamp:
+            self._last_seen_timestamp = event.timestamp
+
+        slot = self._slot_for(event.source_id)
+        amount = float(event.amount)
+
+        if event.kind == "damage":
+            self._damage[slot] += amount
+            if self._damage_window.add(event.timestamp, slot, amount):
+                self._rolling_damage[slot] += amount
+        elif event.kind == "heal":
+            self._heal[slot] += amount
+            if self._heal_window.add(event.timestamp, slot, amount):
+                self._rolling_heal[slot] += amount
+        else:
+            return
+        self._dirty.add(slot)
+
+        if self._last_seen_timestamp is not None:
+            self._expire_old(self._last_seen_timestamp)
+
+    def touch(self, timestamp: float) -> None:
+        if self._last_seen_timestamp is None or timestamp > self._last_seen_timestamp:
+            self._last_seen_timestamp = timestamp
+        if (
+            self._last_event_timestamp is not None
+            and self._session_timeout_seconds is not None
+            and self._last_seen_timestamp is not None
+        ):
+            if (
+                self._last_seen_timestamp - self._last_event_timestamp
+                >= self._session_timeout_seconds
+            ):
+                self._reset_state(now=self._last_seen_timestamp)
+        if self._last_seen_timestamp is not None:
+            self._expire_old(self._last_seen_timestamp)
+
+    def snapshot(self, now: float | None = None) -> MeterSnapshot:
+        table = self.snapshot_table(now)
+        return MeterSnapshot(timestamp=table.timestamp, totals=table.to_totals())
+
+    def snapshot_table(self, now: float | None = None) -> MeterTable:
+        now = self._advance(now)
+        return self._table(now, range(len(self._source_ids)))
+
+    def snapshot_delta(self, now: float | None = None) -> MeterDelta:
+        now = self._advance(now)
+        reset = self._reset_pending
+        if reset:
+            slots: range | list[int] = range(len(self._source_ids))
+        else:
+            slots = sorted(self._dirty)
+        delta = MeterDelta(reset=reset, changed=self._table(now, slots))
+        self._dirty.clear()
+        self._reset_pending = False
+        return delta
+
+    def _advance(self, now: float | None) -> float:
+        if now is None:
+            now = self._last_seen_timestamp
+            if now is None:
+                now = self._last_event_timestamp or 0.0
+        elif self._last_seen_timestamp is None or now > self._last_seen_timestamp:
+            self._last_seen_timestamp = now
+        self._expire_old(now)
+        return now
+
+    def _table(self, now: float, slots: range | list[int]) -> MeterTable:
+        window = self._window_seconds
+        if isinstance(slots, range):
+            return MeterTable(
+                timestamp=now,
+                source_ids=tuple(self._source_ids),
+                damage=array("d", self._damage),
+                heal=array("d", self._heal),
+                dps=array("d", (value / window for value in self._rolling_damage)),
+                hps=array("d", (value / window for value in self._rolling_heal)),
+            )
+        return MeterTable(
+            timestamp=now,
+            source_ids=tuple(self._source_ids[slot] for slot in slots),
+            damage=array("d", (self._damage[slot] for slot in slots)),
+            heal=array("d", (self._heal[slot] for slot in slots)),
+            dps=array("d", (self._rolling_damage[slot] / window for slot in slots)),
+            hps=array("d", (self._rolling_heal[slot] / window for slot in slots)),
+        )
+
+    def _slot_for(self, source_id: int) -> int:
+        slot = self._slots.get(source_id)
+        if slot is not None:
+            return slot
+        slot = len(self._source_ids)
+        self._slots[source_id] = slot
+        self._source_ids.append(source_id)
+        self._damage.append(0.0)
+        self._heal.append(0.0)
+        self._rolling_damage.append(0.0)
+        self._rolling_heal.append(0.0)
+        # A new slot shows up in full snapshots even if no damage/heal follows.
+        self._dirty.add(slot)
+        return slot
+
+    def _expire_old(self, now: float) -> None:
+        cutoff = now - self._window_seconds
+        for slot, amount in self._damage_window.expire(cutoff):
+            self._rolling_damage[slot] = max(self._rolling_damage[slot] - amount, 0.0)
+            self._dirty.add(slot)
+        for slot, amount in self._heal_window.expire(cutoff):
+            self._rolling_heal[slot] = max(self._rolling_heal[slot] - amount, 0.0)
+            self._dirty.add(slot)
+
+    def _reset_state(self, now: float | None = None) -> None:
+        self._slots.clear()
+        self._source_ids = array("q")
+        self._damage = array("d")
+        self._heal = array("d")
+        self._rolling_damage = array("d")
+        self._rolling_heal = array("d")
+        self._damage_window.clear()
+        self._heal_window.clear()
+        self._dirty.clear()
+        self._reset_pending = True
+        self._last_event_timestamp = None
+        self._last_seen_timestamp = now
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+from array import array
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, Deque
 
 from albion_dps.meter.aggregate import RollingMeter
+from albion_dps.meter.array_meter import MeterDelta, MeterTable
+from albion_dps.meter.timeline import (
+    DEFAULT_TIMELINE_MAX_POINTS,
+    DEFAULT_TIMELINE_RESOLUTION,
+    SessionTimeline,
+    TimelineRecorder,
+)
+from albion_dps.meter.types import WindowMeter
 from albion_dps.models import CombatEvent, MeterSnapshot, PhotonMessage, RawPacket
 from albion_dps.protocol.map_index import extract_map_index
 
@@ -35,6 +44,7 @@ class SessionSummary:
     total_heal: float
     reason: str
     totals_by_id: dict[int, dict[str, float]] = field(default_factory=dict)
+    timeline: SessionTimeline | None = None
 
 
 @dataclass
@@ -45,6 +55,10 @@ class SessionMeter:
     mode: str = "battle"
     name_lookup: Callable[[int], str | None] | None = None
     map_lookup: Callable[[str], str | None] | None = None
+    bucket_seconds: float | None = None
+    meter_factory: Callable[[float], WindowMeter] | None = None
+    timeline_resolution: float = DEFAULT_TIMELINE_RESOLUTION
+    timeline_max_points: int = DEFAULT_TIMELINE_MAX_POINTS
     _history: dict[str, Deque[SessionSummary]] = field(
         default_factory=lambda: {
             "battle": deque(maxlen=10),
@@ -52,7 +66,11 @@ class SessionMeter:
             "manual": deque(maxlen=10),
         }
     )
-    _meter: RollingMeter = field(init=False)
+    _meter: WindowMeter = field(init=False)
+    # Meter the last `snapshot_delta` read from; another meter means a new session.
+    _delta_meter: WindowMeter | None = None
+    _timeline: TimelineRecorder | None = None
+    _history_version: int = 0
     _session_start: float | None = None
     _last_event_ts: float | None = None
     _last_seen_ts: float | None = None
@@ -69,7 +87,7 @@ class SessionMeter:
     _saw_combat_state: bool = False
 
     def __post_init__(self) -> None:
-        self._meter = RollingMeter(window_seconds=self.window_seconds, session_timeout_seconds=None)
+        self._meter = self._new_meter()
         for key, entries in self._history.items():
             if entries.maxlen != self.history_limit:
                 self._history[key] = deque(entries, maxlen=self.history_limit)
@@ -79,6 +97,7 @@ class SessionMeter:
             return
         self._end_session(self._last_seen_ts or self._last_event_ts or 0.0, "mode_change")
         self.mode = mode
+        self._history_version += 1
         self._manual_active = False
         self._combatants.clear()
         self._combat_end_ts = None
@@ -232,6 +251,8 @@ class SessionMeter:
             ):
                 self._last_combat_event_ts = event.timestamp
         self._meter.push(event)
+        if self._timeline is not None:
+            self._timeline.add(event.timestamp, event.source_id, event.kind, float(event.amount))
 
     def observe_combat_state(
         self, entity_id: int, in_active: bool, in_passive: bool, timestamp: float
@@ -261,6 +282,34 @@ class SessionMeter:
         now = self._last_seen_ts or self._last_event_ts
         return self._meter.snapshot(now=now)
 
+    def snapshot_delta(self) -> MeterDelta:
+        """`snapshot` as the rows touched since the previous call.
+
+        Starting or ending a session yields a ``reset`` delta. Meters from a
+        custom ``meter_factory`` without `snapshot_delta` always reset.
+        """
+        if not self._active:
+            reset = self._delta_meter is not None
+            self._delta_meter = None
+            return MeterDelta(reset=reset, changed=_table_from_totals(self._last_seen_ts or 0.0, {}))
+        meter = self._meter
+        now = self._last_seen_ts or self._last_event_ts
+        meter_delta = getattr(meter, "snapshot_delta", None)
+        if meter_delta is None:
+            self._delta_meter = meter
+            snapshot = meter.snapshot(now=now)
+            return MeterDelta(reset=True, changed=_table_from_totals(snapshot.timestamp, snapshot.totals))
+        delta = meter_delta(now=now)
+        if meter is not self._delta_meter:
+            # A fresh meter has never been drained, so its dirty rows are all of its rows.
+            self._delta_meter = meter
+            return MeterDelta(reset=True, changed=delta.changed)
+        return delta
+
+    def history_version(self) -> int:
+        """Counter bumped whenever `history()` may return something different."""
+        return self._history_version
+
     def history(self, limit: int | None = None) -> list[SessionSummary]:
         entries = list(reversed(self._history.get(self.mode, deque())))
         if limit is None or limit <= 0:
@@ -309,7 +358,9 @@ class SessionMeter:
                     total_heal=total_heal,
                     reason=summary.reason,
                     totals_by_id=totals_by_id,
+                    timeline=_timeline_with_event(summary.timeline, event),
                 )
+                self._history_version += 1
                 return True
             grouped: dict[str, tuple[float, float]] = {
                 entry.label: (entry.damage, entry.heal) for entry in summary.entries
@@ -334,7 +385,9 @@ class SessionMeter:
                 total_heal=total_heal,
                 reason=summary.reason,
                 totals_by_id=summary.totals_by_id,
+                timeline=_timeline_with_event(summary.timeline, event),
             )
+            self._history_version += 1
             return True
         return False
 
@@ -369,6 +422,7 @@ class SessionMeter:
                     total_heal=total_heal,
                     reason=summary.reason,
                     totals_by_id=summary.totals_by_id,
+                    timeline=summary.timeline,
                 )
                 continue
             grouped: dict[str, tuple[float, float]] = {}
@@ -400,7 +454,10 @@ class SessionMeter:
                 total_heal=total_heal,
                 reason=summary.reason,
                 totals_by_id=summary.totals_by_id,
+                timeline=summary.timeline,
             )
+        if changed:
+            self._history_version += 1
         return changed
 
     def manual_active(self) -> bool:
@@ -409,9 +466,23 @@ class SessionMeter:
     def zone_label(self) -> str | None:
         return self._zone_label
 
+    def _new_meter(self) -> WindowMeter:
+        if self.meter_factory is not None:
+            return self.meter_factory(self.window_seconds)
+        return RollingMeter(
+            window_seconds=self.window_seconds,
+            session_timeout_seconds=None,
+            bucket_seconds=self.bucket_seconds,
+        )
+
     def _start_session(self, timestamp: float) -> None:
-        self._meter = RollingMeter(window_seconds=self.window_seconds, session_timeout_seconds=None)
+        self._meter = self._new_meter()
         self._session_start = timestamp
+        self._timeline = TimelineRecorder(
+            timestamp,
+            resolution=self.timeline_resolution,
+            max_points=self.timeline_max_points,
+        )
         self._last_event_ts = None
         self._active = True
         self._combat_end_ts = None
@@ -433,8 +504,10 @@ class SessionMeter:
         snapshot = self._meter.snapshot(now=end_ts)
         entries = _build_entries(snapshot, duration, self.name_lookup)
         totals_by_id = _clone_totals(snapshot.totals)
+        timeline = self._timeline.freeze(end_ts) if self._timeline is not None else None
+        self._timeline = None
         if not entries:
-            self._meter = RollingMeter(window_seconds=self.window_seconds, session_timeout_seconds=None)
+            self._meter = self._new_meter()
             self._session_start = None
             self._last_event_ts = None
             self._active = False
@@ -454,6 +527,7 @@ class SessionMeter:
             total_heal=total_heal,
             reason=reason,
             totals_by_id=totals_by_id,
+            timeline=timeline,
         )
         history = self._history.setdefault(self.mode, deque(maxlen=self.history_limit))
         if self.mode == "battle" and history:
@@ -482,12 +556,16 @@ class SessionMeter:
                     total_damage=merged_total_damage,
                     total_heal=merged_total_heal,
                     reason=last.reason,
+                    timeline=_merge_timelines(
+                        last.timeline, summary.timeline, self.timeline_max_points
+                    ),
                 )
             else:
                 history.append(summary)
         else:
             history.append(summary)
-        self._meter = RollingMeter(window_seconds=self.window_seconds, session_timeout_seconds=None)
+        self._history_version += 1
+        self._meter = self._new_meter()
         self._session_start = None
         self._last_event_ts = None
         self._active = False
@@ -562,6 +640,37 @@ def _build_entries_from_totals_by_id(
     return entries
 
 
+def _timeline_with_event(
+    timeline: SessionTimeline | None, event: CombatEvent
+) -> SessionTimeline | None:
+    if timeline is None:
+        return None
+    return timeline.with_sample(event.timestamp, event.source_id, event.kind, float(event.amount))
+
+
+def _merge_timelines(
+    first: SessionTimeline | None,
+    second: SessionTimeline | None,
+    max_points: int,
+) -> SessionTimeline | None:
+    if first is None:
+        return second
+    if second is None:
+        return first
+    return first.merged(second, max_points=max_points)
+
+
+def _table_from_totals(timestamp: float, totals: dict[int, dict[str, float]]) -> MeterTable:
+    return MeterTable(
+        timestamp=timestamp,
+        source_ids=tuple(totals),
+        damage=array("d", (stats["damage"] for stats in totals.values())),
+        heal=array("d", (stats["heal"] for stats in totals.values())),
+        dps=array("d", (stats["dps"] for stats in totals.values())),
+        hps=array("d", (stats["hps"] for stats in totals.values())),
+    )
+
+
 def _clone_totals(totals: dict[int, dict[str, float]]) -> dict[int, dict[str, float]]:
     cloned: dict[int, dict[str, float]] = {}
     for source_id, stats in totals.items():
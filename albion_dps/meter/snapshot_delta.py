@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from albion_dps.meter.array_meter import MeterDelta
+from albion_dps.models import MeterSnapshot
+
+DEFAULT_KEYFRAME_INTERVAL = 30
+
+
+class NameSource(Protocol):
+    def snapshot(self) -> dict[int, str]:
+        ...
+
+    def names_version(self) -> int:
+        ...
+
+
+class DeltaMeter(Protocol):
+    def snapshot(self) -> MeterSnapshot:
+        ...
+
+    def snapshot_delta(self) -> MeterDelta:
+        ...
+
+
+class SnapshotDeltaEncoder:
+    """Turns a stream of meter snapshots into deltas with periodic keyframes."""
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self._keyframe_interval = keyframe_interval
+        self._count = 0
+        self._totals: dict[int, dict[str, float]] = {}
+        self._names: dict[int, str] = {}
+        self._names_version: int | None = None
+
+    def encode(
+        self, snapshot: MeterSnapshot, *, name_source: NameSource | None = None
+    ) -> MeterSnapshot:
+        keyframe = self._count % self._keyframe_interval == 0
+        self._count += 1
+        previous_totals = self._totals
+        self._totals = snapshot.totals
+        names, removed_names = self._encode_names(name_source, keyframe=keyframe)
+        if keyframe:
+            return MeterSnapshot(
+                timestamp=snapshot.timestamp,
+                totals=snapshot.totals,
+                names=names,
+            )
+        totals = snapshot.totals
+        return MeterSnapshot(
+            timestamp=snapshot.timestamp,
+            totals={
+                source_id: stats
+                for source_id, stats in totals.items()
+                if previous_totals.get(source_id) != stats
+            },
+            names=names,
+            keyframe=False,
+            removed=tuple(
+                source_id for source_id in previous_totals if source_id not in totals
+            ),
+            removed_names=removed_names,
+        )
+
+    def encode_meter(
+        self,
+        meter: DeltaMeter,
+        *,
+        timestamp: float,
+        name_source: NameSource | None = None,
+    ) -> MeterSnapshot:
+        """Encode the meter's current state from its own dirty rows.
+
+        Between keyframes only `meter.snapshot_delta()` is read, so no full
+        snapshot is built; a meter reset forces a keyframe.
+        """
+        delta = meter.snapshot_delta()
+        if delta.reset or self._count % self._keyframe_interval == 0:
+            self._count = 0
+            return self.encode(
+                MeterSnapshot(timestamp=timestamp, totals=meter.snapshot().totals),
+                name_source=name_source,
+            )
+        self._count += 1
+        names, removed_names = self._encode_names(name_source, keyframe=False)
+        return MeterSnapshot(
+            timestamp=timestamp,
+            totals=delta.changed.to_totals(),
+            names=names,
+            keyframe=False,
+            removed_names=removed_names,
+        )
+
+    def _encode_names(
+        self, name_source: NameSource | None, *, keyframe: bool
+    ) -> tuple[dict[int, str] | None, tuple[int, ...]]:
+        if name_source is None:
+            return None, ()
+        version = name_source.names_version()
+        if not keyframe and version == self._names_version:
+            return {}, ()
+        previous = self._names
+        current = name_source.snapshot()
+        self._names = current
+        self._names_version = version
+        if keyframe:
+            return current, ()
+        changed = {
+            entity_id: name
+            for entity_id, name in current.items()
+            if previous.get(entity_id) != name
+        }
+        removed = tuple(entity_id for entity_id in previous if entity_id not in current)
+        return changed, removed
+
+
+class SnapshotAssembler:
+    """Rebuilds full snapshots from a keyframe/delta stream.
+
+    Full snapshots pass through unchanged. For deltas the returned snapshot
+    shares the assembler's dicts, which the next `apply` updates in place.
+    `names_version` moves whenever the assembled name table changed.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[int, dict[str, float]] = {}
+        self._names: dict[int, str] | None = None
+        self._names_version = 0
+
+    @property
+    def names_version(self) -> int:
+        return self._names_version
+
+    def apply(self, snapshot: MeterSnapshot) -> MeterSnapshot:
+        if snapshot.keyframe:
+            if snapshot.names != self._names:
+                self._names_version += 1
+            self._totals = dict(snapshot.totals)
+            self._names = dict(snapshot.names) if snapshot.names is not None else None
+            return snapshot
+        for source_id in snapshot.removed:
+            self._totals.pop(source_id, None)
+        self._totals.update(snapshot.totals)
+        if snapshot.names is not None:
+            if self._names is None:
+                self._names = {}
+            if snapshot.names or snapshot.removed_names:
+                self._names_version += 1
+            for entity_id in snapshot.removed_names:
+                self._names.pop(entity_id, None)
+            self._names.update(snapshot.names)
+        return MeterSnapshot(timestamp=snapshot.timestamp, totals=self._totals, names=self._names)
+
+
+def merge_snapshots(older: MeterSnapshot, newer: MeterSnapshot) -> MeterSnapshot:
+    """Collapse two consecutive snapshots into one that applies to the same base."""
+    if newer.keyframe:
+        return newer
+    totals = dict(older.totals)
+    for source_id in newer.removed:
+        totals.pop(source_id, None)
+    totals.update(newer.totals)
+    names = older.names
+    if newer.names is not None:
+        names = dict(older.names or {})
+        for entity_id in newer.removed_names:
+            names.pop(entity_id, None)
+        names.update(newer.names)
+    if older.keyframe:
+        return MeterSnapshot(timestamp=newer.timestamp, totals=totals, names=names)
+    return MeterSnapshot(
+        timestamp=newer.timestamp,
+        totals=totals,
+        names=names,
+        keyframe=False,
+        removed=_merge_removed(older.removed, newer.removed, totals),
+        removed_names=_merge_removed(older.removed_names, newer.removed_names, names or {}),
+    )
+
+
+def _merge_removed(
+    older: tuple[int, ...], newer: tuple[int, ...], present: dict[int, object]
+) -> tuple[int, ...]:
+    merged = dict.fromkeys(older)
+    merged.update(dict.fromkeys(newer))
+    return tuple(key for key in merged if key not in present)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+
+DEFAULT_TIMELINE_RESOLUTION = 1.0
+DEFAULT_TIMELINE_MAX_POINTS = 600
+
+
+@dataclass(frozen=True)
+class SourceTimeline:
+    damage: array
+    heal: array
+
+
+@dataclass(frozen=True)
+class SessionTimeline:
+    """Per-source damage/heal sums in fixed-width bins starting at ``start_ts``."""
+
+    start_ts: float
+    resolution: float
+    points: int
+    sources: dict[int, SourceTimeline] = field(default_factory=dict)
+
+    def timestamps(self) -> list[float]:
+        return [self.start_ts + idx * self.resolution for idx in range(self.points)]
+
+    def dps_series(self, source_id: int) -> list[float]:
+        source = self.sources.get(source_id)
+        if source is None:
+            return [0.0] * self.points
+        return [value / self.resolution for value in source.damage]
+
+    def hps_series(self, source_id: int) -> list[float]:
+        source = self.sources.get(source_id)
+        if source is None:
+            return [0.0] * self.points
+        return [value / self.resolution for value in source.heal]
+
+    def with_sample(
+        self, timestamp: float, source_id: int, kind: str, amount: float
+    ) -> "SessionTimeline":
+        if self.points <= 0 or kind not in ("damage", "heal"):
+            return self
+        index = int(math.floor(max(timestamp - self.start_ts, 0.0) / self.resolution))
+        index = min(index, self.points - 1)
+        current = self.sources.get(source_id)
+        damage = array("d", current.damage) if current else array("d", bytes(8 * self.points))
+        heal = array("d", current.heal) if current else array("d", bytes(8 * self.points))
+        (damage if kind == "damage" else heal)[index] += amount
+        sources = dict(self.sources)
+        sources[source_id] = SourceTimeline(damage=damage, heal=heal)
+        return SessionTimeline(
+            start_ts=self.start_ts,
+            resolution=self.resolution,
+            points=self.points,
+            sources=sources,
+        )
+
+    def merged(
+        self, other: "SessionTimeline", *, max_points: int = DEFAULT_TIMELINE_MAX_POINTS
+    ) -> "SessionTimeline":
+        start_ts = min(self.start_ts, other.start_ts)
+        recorder = TimelineRecorder(
+            start_ts,
+            resolution=max(self.resolution, other.resolution),
+            max_points=max_points,
+        )
+        for timeline in (self, other):
+            for source_id, source in timeline.sources.items():
+                for idx in range(len(source.damage)):
+                    ts = timeline.start_ts + idx * timeline.resolution
+                    if source.damage[idx]:
+                        recorder.add(ts, source_id, "damage", source.damage[idx])
+                    if source.heal[idx]:
+                        recorder.add(ts, source_id, "heal", source.heal[idx])
+        end_ts = max(
+            self.start_ts + self.points * self.resolution,
+            other.start_ts + other.points * other.resolution,
+        )
+        return recorder.freeze(end_ts)
+
+
+class TimelineRecorder:
+    """Records per-source damage/heal time series for one session.
+
+    Samples are summed into bins of ``resolution`` seconds. When a session
+    outgrows ``max_points`` bins, adjacent bins are merged pairwise and the
+    resolution doubles, so memory stays bounded at ``max_points`` doubles per
+    source and series however long the session runs.
+    """
+
+    def __init__(
+        self,
+        start_ts: float,
+        *,
+        resolution: float = DEFAULT_TIMELINE_RESOLUTION,
+        max_points: int = DEFAULT_TIMELINE_MAX_POINTS,
+    ) -> None:
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        self._start_ts = start_ts
+        self._resolution = resolution
+        self._max_points = max_points
+        self._points = 0
+        self._damage: dict[int, array] = {}
+        self._heal: dict[int, array] = {}
+
+    @property
+    def resolution(self) -> float:
+        return self._resolution
+
+    def add(self, timestamp: float, source_id: int, kind: str, amount: float) -> None:
+        if kind == "damage":
+            series = self._damage
+        elif kind == "heal":
+            series = self._heal
+        else:
+            return
+        index = self._index_for(timestamp)
+        values = series.get(source_id)
+        if values is None:
+            values = array("d", bytes(8 * self._points))
+            series[source_id] = values
+            other = self._heal if series is self._damage else self._damage
+            other.setdefault(source_id, array("d", bytes(8 * self._points)))
+        values[index] += amount
+
+    def freeze(self, end_ts: float | None = None) -> SessionTimeline:
+        if end_ts is not None:
+            self._index_for(end_ts, grow_only=True)
+        return SessionTimeline(
+            start_ts=self._start_ts,
+            resolution=self._resolution,
+            points=self._points,
+            sources={
+                source_id: SourceTimeline(
+                    damage=array("d", self._damage[source_id]),
+                    heal=array("d", self._heal[source_id]),
+                )
+                for source_id in self._damage
+            },
+        )
+
+    def _index_for(self, timestamp: float, *, grow_only: bool = False) -> int:
+        offset = max(timestamp - self._start_ts, 0.0)
+        index = int(math.floor(offset / self._resolution))
+        while index >= self._max_points:
+            self._downsample()
+            index = int(math.floor(offset / self._resolution))
+        if grow_only:
+            # An end timestamp exactly on a bin edge does not open a new bin.
+            index = max(int(math.ceil(offset / self._resolution)) - 1, 0)
+        if index >= self._points:
+            grow = index + 1 - self._points
+            padding = bytes(8 * grow)
+            for values in self._damage.values():
+                values.frombytes(padding)
+            for values in self._heal.values():
+                values.frombytes(padding)
+            self._points = index + 1
+        return index
+
+    def _downsample(self) -> None:
+        self._resolution *= 2.0
+        self._points = (self._points + 1) // 2
+        for series in (self._damage, self._heal):
+            for source_id, values in series.items():
+                merged = array(
+                    "d",
+                    (
+                        values[idx] + (values[idx + 1] if idx + 1 < len(values) else 0.0)
+                        for idx in range(0, len(values), 2)
+                    ),
+                )
+                series[source_id] = merged
@@ -11,3 +11,11 @@ class Meter(Protocol):
 
     def snapshot(self) -> MeterSnapshot:
         ...
+
+
+class WindowMeter(Meter, Protocol):
+    def touch(self, timestamp: float) -> None:
+        ...
+
+    def snapshot(self, now: float | None = None) -> MeterSnapshot:
+        ...
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import bisect
+import math
+from collections import deque
+from collections.abc import Hashable, Iterator
+from typing import Protocol
+
+
+class RollingWindow(Protocol):
+    def add(self, timestamp: float, key: Hashable, amount: float) -> bool:
+        ...
+
+    def expire(self, cutoff: float) -> Iterator[tuple[Hashable, float]]:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class EventWindow:
+    """Exact rolling window: keeps one entry per event.
+
+    Memory and expiry work grow with the event rate.
+    """
+
+    def __init__(self) -> None:
+        self._events: deque[tuple[float, Hashable, float]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, timestamp: float, key: Hashable, amount: float) -> bool:
+        self._events.append((timestamp, key, amount))
+        return True
+
+    def expire(self, cutoff: float) -> Iterator[tuple[Hashable, float]]:
+        events = self._events
+        while events and events[0][0] < cutoff:
+            _ts, key, amount = events.popleft()
+            yield key, amount
+
+    def clear(self) -> None:
+        self._events.clear()
+
+
+class BucketWindow:
+    """Rolling window over fixed-width time buckets."""
+
+    def __init__(self, bucket_seconds: float) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self._bucket_seconds = bucket_seconds
+        self._indices: list[int] = []
+        self._buckets: dict[int, dict[Hashable, float]] = {}
+        self._expired_before: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def add(self, timestamp: float, key: Hashable, amount: float) -> bool:
+        index = math.floor(timestamp / self._bucket_seconds)
+        if self._expired_before is not None and index < self._expired_before:
+            return False
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            bucket = {}
+            self._buckets[index] = bucket
+            if not self._indices or index > self._indices[-1]:
+                self._indices.append(index)
+            else:
+                bisect.insort(self._indices, index)
+        bucket[key] = bucket.get(key, 0.0) + amount
+        return True
+
+    def expire(self, cutoff: float) -> Iterator[tuple[Hashable, float]]:
+        # Bucket ``i`` covers [i * width, (i + 1) * width); it expires once its
+        # end is at or before the cutoff, so a hit can outlive the exact
+        # window by up to one bucket width.
+        limit = math.floor(cutoff / self._bucket_seconds)
+        if self._expired_before is None or limit > self._expired_before:
+            self._expired_before = limit
+        indices = self._indices
+        while indices and indices[0] < limit:
+            bucket = self._buckets.pop(indices.pop(0))
+            yield from bucket.items()
+
+    def clear(self) -> None:
+        self._indices.clear()
+        self._buckets.clear()
+        self._expired_before = None
+
+
+def make_window(bucket_seconds: float | None) -> RollingWindow:
+    if bucket_seconds is None:
+        return EventWindow()
+    return BucketWindow(bucket_seconds)
@@ -31,6 +31,16 @@ class CombatEvent:
 
 @dataclass(frozen=True)
 class MeterSnapshot:
+    """Meter state at ``timestamp``.
+
+    A keyframe carries every source and name. A delta (``keyframe=False``)
+    carries only sources and names that changed since the previous snapshot,
+    plus the ids that disappeared in ``removed``/``removed_names``.
+    """
+
     timestamp: float
     totals: dict[int, dict[str, float]]
     names: dict[int, str] | None = None
+    keyframe: bool = True
+    removed: tuple[int, ...] = ()
+    removed_names: tuple[int, ...] = ()
@@ -6,6 +6,7 @@ from typing import Callable
 
 from albion_dps.capture.live_capture import live_capture
 from albion_dps.capture.replay_pcap import replay_pcap
+from albion_dps.meter.snapshot_delta import SnapshotDeltaEncoder
 from albion_dps.meter.types import Meter
 from albion_dps.models import CombatEvent, MeterSnapshot, PhotonMessage, RawPacket
 from albion_dps.domain.fame_tracker import FameTracker
@@ -35,6 +36,7 @@ def replay_snapshots(
     fame_tracker: FameTracker | None = None,
     event_mapper: EventMapper | None = None,
     snapshot_interval: float = 1.0,
+    keyframe_interval: int | None = None,
 ) -> Iterator[MeterSnapshot]:
     return stream_snapshots(
         replay_pcap(path),
@@ -45,6 +47,7 @@ def replay_snapshots(
         fame_tracker=fame_tracker,
         event_mapper=event_mapper,
         snapshot_interval=snapshot_interval,
+        keyframe_interval=keyframe_interval,
     )
 
 
@@ -63,6 +66,7 @@ def live_snapshots(
     fame_tracker: FameTracker | None = None,
     event_mapper: EventMapper | None = None,
     snapshot_interval: float = 1.0,
+    keyframe_interval: int | None = None,
 ) -> Iterator[MeterSnapshot]:
     def packet_iter() -> Iterator[RawPacket]:
         yield from live_capture(
@@ -83,6 +87,7 @@ def live_snapshots(
         fame_tracker=fame_tracker,
         event_mapper=event_mapper,
         snapshot_interval=snapshot_interval,
+        keyframe_interval=keyframe_interval,
     )
 
 
@@ -96,8 +101,16 @@ def stream_snapshots(
     fame_tracker: FameTracker | None = None,
     event_mapper: EventMapper | None = None,
     snapshot_interval: float = 1.0,
+    keyframe_interval: int | None = None,
 ) -> Iterator[MeterSnapshot]:
+    """Decode packets into meter snapshots every ``snapshot_interval`` seconds.
+
+    With ``keyframe_interval`` set, snapshots are emitted as deltas (see
+    `SnapshotDeltaEncoder`) with a full keyframe every ``keyframe_interval``
+    snapshots; otherwise every snapshot is full.
+    """
     mapper = event_mapper or CombatEventMapper().map
+    encoder = SnapshotDeltaEncoder(keyframe_interval) if keyframe_interval else None
     last_emit: float | None = None
     last_timestamp: float | None = None
     pending_events: list[CombatEvent] = []
@@ -249,9 +262,7 @@ def stream_snapshots(
                 pass
 
         if last_emit is None or snapshot_interval <= 0 or packet.timestamp - last_emit >= snapshot_interval:
-            snapshot = meter.snapshot()
-            names = name_registry.snapshot() if name_registry is not None else None
-            yield MeterSnapshot(timestamp=packet.timestamp, totals=snapshot.totals, names=names)
+            yield _build_snapshot(packet.timestamp, meter, name_registry, encoder)
             last_emit = packet.timestamp
 
     if hasattr(meter, "finalize"):
@@ -260,15 +271,30 @@ def stream_snapshots(
         except TypeError:
             pass
         fallback_ts = last_timestamp or 0.0
-        snapshot = meter.snapshot()
-        names = name_registry.snapshot() if name_registry is not None else None
-        yield MeterSnapshot(timestamp=fallback_ts, totals=snapshot.totals, names=names)
+        yield _build_snapshot(fallback_ts, meter, name_registry, encoder)
         return
 
     if last_emit is None:
         fallback_ts = last_timestamp or 0.0
-        names = name_registry.snapshot() if name_registry is not None else None
-        yield MeterSnapshot(timestamp=fallback_ts, totals={}, names=names)
+        yield _build_snapshot(fallback_ts, None, name_registry, encoder)
+
+
+def _build_snapshot(
+    timestamp: float,
+    meter: Meter | None,
+    name_registry: NameRegistry | None,
+    encoder: SnapshotDeltaEncoder | None,
+) -> MeterSnapshot:
+    if encoder is not None and meter is not None and hasattr(meter, "snapshot_delta"):
+        return encoder.encode_meter(meter, timestamp=timestamp, name_source=name_registry)
+    totals = meter.snapshot().totals if meter is not None else {}
+    if encoder is not None:
+        return encoder.encode(
+            MeterSnapshot(timestamp=timestamp, totals=totals),
+            name_source=name_registry,
+        )
+    names = name_registry.snapshot() if name_registry is not None else None
+    return MeterSnapshot(timestamp=timestamp, totals=totals, names=names)
 
 
 def _null_event_mapper(_message: PhotonMessage, _packet: RawPacket) -> CombatEvent | None:
@@ -6,27 +6,45 @@ import json
 import logging
 import math
 import re
+import threading
 import time
 from math import ceil
 from functools import lru_cache
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib.parse import urlencode
 
-from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Property, Qt, QTimer, Signal, Slot
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    Property,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 
 from albion_dps.market.aod_client import MarketPriceRecord, REGION_HOSTS
 from albion_dps.market.catalog import RecipeCatalog
 from albion_dps.market.engine import (
+    CompiledCatalog,
+    RecipeProfitRow,
+    SCAN_SORT_KEYS,
     build_craft_run,
-    compute_batch_profit,
+    compile_catalog,
     compute_output_valuations,
     compute_run_profit,
     effective_return_fraction,
+    scan_catalog_profits,
+    sum_profit_breakdowns,
 )
 from albion_dps.market.models import (
+    CraftRun,
     CraftSetup,
     InputLine,
     ItemRef,
@@ -36,10 +54,21 @@ from albion_dps.market.models import (
     Recipe,
 )
 from albion_dps.market.planner import build_selling_entries, build_shopping_entries
-from albion_dps.market.service import MarketDataService
+from albion_dps.market.prefetch import PrefetchProgress, prefetch_prices
+from albion_dps.market.price_index import PriceIndex, item_id_candidates
+from albion_dps.market.service import DEFAULT_PRICE_TTL_SECONDS, MarketDataService, MarketFetchMeta
 from albion_dps.market.setup import sanitized_setup, validate_setup
 
 _SHOPPING_SAFETY_BUFFER_PERCENT = 2.0
+# Preview dirty flags. Setup, plan and price changes re-resolve the price index;
+# preference edits (price types, manual prices, stock, output cities) reuse it;
+# a results-only change just re-sorts the results table.
+_DIRTY_SETUP = "setup"
+_DIRTY_PLAN = "plan"
+_DIRTY_PRICES = "prices"
+_DIRTY_PREFERENCES = "preferences"
+_DIRTY_RESULTS = "results"
+_PRICE_STAGE_DIRTY = frozenset({_DIRTY_SETUP, _DIRTY_PLAN, _DIRTY_PRICES})
 _JOURNAL_NPC_EMPTY_PRICES: dict[int, int] = {
     2: 500,
     3: 1000,
@@ -499,6 +528,108 @@ class MarketBreakdownModel(QAbstractListModel):
         self.endResetModel()
 
 
+@dataclass(frozen=True)
+class ProfitScanRow:
+    recipe_id: str
+    item: str
+    tier: int
+    enchant: int
+    city: str
+    quality: int
+    input_cost: float
+    return_savings: float
+    output_value: float
+    station_fee: float
+    market_tax: float
+    profit: float
+    margin_percent: float
+    silver_per_focus: float
+
+
+class MarketProfitScanModel(QAbstractListModel):
+    RecipeIdRole = Qt.UserRole + 1
+    ItemRole = Qt.UserRole + 2
+    TierRole = Qt.UserRole + 3
+    EnchantRole = Qt.UserRole + 4
+    CityRole = Qt.UserRole + 5
+    QualityRole = Qt.UserRole + 6
+    CostRole = Qt.UserRole + 7
+    ReturnSavingsRole = Qt.UserRole + 8
+    RevenueRole = Qt.UserRole + 9
+    FeeRole = Qt.UserRole + 10
+    TaxRole = Qt.UserRole + 11
+    ProfitRole = Qt.UserRole + 12
+    MarginRole = Qt.UserRole + 13
+    SilverPerFocusRole = Qt.UserRole + 14
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._items: list[ProfitScanRow] = []
+
+    def rowCount(self, _parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < 0 or row >= len(self._items):
+            return None
+        item = self._items[row]
+        if role == self.RecipeIdRole:
+            return item.recipe_id
+        if role == self.ItemRole:
+            return item.item
+        if role == self.TierRole:
+            return item.tier
+        if role == self.EnchantRole:
+            return item.enchant
+        if role == self.CityRole:
+            return item.city
+        if role == self.QualityRole:
+            return item.quality
+        if role == self.CostRole:
+            return item.input_cost
+        if role == self.ReturnSavingsRole:
+            return item.return_savings
+        if role == self.RevenueRole:
+            return item.output_value
+        if role == self.FeeRole:
+            return item.station_fee
+        if role == self.TaxRole:
+            return item.market_tax
+        if role == self.ProfitRole:
+            return item.profit
+        if role == self.MarginRole:
+            return item.margin_percent
+        if role == self.SilverPerFocusRole:
+            return item.silver_per_focus
+        return None
+
+    def roleNames(self) -> dict[int, bytes]:  # type: ignore[override]
+        return {
+            self.RecipeIdRole: b"recipeId",
+            self.ItemRole: b"item",
+            self.TierRole: b"tier",
+            self.EnchantRole: b"enchant",
+            self.CityRole: b"city",
+            self.QualityRole: b"quality",
+            self.CostRole: b"cost",
+            self.ReturnSavingsRole: b"returnSavings",
+            self.RevenueRole: b"revenue",
+            self.FeeRole: b"feeValue",
+            self.TaxRole: b"taxValue",
+            self.ProfitRole: b"profit",
+            self.MarginRole: b"marginPercent",
+            self.SilverPerFocusRole: b"silverPerFocus",
+        }
+
+    def set_items(self, rows: list[ProfitScanRow]) -> None:
+        self.beginResetModel()
+        self._items = list(rows)
+        self.endResetModel()
+
+
 @dataclass(frozen=True)
 class RecipeOptionRow:
     recipe_id: str
@@ -539,6 +670,7 @@ class _JournalTotals:
 _RECIPE_TIER_ENCHANT_RE = re.compile(r"\b(?:t)?(?P<tier>[1-8])(?:[.\-\/](?P<ench>[0-4]))?\b", re.IGNORECASE)
 _TIER_PREFIX_RE = re.compile(r"^T(?P<tier>\d+)_(?P<rest>.+)$", re.IGNORECASE)
 _LEVEL_SUFFIX_RE = re.compile(r"_LEVEL\d+$", re.IGNORECASE)
+_SEARCH_WORD_SPLIT_RE = re.compile(r"[^a-z0-9]+")
 
 _ITEM_ID_WORD_ALIASES: dict[str, str] = {
     "ARTEFACT": "Artifact",
@@ -555,6 +687,88 @@ _ITEM_ID_WORD_ALIASES: dict[str, str] = {
 }
 
 
+class _RecipeSearchIndex:
+    """Trigram/tier/enchant index matching every term as a substring of name + recipe id."""
+
+    def __init__(self, rows: list[RecipeOptionRow]) -> None:
+        self._rows = list(rows)
+        self._haystacks = [f"{row.display_name} {row.recipe_id}".lower() for row in self._rows]
+        self._names = [row.display_name.lower() for row in self._rows]
+        self._ids = [row.recipe_id.lower() for row in self._rows]
+        self._words = [tuple(word for word in _SEARCH_WORD_SPLIT_RE.split(text) if word) for text in self._haystacks]
+        self._trigrams: dict[str, set[int]] = {}
+        self._by_tier: dict[int, set[int]] = {}
+        self._by_enchant: dict[int, set[int]] = {}
+        for idx, (row, haystack) in enumerate(zip(self._rows, self._haystacks)):
+            for gram in _trigrams(haystack):
+                self._trigrams.setdefault(gram, set()).add(idx)
+            self._by_tier.setdefault(int(row.tier or 0), set()).add(idx)
+            self._by_enchant.setdefault(int(row.enchant or 0), set()).add(idx)
+        self._last: tuple[RecipeFilter, int | None, list[int]] | None = None
+
+    def search(self, recipe_filter: RecipeFilter, *, enchant: int | None = None) -> list[RecipeOptionRow]:
+        if not recipe_filter.terms and recipe_filter.tier is None and recipe_filter.enchant is None and enchant is None:
+            self._last = None
+            return list(self._rows)
+        matches = self._match(recipe_filter, enchant)
+        self._last = (recipe_filter, enchant, matches)
+        if recipe_filter.terms:
+            matches = sorted(matches, key=lambda idx: (self._rank(idx, recipe_filter.terms), idx))
+        return [self._rows[idx] for idx in matches]
+
+    def _match(self, recipe_filter: RecipeFilter, enchant: int | None) -> list[int]:
+        candidates: set[int] | None = None
+        if self._last is not None and _narrows(self._last[0], self._last[1], recipe_filter, enchant):
+            candidates = set(self._last[2])
+        for postings in self._postings(recipe_filter, enchant):
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                return []
+        indices = range(len(self._rows)) if candidates is None else sorted(candidates)
+        terms = recipe_filter.terms
+        return [idx for idx in indices if all(term in self._haystacks[idx] for term in terms)]
+
+    def _postings(self, recipe_filter: RecipeFilter, enchant: int | None) -> list[set[int]]:
+        postings: list[set[int]] = []
+        if recipe_filter.tier is not None:
+            postings.append(self._by_tier.get(int(recipe_filter.tier), set()))
+        for value in (recipe_filter.enchant, enchant):
+            if value is not None:
+                postings.append(self._by_enchant.get(int(value), set()))
+        for term in recipe_filter.terms:
+            postings.extend(self._trigrams.get(gram, set()) for gram in _trigrams(term))
+        postings.sort(key=len)
+        return postings
+
+    def _rank(self, idx: int, terms: tuple[str, ...]) -> int:
+        first = terms[0]
+        if self._names[idx].startswith(first) or self._ids[idx].startswith(first):
+            return 0
+        words = self._words[idx]
+        if all(any(word.startswith(term) for word in words) for term in terms):
+            return 1
+        return 2
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[idx : idx + 3] for idx in range(len(text) - 2)}
+
+
+def _narrows(
+    previous: RecipeFilter,
+    previous_enchant: int | None,
+    current: RecipeFilter,
+    enchant: int | None,
+) -> bool:
+    """True when every row matching `current` also matched `previous`."""
+    for old, new in ((previous.tier, current.tier), (previous.enchant, current.enchant), (previous_enchant, enchant)):
+        if old is not None and old != new:
+            return False
+    if len(current.terms) < len(previous.terms):
+        return False
+    return all(old in new for old, new in zip(previous.terms, current.terms))
+
+
 class RecipeOptionsModel(QAbstractListModel):
     RecipeIdRole = Qt.UserRole + 1
     DisplayNameRole = Qt.UserRole + 2
@@ -565,6 +779,7 @@ class RecipeOptionsModel(QAbstractListModel):
         super().__init__()
         self._all_items: list[RecipeOptionRow] = []
         self._items: list[RecipeOptionRow] = []
+        self._search_index = _RecipeSearchIndex([])
         self._filter = RecipeFilter(terms=(), tier=None, enchant=None)
         self._enchant_filter: int | None = None
 
@@ -598,6 +813,7 @@ class RecipeOptionsModel(QAbstractListModel):
 
     def set_items(self, rows: list[RecipeOptionRow]) -> None:
         self._all_items = list(rows)
+        self._search_index = _RecipeSearchIndex(self._all_items)
         self._apply_filter()
 
     def set_query(self, query: str) -> None:
@@ -617,13 +833,9 @@ class RecipeOptionsModel(QAbstractListModel):
         self._apply_filter()
 
     def _apply_filter(self) -> None:
-        rows = self._all_items
-        if self._filter.terms or self._filter.tier is not None or self._filter.enchant is not None:
-            rows = [row for row in rows if _matches_recipe_filter(row, self._filter)]
-        if self._enchant_filter is not None:
-            rows = [row for row in rows if int(row.enchant) == int(self._enchant_filter)]
+        rows = self._search_index.search(self._filter, enchant=self._enchant_filter)
         self.beginResetModel()
-        self._items = list(rows)
+        self._items = rows
         self.endResetModel()
 
     def recipe_id_at(self, index: int) -> str | None:
@@ -728,6 +940,126 @@ class CraftPlanModel(QAbstractListModel):
         self.endResetModel()
 
 
+class _CraftRunCache:
+    """Per-plan-row `CraftRun`/`ProfitBreakdown` reused across preview rebuilds.
+
+    An entry is keyed by plan row id and stamped with everything that feeds
+    `build_craft_run` for that row: recipe id, runs, row setup, price-index
+    version and the price preferences of the recipe's own items. Rows whose
+    stamp still matches (and whose recipe is the same object) are reused.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[tuple[object, ...], Recipe, CraftRun, ProfitBreakdown]] = {}
+
+    def get(self, row_id: int, stamp: tuple[object, ...], recipe: Recipe) -> tuple[CraftRun, ProfitBreakdown] | None:
+        entry = self._entries.get(row_id)
+        if entry is None or entry[0] != stamp or entry[1] is not recipe:
+            return None
+        return entry[2], entry[3]
+
+    def store(
+        self,
+        row_id: int,
+        stamp: tuple[object, ...],
+        recipe: Recipe,
+        run: CraftRun,
+        breakdown: ProfitBreakdown,
+    ) -> None:
+        self._entries[row_id] = (stamp, recipe, run, breakdown)
+
+    def retain(self, row_ids: set[int]) -> None:
+        for row_id in [row_id for row_id in self._entries if row_id not in row_ids]:
+            del self._entries[row_id]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _PriceFetchSignals(QObject):
+    finished = Signal(int, object, object, object)
+
+
+class _PriceFetchTask(QRunnable):
+    """Runs one price fetch off the GUI thread and reports back via a queued signal."""
+
+    def __init__(
+        self,
+        request_id: int,
+        fetch: Callable[[], tuple[dict[tuple[str, str, int], MarketPriceRecord], MarketFetchMeta]],
+        signals: _PriceFetchSignals,
+        cancelled: threading.Event,
+    ) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._fetch = fetch
+        self._signals = signals
+        self._cancelled = cancelled
+
+    def run(self) -> None:
+        if self._cancelled.is_set():
+            return
+        try:
+            index, meta = self._fetch()
+        except Exception as exc:
+            self._signals.finished.emit(self._request_id, None, None, exc)
+            return
+        self._signals.finished.emit(self._request_id, index, meta, None)
+
+
+class _PricePrefetchSignals(QObject):
+    progress = Signal(int, object)
+
+
+class _PricePrefetchTask(QRunnable):
+    """Walks a price prefetch off the GUI thread, reporting progress per chunk."""
+
+    def __init__(
+        self,
+        request_id: int,
+        prefetch: Callable[[Callable[[PrefetchProgress], None]], PrefetchProgress],
+        signals: _PricePrefetchSignals,
+    ) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._prefetch = prefetch
+        self._signals = signals
+
+    def run(self) -> None:
+        self._prefetch(lambda progress: self._signals.progress.emit(self._request_id, progress))
+
+
+PREFETCH_SCOPES = ("catalog", "presets")
+PROFIT_SCAN_LIMIT = 100
+
+
+class _ProfitScanSignals(QObject):
+    finished = Signal(int, object, object)
+
+
+class _ProfitScanTask(QRunnable):
+    """Runs one catalog profit scan off the GUI thread."""
+
+    def __init__(
+        self,
+        request_id: int,
+        scan: Callable[[], list[RecipeProfitRow]],
+        signals: _ProfitScanSignals,
+    ) -> None:
+        super().__init__()
+        self._request_id = request_id
+        self._scan = scan
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            rows = self._scan()
+        except Exception as exc:
+            self._signals.finished.emit(self._request_id, None, exc)
+            return
+        self._signals.finished.emit(self._request_id, rows, None)
+
+
 class MarketSetupState(QObject):
     setupChanged = Signal()
     validationChanged = Signal()
@@ -738,6 +1070,8 @@ class MarketSetupState(QObject):
     listsChanged = Signal()
     resultsDetailsChanged = Signal()
     diagnosticsChanged = Signal()
+    prefetchChanged = Signal()
+    profitScanChanged = Signal()
 
     def __init__(
         self,
@@ -746,9 +1080,26 @@ class MarketSetupState(QObject):
         logger: logging.Logger | None = None,
         auto_refresh_prices: bool = True,
         recipe_id: str = "T4_MAIN_SWORD",
+        background_price_fetch: bool = False,
+        preview_debounce_ms: int = 0,
+        prefetch_scope: str | None = None,
+        prefetch_delay_ms: int = 5000,
     ) -> None:
         super().__init__()
         self._service = service
+        # With background_price_fetch, AO Data requests run on a one-thread pool
+        # and the preview renders from cache/fallback prices until they land.
+        self._price_pool: QThreadPool | None = None
+        self._price_fetch_signals = _PriceFetchSignals(self)
+        self._price_fetch_signals.finished.connect(self._on_price_fetch_finished)
+        self._price_fetch_seq = 0
+        self._price_fetch_cancel: threading.Event | None = None
+        self._price_fetch_context: (
+            tuple[CraftSetup, tuple[str, int, tuple[str, ...], tuple[str, ...]], bool] | None
+        ) = None
+        if background_price_fetch:
+            self._price_pool = QThreadPool(self)
+            self._price_pool.setMaxThreadCount(1)
         self._log = logger or logging.getLogger(__name__)
         self._setup = CraftSetup(
             region=MarketRegion.EUROPE,
@@ -816,6 +1167,49 @@ class MarketSetupState(QObject):
         self._refresh_cooldown_tick_timer = QTimer(self)
         self._refresh_cooldown_tick_timer.setInterval(1000)
         self._refresh_cooldown_tick_timer.timeout.connect(self._on_refresh_cooldown_tick)
+        # Edits only mark stages dirty; with preview_debounce_ms > 0 a burst of
+        # edits is coalesced into one rebuild when the single-shot timer fires.
+        self._preview_debounce_ms = max(0, int(preview_debounce_ms))
+        self._preview_dirty: set[str] = set()
+        self._preview_force_price_refresh = False
+        self._preview_price_index: dict[tuple[str, str, int], MarketPriceRecord] | None = None
+        self._preview_output_rows: list[OutputPreviewRow] = []
+        self._preview_price_index_version = 0
+        self._craft_run_cache = _CraftRunCache()
+        # Indexed views of the last price dicts used (preview and current); the
+        # dicts are replaced, never mutated, so identity is a valid cache key.
+        self._quote_indexes: list[tuple[dict[tuple[str, str, int], MarketPriceRecord], PriceIndex]] = []
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._flush_preview)
+        # Idle-time cache warming: one worker walks the catalog (or preset
+        # recipes) through the service and pauses while a foreground fetch runs.
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        self._prefetch_signals = _PricePrefetchSignals(self)
+        self._prefetch_signals.progress.connect(self._on_prefetch_progress)
+        self._prefetch_seq = 0
+        self._prefetch_cancel: threading.Event | None = None
+        self._prefetch_idle = threading.Event()
+        self._prefetch_idle.set()
+        self._prefetch_scope = ""
+        self._prefetch_progress: PrefetchProgress | None = None
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        # Catalog profit scan: compiled once, evaluated from cached prices on its own worker.
+        self._profit_scan_model = MarketProfitScanModel()
+        self._profit_scan_pool = QThreadPool(self)
+        self._profit_scan_pool.setMaxThreadCount(1)
+        self._profit_scan_signals = _ProfitScanSignals(self)
+        self._profit_scan_signals.finished.connect(self._on_profit_scan_finished)
+        self._profit_scan_seq = 0
+        self._profit_scan_running = False
+        self._profit_scan_sort_key = "margin"
+        self._profit_scan_status_text = ""
+        self._compiled_catalog: CompiledCatalog | None = None
+        if prefetch_scope and self._service is not None:
+            self._prefetch_timer.timeout.connect(lambda: self.startPricePrefetch(prefetch_scope))
+            self._prefetch_timer.start(max(0, int(prefetch_delay_ms)))
         self._ensure_price_preferences_for_recipe(self._recipe)
         if auto_refresh_prices and self._service is not None:
             self._refresh_price_index(self.to_setup(), force=True)
@@ -991,6 +1385,22 @@ class MarketSetupState(QObject):
     def breakdownModel(self) -> QObject:
         return self._breakdown_model
 
+    @Property(QObject, constant=True)
+    def profitScanModel(self) -> QObject:
+        return self._profit_scan_model
+
+    @Property(str, notify=profitScanChanged)
+    def profitScanSortKey(self) -> str:
+        return self._profit_scan_sort_key
+
+    @Property(bool, notify=profitScanChanged)
+    def profitScanRunning(self) -> bool:
+        return self._profit_scan_running
+
+    @Property(str, notify=profitScanChanged)
+    def profitScanStatusText(self) -> str:
+        return self._profit_scan_status_text
+
     @Property(str, notify=listsChanged)
     def shoppingCsv(self) -> str:
         return self._shopping_csv
@@ -1007,6 +1417,29 @@ class MarketSetupState(QObject):
     def diagnosticsText(self) -> str:
         return "\n".join(self._diagnostics_lines)
 
+    @Property(bool, notify=prefetchChanged)
+    def prefetchActive(self) -> bool:
+        return self._prefetch_cancel is not None
+
+    @Property(str, notify=prefetchChanged)
+    def prefetchStatusText(self) -> str:
+        progress = self._prefetch_progress
+        if progress is None:
+            return ""
+        if progress.cancelled:
+            state = "cancelled"
+        elif progress.finished:
+            state = "done"
+        else:
+            state = "warming"
+        text = (
+            f"Price cache {state} ({self._prefetch_scope}): {progress.done_items}/{progress.total_items} items, "
+            f"{progress.fetched_keys} fetched, {progress.cached_keys} cached"
+        )
+        if progress.failed_chunks:
+            text += f", {progress.failed_chunks} failed"
+        return text
+
     @Property(str, notify=resultsDetailsChanged)
     def resultsSortKey(self) -> str:
         return self._results_sort_key
@@ -1105,7 +1538,7 @@ class MarketSetupState(QObject):
             return
         self._active_market_tab_index = normalized
         if self._active_market_tab_index >= 1:
-            self._rebuild_preview(force_price_refresh=False)
+            self._mark_preview_dirty(_DIRTY_PRICES)
 
     @Slot(int)
     def setRecipeIndex(self, index: int) -> None:
@@ -1126,7 +1559,7 @@ class MarketSetupState(QObject):
         plan_row = self._find_plan_row_by_recipe(self._recipe.item.unique_name)
         if plan_row is not None:
             self._craft_runs = max(1, int(plan_row.runs))
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1228,7 +1661,7 @@ class MarketSetupState(QObject):
         if active_row is not None:
             self._craft_runs = max(1, int(active_row.runs))
         self._selected_preset_name = name
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_SETUP, _DIRTY_PLAN, _DIRTY_PREFERENCES)
         self.setupChanged.emit()
         self.validationChanged.emit()
         self._set_list_action_text(f"Preset loaded: {name}")
@@ -1292,7 +1725,7 @@ class MarketSetupState(QObject):
             self._set_list_action_text("No new recipes were added.")
             return
         self._set_list_action_text(f"Added {added} recipes to craft plan.")
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1315,7 +1748,7 @@ class MarketSetupState(QObject):
             self._set_list_action_text("No new family recipes were added.")
             return
         self._set_list_action_text(f"Added {added} family recipes.")
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1326,7 +1759,7 @@ class MarketSetupState(QObject):
             row = self._find_plan_row_by_recipe(self._recipe.item.unique_name)
             if row is not None and (not row.enabled or row.runs != self._craft_runs):
                 self._update_plan_row(row.row_id, runs=self._craft_runs, enabled=True)
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1337,7 +1770,7 @@ class MarketSetupState(QObject):
             row = self._find_plan_row_by_recipe(recipe_id)
             if row is not None and not row.enabled:
                 self._update_plan_row(row.row_id, enabled=True)
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1360,7 +1793,7 @@ class MarketSetupState(QObject):
                 self._recipe = self._resolve_recipe(self._craft_plan_rows[0].recipe_id)
                 self._craft_runs = max(1, int(self._craft_plan_rows[0].runs))
                 self._ensure_price_preferences_for_recipe(self._recipe)
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1368,7 +1801,7 @@ class MarketSetupState(QObject):
     def setPlanRowEnabled(self, row_id: int, enabled: bool) -> None:
         if not self._update_plan_row(row_id, enabled=bool(enabled)):
             return
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1380,7 +1813,7 @@ class MarketSetupState(QObject):
         row = self._find_plan_row(row_id)
         if row is not None and row.recipe_id == self._recipe.item.unique_name:
             self._craft_runs = normalized
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1391,7 +1824,7 @@ class MarketSetupState(QObject):
             city_value = self._setup.craft_city
         if not self._update_plan_row(row_id, craft_city=city_value):
             return
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1405,7 +1838,7 @@ class MarketSetupState(QObject):
         normalized = float(self._normalize_daily_bonus_percent(parsed))
         if not self._update_plan_row(row_id, daily_bonus_percent=normalized):
             return
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1414,7 +1847,7 @@ class MarketSetupState(QObject):
         self._craft_plan_rows = []
         self._next_plan_row_id = 1
         self._sync_craft_plan_model()
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1480,7 +1913,7 @@ class MarketSetupState(QObject):
         row = self._find_plan_row_by_recipe(self._recipe.item.unique_name)
         if row is not None and row.runs != runs:
             self._update_plan_row(row.row_id, runs=runs)
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PLAN)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1491,7 +1924,7 @@ class MarketSetupState(QObject):
             return
         self._append_diag("Manual price refresh requested.", level="INFO")
         self._set_next_live_fetch_cooldown(self._manual_refresh_cooldown_seconds)
-        self._rebuild_preview(force_price_refresh=True)
+        self._mark_preview_dirty(_DIRTY_PRICES, force_price_refresh=True)
 
     @Slot()
     def showAoDataRaw(self) -> None:
@@ -1520,7 +1953,7 @@ class MarketSetupState(QObject):
         if self._input_price_types.get(item_id) == normalized:
             return
         self._input_price_types[item_id] = normalized
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PREFERENCES)
 
     @Slot(str, str)
     def setOutputPriceType(self, item_id: str, price_type: str) -> None:
@@ -1530,7 +1963,7 @@ class MarketSetupState(QObject):
         if self._output_price_types.get(item_id) == normalized:
             return
         self._output_price_types[item_id] = normalized
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PREFERENCES)
 
     @Slot(str, str)
     def setOutputCity(self, item_id: str, city: str) -> None:
@@ -1540,7 +1973,7 @@ class MarketSetupState(QObject):
         if self._output_cities.get(item_id, "") == city_value:
             return
         self._output_cities[item_id] = city_value
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PREFERENCES)
 
     @Slot(str, str)
     def setInputManualPrice(self, item_id: str, raw_value: str) -> None:
@@ -1549,7 +1982,7 @@ class MarketSetupState(QObject):
             self._manual_input_prices.pop(item_id, None)
         else:
             self._manual_input_prices[item_id] = price
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PREFERENCES)
 
     @Slot(str, str)
     def setInputStockQuantity(self, item_id: str, raw_value: str) -> None:
@@ -1558,7 +1991,7 @@ class MarketSetupState(QObject):
             self._input_stock_quantities.pop(item_id, None)
         else:
             self._input_stock_quantities[item_id] = quantity
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PREFERENCES)
 
     @Slot(str, str)
     def setOutputManualPrice(self, item_id: str, raw_value: str) -> None:
@@ -1567,7 +2000,7 @@ class MarketSetupState(QObject):
             self._manual_output_prices.pop(item_id, None)
         else:
             self._manual_output_prices[item_id] = price
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PREFERENCES)
 
     @Slot(str)
     def setResultsSortKey(self, key: str) -> None:
@@ -1577,7 +2010,7 @@ class MarketSetupState(QObject):
         if normalized == self._results_sort_key:
             return
         self._results_sort_key = normalized
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_RESULTS)
         self.resultsDetailsChanged.emit()
 
     @Slot(str)
@@ -1636,6 +2069,141 @@ class MarketSetupState(QObject):
         clipboard.setText(value)
         self._set_list_action_text("Copied value to clipboard.")
 
+    @Slot(str)
+    def startPricePrefetch(self, scope: str) -> None:
+        scope_value = scope.strip().lower()
+        if scope_value not in PREFETCH_SCOPES:
+            self._append_diag(f"Unknown price prefetch scope: {scope}", level="WARN")
+            return
+        service = self._service
+        if service is None:
+            return
+        self.cancelPricePrefetch()
+        setup = self.to_setup()
+        item_ids = _pricing_item_ids(self._recipes_for_prefetch(scope_value))
+        locations = self._collect_locations(setup)
+        qualities = [setup.quality, 1] if setup.quality != 1 else [1]
+        cancel = threading.Event()
+        idle = self._prefetch_idle
+
+        def wait_idle() -> None:
+            while not idle.wait(0.25) and not cancel.is_set():
+                pass
+
+        def prefetch(progress: Callable[[PrefetchProgress], None]) -> PrefetchProgress:
+            return prefetch_prices(
+                service,
+                region=setup.region,
+                item_ids=item_ids,
+                locations=locations,
+                qualities=qualities,
+                # Like the UI's own reads, only keys with no cached row cost a request.
+                allow_stale=True,
+                progress=progress,
+                cancelled=cancel,
+                wait_idle=wait_idle,
+            )
+
+        self._prefetch_seq += 1
+        self._prefetch_cancel = cancel
+        self._prefetch_scope = scope_value
+        self._prefetch_progress = PrefetchProgress(total_items=len(item_ids))
+        self._append_diag(
+            f"Price prefetch started ({scope_value}): {len(item_ids)} items x {len(locations)} cities.",
+            level="INFO",
+        )
+        self.prefetchChanged.emit()
+        self._prefetch_pool.start(_PricePrefetchTask(self._prefetch_seq, prefetch, self._prefetch_signals))
+
+    @Slot()
+    def runProfitScan(self) -> None:
+        """Rank every catalog recipe in each selected market city from cached prices.
+
+        Only prices already in the cache (see `startPricePrefetch("catalog")`) are used;
+        the scan never triggers live AO Data requests.
+        """
+        if self._compiled_catalog is None:
+            self._compiled_catalog = compile_catalog(self._recipes_for_prefetch("catalog"))
+        compiled = self._compiled_catalog
+        setup = self.to_setup()
+        cities = self._collect_locations(setup)
+        qualities = [setup.quality, 1] if setup.quality != 1 else [1]
+        sort_key = self._profit_scan_sort_key
+        service = self._service
+        fallback_index = dict(self._price_index)
+        item_ids = _pricing_item_ids(list(compiled.recipes))
+
+        def scan() -> list[RecipeProfitRow]:
+            if service is None:
+                price_index = fallback_index
+            else:
+                price_index = service.get_price_index(
+                    region=setup.region,
+                    item_ids=item_ids,
+                    locations=cities,
+                    qualities=qualities,
+                    allow_stale=True,
+                    allow_live=False,
+                )
+            return scan_catalog_profits(
+                compiled,
+                setup=setup,
+                price_index=price_index,
+                craft_cities=cities,
+                qualities=[setup.quality],
+                sort_key=sort_key,
+                limit=PROFIT_SCAN_LIMIT,
+            )
+
+        self._profit_scan_seq += 1
+        self._profit_scan_running = True
+        self._profit_scan_status_text = (
+            f"Scanning {len(compiled.recipes)} recipes in {len(cities)} cities..."
+        )
+        self.profitScanChanged.emit()
+        self._profit_scan_pool.start(_ProfitScanTask(self._profit_scan_seq, scan, self._profit_scan_signals))
+
+    @Slot(str)
+    def setProfitScanSortKey(self, key: str) -> None:
+        value = key.strip().lower()
+        if value not in SCAN_SORT_KEYS or value == self._profit_scan_sort_key:
+            return
+        self._profit_scan_sort_key = value
+        self.profitScanChanged.emit()
+        # Top-N differs per key, so re-rank the catalog instead of re-sorting the rows.
+        if self._profit_scan_model.rowCount() > 0 or self._profit_scan_running:
+            self.runProfitScan()
+
+    @Slot(int, object, object)
+    def _on_profit_scan_finished(self, request_id: int, rows, error) -> None:
+        if request_id != self._profit_scan_seq:
+            return
+        self._profit_scan_running = False
+        if error is not None:
+            self._log.warning("Profit scan failed: %s", error)
+            self._profit_scan_status_text = f"Scan failed: {error}"
+            self._append_diag(f"Profit scan failed: {error}", level="ERROR")
+        else:
+            self._profit_scan_model.set_items([_profit_scan_row(row) for row in rows])
+            if rows:
+                self._profit_scan_status_text = f"Top {len(rows)} by {self._profit_scan_sort_key.replace('_', ' ')}."
+            else:
+                self._profit_scan_status_text = "No fully priced recipes in cache. Prefetch prices first."
+        self.profitScanChanged.emit()
+
+    @Slot()
+    def cancelPricePrefetch(self) -> None:
+        self._prefetch_timer.stop()
+        if self._prefetch_cancel is None:
+            return
+        self._prefetch_cancel.set()
+        self._prefetch_cancel = None
+        # Results of the cancelled walk are ignored from here on.
+        self._prefetch_seq += 1
+        if self._prefetch_progress is not None and not self._prefetch_progress.finished:
+            self._append_diag("Price prefetch cancelled.", level="INFO")
+        self.prefetchChanged.emit()
+
     @Slot()
     def clearDiagnostics(self) -> None:
         self._diagnostics_lines = []
@@ -1667,6 +2235,14 @@ class MarketSetupState(QObject):
         return sanitized_setup(self._setup)
 
     def close(self) -> None:
+        self._preview_timer.stop()
+        self.cancelPricePrefetch()
+        if self._price_fetch_cancel is not None:
+            self._price_fetch_cancel.set()
+        if self._price_pool is not None:
+            self._price_pool.waitForDone(5000)
+        self._prefetch_pool.waitForDone(5000)
+        self._profit_scan_pool.waitForDone(5000)
         if self._service is not None:
             self._service.close()
 
@@ -1688,7 +2264,7 @@ class MarketSetupState(QObject):
             quality=kwargs.get("quality", self._setup.quality),
         )
         self._setup = sanitized_setup(setup)
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_SETUP)
         self.setupChanged.emit()
         self.validationChanged.emit()
 
@@ -1900,19 +2476,36 @@ class MarketSetupState(QObject):
         return recipes
 
     def _collect_pricing_item_ids(self) -> list[str]:
-        item_ids: set[str] = set()
-        for recipe in self._recipes_for_pricing():
-            for component in recipe.components:
-                item_ids.update(_item_id_candidates(component.item.unique_name))
-            for output in recipe.outputs:
-                item_ids.update(_item_id_candidates(output.item.unique_name))
-            journal_rule = _journal_rule_for_item(recipe.item.unique_name)
-            if journal_rule is not None:
-                # Market IDs for journals are not fully consistent across dumps; query all common variants.
-                item_ids.add(journal_rule.empty_item_id)
-                item_ids.add(f"{journal_rule.empty_item_id}_EMPTY")
-                item_ids.add(journal_rule.full_item_id)
-        return sorted(item_ids)
+        return _pricing_item_ids(self._recipes_for_pricing())
+
+    def _recipes_for_prefetch(self, scope: str) -> list[Recipe]:
+        if scope == "catalog":
+            recipe_ids = self._catalog.items()
+        else:
+            recipe_ids = []
+            for payload in self._presets.values():
+                recipe_ids.append(str(payload.get("recipe_id") or ""))
+                plan = payload.get("craft_plan")
+                if isinstance(plan, list):
+                    recipe_ids.extend(str(row.get("recipe_id") or "") for row in plan if isinstance(row, dict))
+        recipes = [self._catalog.get(recipe_id) for recipe_id in dict.fromkeys(recipe_ids)]
+        return [recipe for recipe in recipes if recipe is not None]
+
+    @Slot(int, object)
+    def _on_prefetch_progress(self, request_id: int, progress: PrefetchProgress) -> None:
+        if request_id != self._prefetch_seq:
+            return
+        self._prefetch_progress = progress
+        if progress.finished:
+            self._prefetch_cancel = None
+            if not progress.cancelled:
+                self._append_diag(
+                    f"Price prefetch done ({self._prefetch_scope}): {progress.fetched_keys} keys fetched, "
+                    f"{progress.cached_keys} already cached, {progress.failed_chunks} chunks failed "
+                    f"in {progress.elapsed_ms / 1000.0:.1f} s.",
+                    level="WARN" if progress.failed_chunks else "INFO",
+                )
+        self.prefetchChanged.emit()
 
     def _collect_locations(self, setup: CraftSetup) -> list[str]:
         location_set = {
@@ -1933,6 +2526,34 @@ class MarketSetupState(QObject):
             locations = ["Bridgewatch"]
         return locations
 
+    def _mark_preview_dirty(self, *stages: str, force_price_refresh: bool = False) -> None:
+        self._preview_dirty.update(stages)
+        if force_price_refresh:
+            self._preview_force_price_refresh = True
+        if self._preview_debounce_ms <= 0 or force_price_refresh:
+            self._flush_preview()
+            return
+        if not self._preview_timer.isActive():
+            self._preview_timer.start(self._preview_debounce_ms)
+
+    @Slot()
+    def _flush_preview(self) -> None:
+        self._preview_timer.stop()
+        dirty = self._preview_dirty
+        force_price_refresh = self._preview_force_price_refresh
+        self._preview_dirty = set()
+        self._preview_force_price_refresh = False
+        if not dirty and not force_price_refresh:
+            return
+        if dirty == {_DIRTY_RESULTS}:
+            self._results_items_model.set_items(self._build_results_rows(self._preview_output_rows))
+            self.resultsChanged.emit()
+            return
+        self._rebuild_preview(
+            force_price_refresh=force_price_refresh,
+            reuse_price_index=not force_price_refresh and not (dirty & _PRICE_STAGE_DIRTY),
+        )
+
     def _clear_preview_state(self, note: str) -> None:
         self._inputs_model.set_items([])
         self._outputs_model.set_items([])
@@ -1946,55 +2567,114 @@ class MarketSetupState(QObject):
         self._breakdown = ProfitBreakdown(notes=[note] if note else [])
         self._base_input_total_cost = 0.0
         self._journal_totals = _JournalTotals()
+        self._preview_price_index = None
+        self._preview_output_rows = []
         self.inputsChanged.emit()
         self.outputsChanged.emit()
         self.resultsChanged.emit()
         self.listsChanged.emit()
         self.resultsDetailsChanged.emit()
 
-    def _rebuild_preview(self, *, force_price_refresh: bool) -> None:
+    def _build_plan_runs(
+        self,
+        planned_recipes: list[tuple[CraftPlanRow, Recipe]],
+        *,
+        setup: CraftSetup,
+        price_index: dict[tuple[str, str, int], MarketPriceRecord],
+    ) -> tuple[list[CraftRun], list[ProfitBreakdown]]:
+        runs: list[CraftRun] = []
+        breakdowns: list[ProfitBreakdown] = []
+        for row, recipe in planned_recipes:
+            self._ensure_price_preferences_for_recipe(recipe)
+            row_setup = self._setup_for_plan_row(setup, row)
+            quantity = max(1, int(row.runs))
+            stamp = (
+                row.recipe_id,
+                quantity,
+                row_setup,
+                self._preview_price_index_version,
+                self._price_preferences_stamp(recipe),
+            )
+            cached = self._craft_run_cache.get(row.row_id, stamp, recipe)
+            if cached is None:
+                run = build_craft_run(
+                    recipe=recipe,
+                    quantity=quantity,
+                    setup=row_setup,
+                    price_index=self._quotes(price_index),
+                    input_price_types=self._input_price_types,
+                    output_cities=self._output_cities,
+                    output_price_types=self._output_price_types,
+                    manual_input_prices=self._manual_input_prices,
+                    manual_output_prices=self._manual_output_prices,
+                )
+                cached = (run, compute_run_profit(run))
+                self._craft_run_cache.store(row.row_id, stamp, recipe, *cached)
+            runs.append(cached[0])
+            breakdowns.append(cached[1])
+        self._craft_run_cache.retain({row.row_id for row, _ in planned_recipes})
+        return runs, breakdowns
+
+    def _quotes(self, price_index: dict[tuple[str, str, int], MarketPriceRecord]) -> PriceIndex:
+        for source, quotes in self._quote_indexes:
+            if source is price_index:
+                return quotes
+        quotes = PriceIndex.of(price_index)
+        self._quote_indexes = [(price_index, quotes), *self._quote_indexes[:1]]
+        return quotes
+
+    def _price_preferences_stamp(self, recipe: Recipe) -> tuple[object, ...]:
+        inputs = tuple(
+            (
+                component.item.unique_name,
+                self._input_price_types.get(component.item.unique_name),
+                self._manual_input_prices.get(component.item.unique_name),
+            )
+            for component in recipe.components
+        )
+        outputs = tuple(
+            (
+                output.item.unique_name,
+                self._output_cities.get(output.item.unique_name),
+                self._output_price_types.get(output.item.unique_name),
+                self._manual_output_prices.get(output.item.unique_name),
+            )
+            for output in recipe.outputs
+        )
+        return inputs, outputs
+
+    def _rebuild_preview(self, *, force_price_refresh: bool, reuse_price_index: bool = False) -> None:
         setup = self.to_setup()
         planned_recipes = self._recipes_for_preview()
         if not planned_recipes:
             self._clear_preview_state("no enabled recipes in craft plan")
             return
-        allow_live_fetch = force_price_refresh or (
-            self._active_market_tab_index >= 1 and not self._market_data_tabs_live_bootstrap_done
-        )
-        if allow_live_fetch and not force_price_refresh:
-            # One automatic live fetch when first entering data tabs; next refreshes are manual.
-            self._market_data_tabs_live_bootstrap_done = True
-        price_index = self._current_price_index(
-            setup,
-            force_refresh=force_price_refresh,
-            allow_live=allow_live_fetch,
-        )
+        if reuse_price_index and self._preview_price_index is not None:
+            price_index = self._preview_price_index
+        else:
+            allow_live_fetch = force_price_refresh or (
+                self._active_market_tab_index >= 1 and not self._market_data_tabs_live_bootstrap_done
+            )
+            if allow_live_fetch and not force_price_refresh:
+                # One automatic live fetch when first entering data tabs; next refreshes are manual.
+                self._market_data_tabs_live_bootstrap_done = True
+            price_index = self._current_price_index(
+                setup,
+                force_refresh=force_price_refresh,
+                allow_live=allow_live_fetch,
+            )
+            if price_index != self._preview_price_index:
+                self._preview_price_index_version += 1
+            self._preview_price_index = price_index
         try:
-            runs = []
-            for row, recipe in planned_recipes:
-                self._ensure_price_preferences_for_recipe(recipe)
-                row_setup = self._setup_for_plan_row(setup, row)
-                runs.append(
-                    build_craft_run(
-                        recipe=recipe,
-                        quantity=max(1, int(row.runs)),
-                        setup=row_setup,
-                        price_index=price_index,
-                        input_price_types=dict(self._input_price_types),
-                        output_cities=dict(self._output_cities),
-                        output_price_types=dict(self._output_price_types),
-                        manual_input_prices=dict(self._manual_input_prices),
-                        manual_output_prices=dict(self._manual_output_prices),
-                    )
-                )
+            runs, breakdowns = self._build_plan_runs(planned_recipes, setup=setup, price_index=price_index)
         except Exception:
             self._clear_preview_state("preview build failed")
             return
 
         run_profit_by_row: dict[int, float] = {}
         run_rrr_by_row: dict[int, float] = {}
-        for (plan_row, recipe), run in zip(planned_recipes, runs):
-            breakdown = compute_run_profit(run)
+        for (plan_row, recipe), breakdown in zip(planned_recipes, breakdowns):
             run_profit_by_row[int(plan_row.row_id)] = float(breakdown.margin_percent)
             row_setup = self._setup_for_plan_row(setup, plan_row)
             run_rrr_by_row[int(plan_row.row_id)] = float(
@@ -2077,7 +2757,7 @@ class MarketSetupState(QObject):
                 )
         input_rows.sort(key=lambda x: (x.item.lower(), x.city.lower()))
 
-        self._breakdown = compute_batch_profit(tuple(runs))
+        self._breakdown = sum_profit_breakdowns(breakdowns)
         self._base_input_total_cost = float(sum(row.total_cost for row in input_rows))
         self._breakdown.input_cost = float(self._base_input_total_cost + self._journal_totals.input_cost)
         self._breakdown.output_value = float(self._breakdown.output_value + self._journal_totals.output_value)
@@ -2192,6 +2872,7 @@ class MarketSetupState(QObject):
             ],
         )
 
+        self._preview_output_rows = output_rows
         results_rows = self._build_results_rows(output_rows)
         self._results_items_model.set_items(results_rows)
         breakdown_rows = self._build_breakdown_rows()
@@ -2283,13 +2964,7 @@ class MarketSetupState(QObject):
         return rows
 
     def _demand_proxy_percent(self, *, item_id: str, city: str, quality: int) -> float:
-        quote = _find_price_quote(
-            self._price_index,
-            item_id=item_id,
-            city=city,
-            quality=quality,
-            preferred_mode=None,
-        )
+        quote = self._quotes(self._price_index).quote(item_id, city, quality)
         if quote is None:
             return 0.0
         if quote.sell_price_min <= 0 or quote.buy_price_max <= 0:
@@ -2331,13 +3006,7 @@ class MarketSetupState(QObject):
         normalized = str(price_type).strip().lower()
         if normalized == PriceType.MANUAL.value:
             return "manual"
-        quote = _find_price_quote(
-            self._price_index,
-            item_id=item_id,
-            city=city,
-            quality=quality,
-            preferred_mode=normalized,
-        )
+        quote = self._quotes(self._price_index).quote(item_id, city, quality, preferred_mode=normalized)
         if quote is None:
             return "n/a"
 
@@ -2460,14 +3129,9 @@ class MarketSetupState(QObject):
         quality: int,
         preferred_mode: str,
     ) -> float:
+        quotes = self._quotes(price_index)
         for item_id in item_ids:
-            quote = _find_price_quote(
-                price_index,
-                item_id=item_id,
-                city=city,
-                quality=quality,
-                preferred_mode=preferred_mode,
-            )
+            quote = quotes.quote(item_id, city, quality, preferred_mode=preferred_mode)
             if quote is None:
                 continue
             if preferred_mode == PriceType.BUY_ORDER.value:
@@ -2578,8 +3242,9 @@ class MarketSetupState(QObject):
 
         now = time.monotonic()
         if not force:
-            if self._price_fetch_in_progress:
-                self._schedule_deferred_price_refresh(0.35)
+            if self._price_fetch_in_progress and not self._supersedes_price_fetch(context_key):
+                if self._price_pool is None:
+                    self._schedule_deferred_price_refresh(0.35)
                 if self._price_index:
                     return self._price_index
                 self._price_index = self._build_fallback_price_index(setup)
@@ -2599,22 +3264,110 @@ class MarketSetupState(QObject):
                 return self._price_index
 
         self._price_fetch_in_progress = True
+        self._prefetch_idle.clear()
         self._prices_source = "loading"
         self._prices_status_text = "Fetching live prices..."
         self.pricesChanged.emit()
+        fetch = self._price_fetcher(setup, item_ids=item_ids, locations=locations, force=force)
+        if self._price_pool is not None:
+            return self._start_background_price_fetch(setup, context_key, fetch, force=force)
         try:
-            index = self._service.get_price_index(
+            index, meta = fetch()
+        except Exception as exc:
+            return self._finish_price_fetch(setup, context_key, force=force, error=exc)
+        return self._finish_price_fetch(setup, context_key, force=force, index=index, meta=meta)
+
+    def _price_fetcher(
+        self,
+        setup: CraftSetup,
+        *,
+        item_ids: list[str],
+        locations: list[str],
+        force: bool,
+    ) -> Callable[[], tuple[dict[tuple[str, str, int], MarketPriceRecord], MarketFetchMeta]]:
+        service = self._service
+        assert service is not None
+        qualities = [setup.quality, 1] if setup.quality != 1 else [1]
+
+        def fetch() -> tuple[dict[tuple[str, str, int], MarketPriceRecord], MarketFetchMeta]:
+            index = service.get_price_index(
                 region=setup.region,
                 item_ids=item_ids,
                 locations=locations,
-                qualities=[setup.quality, 1] if setup.quality != 1 else [1],
-                ttl_seconds=120.0,
+                qualities=qualities,
+                ttl_seconds=DEFAULT_PRICE_TTL_SECONDS,
                 allow_stale=not force,
                 allow_cache=not force,
                 allow_live=True,
             )
-            if index:
-                meta = self._service.last_prices_meta
+            return index, service.last_prices_meta
+
+        return fetch
+
+    def _supersedes_price_fetch(self, context_key: tuple[str, int, tuple[str, ...], tuple[str, ...]]) -> bool:
+        if self._price_pool is None or self._price_fetch_context is None:
+            return False
+        return self._price_fetch_context[1] != context_key
+
+    def _start_background_price_fetch(
+        self,
+        setup: CraftSetup,
+        context_key: tuple[str, int, tuple[str, ...], tuple[str, ...]],
+        fetch: Callable[[], tuple[dict[tuple[str, str, int], MarketPriceRecord], MarketFetchMeta]],
+        *,
+        force: bool,
+    ) -> dict[tuple[str, str, int], MarketPriceRecord]:
+        assert self._price_pool is not None
+        if self._price_fetch_cancel is not None:
+            # Superseded request: skip it if not started, drop its result otherwise.
+            self._price_fetch_cancel.set()
+        self._price_fetch_seq += 1
+        self._price_fetch_cancel = threading.Event()
+        self._price_fetch_context = (setup, context_key, force)
+        self._price_pool.start(
+            _PriceFetchTask(
+                self._price_fetch_seq,
+                fetch,
+                self._price_fetch_signals,
+                self._price_fetch_cancel,
+            )
+        )
+        fallback_index = self._build_fallback_price_index(setup)
+        if self._price_index:
+            fallback_index.update(self._price_index)
+        return fallback_index
+
+    @Slot(int, object, object, object)
+    def _on_price_fetch_finished(self, request_id: int, index, meta, error) -> None:
+        if request_id != self._price_fetch_seq or self._price_fetch_context is None:
+            return
+        setup, context_key, force = self._price_fetch_context
+        self._price_fetch_context = None
+        self._price_fetch_cancel = None
+        self._finish_price_fetch(
+            setup,
+            context_key,
+            force=force,
+            index=index,
+            meta=meta,
+            error=error,
+        )
+        self._mark_preview_dirty(_DIRTY_PRICES)
+
+    def _finish_price_fetch(
+        self,
+        setup: CraftSetup,
+        context_key: tuple[str, int, tuple[str, ...], tuple[str, ...]],
+        *,
+        force: bool,
+        index: dict[tuple[str, str, int], MarketPriceRecord] | None = None,
+        meta: MarketFetchMeta | None = None,
+        error: Exception | None = None,
+    ) -> dict[tuple[str, str, int], MarketPriceRecord]:
+        try:
+            if error is not None:
+                raise error
+            if index and meta is not None:
                 self._price_index = index
                 self._price_context_key = context_key
                 if not force:
@@ -2649,6 +3402,7 @@ class MarketSetupState(QObject):
             self._append_diag(f"AO Data fetch failed: {exc}", level="ERROR")
         finally:
             self._price_fetch_in_progress = False
+            self._prefetch_idle.set()
             self.pricesChanged.emit()
 
         self._price_index = self._build_fallback_price_index(setup)
@@ -2681,7 +3435,7 @@ class MarketSetupState(QObject):
         if self._price_fetch_in_progress:
             self._schedule_deferred_price_refresh(0.35)
             return
-        self._rebuild_preview(force_price_refresh=False)
+        self._mark_preview_dirty(_DIRTY_PRICES)
 
     def _set_next_live_fetch_cooldown(self, seconds: float) -> None:
         target = time.monotonic() + max(0.0, float(seconds))
@@ -3189,6 +3943,42 @@ def _journal_maps() -> tuple[dict[str, _JournalRule], dict[str, float]]:
     return journal_by_item, fame_factor_by_item
 
 
+def _profit_scan_row(row: RecipeProfitRow) -> ProfitScanRow:
+    item = row.recipe.item
+    return ProfitScanRow(
+        recipe_id=item.unique_name,
+        item=_friendly_item_label(item.display_name, item.unique_name),
+        tier=int(item.tier or 0),
+        enchant=int(item.enchantment or 0),
+        city=row.craft_city,
+        quality=row.quality,
+        input_cost=row.input_cost,
+        return_savings=row.return_savings,
+        output_value=row.output_value,
+        station_fee=row.station_fee,
+        market_tax=row.market_tax,
+        profit=row.net_profit,
+        margin_percent=row.margin_percent,
+        silver_per_focus=row.silver_per_focus,
+    )
+
+
+def _pricing_item_ids(recipes: list[Recipe]) -> list[str]:
+    item_ids: set[str] = set()
+    for recipe in recipes:
+        for component in recipe.components:
+            item_ids.update(item_id_candidates(component.item.unique_name))
+        for output in recipe.outputs:
+            item_ids.update(item_id_candidates(output.item.unique_name))
+        journal_rule = _journal_rule_for_item(recipe.item.unique_name)
+        if journal_rule is not None:
+            # Market IDs for journals are not fully consistent across dumps; query all common variants.
+            item_ids.add(journal_rule.empty_item_id)
+            item_ids.add(f"{journal_rule.empty_item_id}_EMPTY")
+            item_ids.add(journal_rule.full_item_id)
+    return sorted(item_ids)
+
+
 def _journal_rule_for_item(item_id: str) -> _JournalRule | None:
     journal_by_item, _ = _journal_maps()
     return journal_by_item.get(_base_item_id(item_id))
@@ -3267,104 +4057,6 @@ def _humanize_item_id(item_id: str) -> str:
     return f"{item_name} T{tier}"
 
 
-def _item_id_candidates(item_id: str) -> tuple[str, ...]:
-    base = str(item_id or "").strip()
-    if not base:
-        return ()
-    out: list[str] = [base]
-
-    # AOData and game assets may expose enchanting suffix in three forms:
-    # @3, _LEVEL3, and _LEVEL3@3. Query all to maximize hit rate.
-    core = base
-    had_at = "@" in base
-    enchant: int | None = None
-    if "@" in core:
-        maybe_core, maybe_enchant = core.rsplit("@", 1)
-        try:
-            enchant = int(maybe_enchant)
-            core = maybe_core
-        except ValueError:
-            pass
-
-    stem = core
-    level: int | None = None
-    level_match = _LEVEL_SUFFIX_RE.search(core)
-    had_level = level_match is not None
-    if level_match is not None:
-        stem = core[: level_match.start()]
-        suffix = level_match.group(0)
-        try:
-            level = int(suffix.rsplit("LEVEL", 1)[1])
-        except (IndexError, ValueError):
-            level = None
-
-    if enchant is None and level is not None:
-        enchant = level
-    if level is None and enchant is not None:
-        level = enchant
-
-    if level is not None:
-        out.append(f"{stem}_LEVEL{level}")
-    # For *_LEVELN ids prefer *_LEVELN@N (canonical refined form) over *@N.
-    if enchant is not None and (had_at or not had_level):
-        out.append(f"{stem}@{enchant}")
-    if level is not None and enchant is not None:
-        out.append(f"{stem}_LEVEL{level}@{enchant}")
-    out.append(stem)
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for value in out:
-        if value and value not in seen:
-            seen.add(value)
-            ordered.append(value)
-    return tuple(ordered)
-
-
-def _mode_has_price(quote: MarketPriceRecord, preferred_mode: str | None) -> bool:
-    mode = str(preferred_mode or "").strip().lower()
-    if mode == PriceType.BUY_ORDER.value:
-        return int(quote.buy_price_max or 0) > 0
-    if mode == PriceType.SELL_ORDER.value:
-        return int(quote.sell_price_min or 0) > 0
-    if mode == PriceType.MANUAL.value:
-        return True
-    return int(quote.buy_price_max or 0) > 0 or int(quote.sell_price_min or 0) > 0
-
-
-def _find_price_quote(
-    price_index: dict[tuple[str, str, int], MarketPriceRecord],
-    *,
-    item_id: str,
-    city: str,
-    quality: int,
-    preferred_mode: str | None,
-) -> MarketPriceRecord | None:
-    candidates = _item_id_candidates(item_id)
-    if not candidates:
-        return None
-    fallback: MarketPriceRecord | None = None
-    quality_candidates = [int(quality)]
-    if int(quality) != 1:
-        quality_candidates.append(1)
-    for candidate_id in candidates:
-        for candidate_quality in quality_candidates:
-            quote = price_index.get((candidate_id, city, candidate_quality))
-            if quote is None:
-                continue
-            if _mode_has_price(quote, preferred_mode):
-                return quote
-            if fallback is None:
-                fallback = quote
-    for (candidate_id, candidate_city, _candidate_quality), quote in price_index.items():
-        if candidate_city != city or candidate_id not in candidates:
-            continue
-        if _mode_has_price(quote, preferred_mode):
-            return quote
-        if fallback is None:
-            fallback = quote
-    return fallback
-
-
 def _parse_iso_datetime(raw_value: str) -> datetime | None:
     text = str(raw_value or "").strip()
     if not text:
@@ -3430,14 +4122,3 @@ def _parse_recipe_filter(query: str) -> RecipeFilter:
     clean = "".join(ch if ch.isalnum() else " " for ch in remainder)
     terms = tuple(part for part in clean.split() if part)
     return RecipeFilter(terms=terms, tier=tier, enchant=enchant)
-
-
-def _matches_recipe_filter(row: RecipeOptionRow, recipe_filter: RecipeFilter) -> bool:
-    if recipe_filter.tier is not None and int(row.tier or 0) != int(recipe_filter.tier):
-        return False
-    if recipe_filter.enchant is not None and int(row.enchant or 0) != int(recipe_filter.enchant):
-        return False
-    if not recipe_filter.terms:
-        return True
-    haystack = f"{row.display_name} {row.recipe_id}".lower()
-    return all(term in haystack for term in recipe_filter.terms)
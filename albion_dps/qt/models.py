@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any, Callable
 
@@ -15,6 +15,7 @@ from PySide6.QtCore import (
 )
 
 from albion_dps.meter.session_meter import SessionEntry, SessionSummary
+from albion_dps.meter.snapshot_delta import SnapshotAssembler
 from albion_dps.domain.weapon_colors import WEAPON_COLORS
 
 
@@ -68,9 +69,92 @@ class HistoryRow:
     players: str
     copy_text: str
     selected: bool
+    key: tuple[Any, ...] = ()
 
 
-class PlayerModel(QAbstractListModel):
+def _player_row_key(item: PlayerRow) -> str:
+    return item.name
+
+
+def _history_row_key(item: HistoryRow) -> tuple[Any, ...]:
+    return item.key or (item.label, item.meta)
+
+
+class _KeyedListModel(QAbstractListModel):
+    """List model that applies new rows as a keyed diff instead of a reset.
+
+    Rows are matched by the `row_key` function; structural changes become remove/move/insert
+    notifications and value changes emit `dataChanged` for changed roles only,
+    so QML delegates (and scroll positions) survive periodic refreshes.
+    """
+
+    ROLE_FIELDS: dict[int, str] = {}
+
+    def __init__(self, row_key: Callable[[Any], Any]) -> None:
+        super().__init__()
+        self._items: list[Any] = []
+        self._row_key = row_key
+
+    def set_items(self, items: list[Any]) -> None:
+        new_items = list(items)
+        new_keys = [self._row_key(item) for item in new_items]
+        if len(set(new_keys)) != len(new_keys):
+            self.beginResetModel()
+            self._items = new_items
+            self.endResetModel()
+            return
+        wanted = set(new_keys)
+        row = len(self._items) - 1
+        while row >= 0:
+            if self._row_key(self._items[row]) in wanted:
+                row -= 1
+                continue
+            end = row
+            while row > 0 and self._row_key(self._items[row - 1]) not in wanted:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, end)
+            del self._items[row : end + 1]
+            self.endRemoveRows()
+            row -= 1
+        for target, (key, item) in enumerate(zip(new_keys, new_items)):
+            current = self._items[target] if target < len(self._items) else None
+            if current is not None and self._row_key(current) == key:
+                self._replace_row(target, item)
+                continue
+            source = next(
+                (
+                    row
+                    for row in range(target + 1, len(self._items))
+                    if self._row_key(self._items[row]) == key
+                ),
+                None,
+            )
+            if source is None:
+                self.beginInsertRows(QModelIndex(), target, target)
+                self._items.insert(target, item)
+                self.endInsertRows()
+                continue
+            self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), target)
+            self._items.insert(target, self._items.pop(source))
+            self.endMoveRows()
+            self._replace_row(target, item)
+
+    def _replace_row(self, row: int, item: Any) -> None:
+        previous = self._items[row]
+        if previous == item:
+            return
+        self._items[row] = item
+        roles = [
+            role
+            for role, name in self.ROLE_FIELDS.items()
+            if getattr(previous, name) != getattr(item, name)
+        ]
+        if roles:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, roles)
+
+
+class PlayerModel(_KeyedListModel):
     NameRole = Qt.UserRole + 1
     DamageRole = Qt.UserRole + 2
     HealRole = Qt.UserRole + 3
@@ -83,9 +167,22 @@ class PlayerModel(QAbstractListModel):
     WeaponTierRole = Qt.UserRole + 10
     WeaponIconRole = Qt.UserRole + 11
 
+    ROLE_FIELDS = {
+        NameRole: "name",
+        DamageRole: "damage",
+        HealRole: "heal",
+        DpsRole: "dps",
+        HpsRole: "hps",
+        BarRole: "bar_ratio",
+        RoleRole: "role",
+        BarColorRole: "color",
+        WeaponNameRole: "weapon_name",
+        WeaponTierRole: "weapon_tier",
+        WeaponIconRole: "weapon_icon",
+    }
+
     def __init__(self) -> None:
-        super().__init__()
-        self._items: list[PlayerRow] = []
+        super().__init__(_player_row_key)
 
     def rowCount(self, _parent: QModelIndex | None = None) -> int:  # type: ignore[override]
         return len(self._items)
@@ -136,22 +233,24 @@ class PlayerModel(QAbstractListModel):
             self.WeaponIconRole: b"weaponIcon",
         }
 
-    def set_items(self, items: list[PlayerRow]) -> None:
-        self.beginResetModel()
-        self._items = list(items)
-        self.endResetModel()
-
 
-class HistoryModel(QAbstractListModel):
+class HistoryModel(_KeyedListModel):
     LabelRole = Qt.UserRole + 1
     MetaRole = Qt.UserRole + 2
     PlayersRole = Qt.UserRole + 3
     CopyRole = Qt.UserRole + 4
     SelectedRole = Qt.UserRole + 5
 
+    ROLE_FIELDS = {
+        LabelRole: "label",
+        MetaRole: "meta",
+        PlayersRole: "players",
+        CopyRole: "copy_text",
+        SelectedRole: "selected",
+    }
+
     def __init__(self) -> None:
-        super().__init__()
-        self._items: list[HistoryRow] = []
+        super().__init__(_history_row_key)
 
     def rowCount(self, _parent: QModelIndex | None = None) -> int:  # type: ignore[override]
         return len(self._items)
@@ -184,11 +283,6 @@ class HistoryModel(QAbstractListModel):
             self.SelectedRole: b"selected",
         }
 
-    def set_items(self, items: list[HistoryRow]) -> None:
-        self.beginResetModel()
-        self._items = list(items)
-        self.endResetModel()
-
     def get_copy_text(self, index: int) -> str | None:
         if index < 0 or index >= len(self._items):
             return None
@@ -232,6 +326,9 @@ class UiState(QObject):
         self._history = HistoryModel()
         self._last_snapshot = None
         self._last_names: dict[int, str] = {}
+        self._snapshots = SnapshotAssembler()
+        self._snapshot_names_version = self._snapshots.names_version
+        self._history_rows = _HistoryRowCache()
         self._last_history: list[SessionSummary] = []
         self._role_lookup = role_lookup
         self._weapon_lookup = weapon_lookup
@@ -423,15 +520,26 @@ class UiState(QObject):
         self,
         snapshot,
         *,
-        names: dict[int, str],
+        names: dict[int, str] | None = None,
         history: list[SessionSummary],
         mode: str,
         zone: str | None,
         fame_total: int,
         fame_per_hour: float,
     ) -> None:
+        # Delta snapshots are folded into the full state here; ``names``
+        # overrides the snapshot's own name table when given.
+        snapshot = self._snapshots.apply(snapshot)
         self._last_snapshot = snapshot
-        self._last_names = dict(names)
+        if names is not None:
+            names_changed = names != self._last_names
+            self._last_names = dict(names)
+        else:
+            names_changed = self._snapshots.names_version != self._snapshot_names_version
+            self._snapshot_names_version = self._snapshots.names_version
+            self._last_names = snapshot.names or {}
+        if names_changed:
+            self._history_rows.names_changed()
         self._last_history = list(history)
         self._set_mode(mode)
         self._set_zone(zone or "-")
@@ -533,6 +641,7 @@ class UiState(QObject):
                 names=self._last_names,
                 limit=self._history_limit,
                 selected_index=self._selected_history_index,
+                cache=self._history_rows,
             )
         )
 
@@ -653,40 +762,89 @@ def _color_for_label(label: str, role: str | None) -> str:
     return FALLBACK_PALETTE[idx]
 
 
+class _HistoryRowCache:
+    """Formatted history rows keyed by `_summary_key` and a names version.
+
+    A cached row is reused only for the very summary object it was built
+    from, so summaries replaced by the meter (merges, relabels) are
+    reformatted while closed ones are formatted once.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[tuple[Any, ...], tuple[SessionSummary, HistoryRow]] = {}
+        self._names_version = 0
+
+    def names_changed(self) -> None:
+        self._names_version += 1
+
+    def row_for(self, summary: SessionSummary, *, names: dict[int, str]) -> HistoryRow:
+        summary_key = _summary_key(summary)
+        key = (summary_key, self._names_version)
+        cached = self._rows.get(key)
+        if cached is not None and cached[0] is summary:
+            return cached[1]
+        row = _format_history_row(summary, names=names, key=summary_key)
+        self._rows[key] = (summary, row)
+        return row
+
+    def retain(self, summaries: list[SessionSummary]) -> None:
+        keep = {(_summary_key(summary), self._names_version) for summary in summaries}
+        for key in [key for key in self._rows if key not in keep]:
+            del self._rows[key]
+
+
 def _build_history_rows(
     history: list[SessionSummary],
     *,
     names: dict[int, str],
     limit: int,
     selected_index: int = -1,
+    cache: _HistoryRowCache | None = None,
 ) -> list[HistoryRow]:
     rows: list[HistoryRow] = []
-    for index, summary in enumerate(history[: max(limit, 1)]):
-        label = summary.mode
-        if summary.mode == "zone" and summary.label:
-            label = f"zone {summary.label}"
-        duration = _format_duration(summary.duration)
-        totals = _format_totals(summary.total_damage, summary.total_heal)
-        collapsed_entries = _collapse_history_entries(
-            summary.entries,
-            names=names,
-            duration=summary.duration,
-        )
-        players_count = len(collapsed_entries)
-        players = _format_players_preview(collapsed_entries, names=names, max_players=3)
-        copy_text = _format_history_copy(summary, names=names, entries=collapsed_entries)
-        rows.append(
-            HistoryRow(
-                label=f"{label} {duration}",
-                meta=f"{totals} | players {players_count}",
-                players=players,
-                copy_text=copy_text,
-                selected=index == selected_index,
-            )
-        )
+    visible = history[: max(limit, 1)]
+    for index, summary in enumerate(visible):
+        if cache is not None:
+            row = cache.row_for(summary, names=names)
+        else:
+            row = _format_history_row(summary, names=names, key=_summary_key(summary))
+        if index == selected_index:
+            row = replace(row, selected=True)
+        rows.append(row)
+    if cache is not None:
+        cache.retain(visible)
     return rows
 
 
+def _format_history_row(
+    summary: SessionSummary,
+    *,
+    names: dict[int, str],
+    key: tuple[Any, ...],
+) -> HistoryRow:
+    label = summary.mode
+    if summary.mode == "zone" and summary.label:
+        label = f"zone {summary.label}"
+    duration = _format_duration(summary.duration)
+    totals = _format_totals(summary.total_damage, summary.total_heal)
+    collapsed_entries = _collapse_history_entries(
+        summary.entries,
+        names=names,
+        duration=summary.duration,
+    )
+    players_count = len(collapsed_entries)
+    players = _format_players_preview(collapsed_entries, names=names, max_players=3)
+    copy_text = _format_history_copy(summary, names=names, entries=collapsed_entries)
+    return HistoryRow(
+        label=f"{label} {duration}",
+        meta=f"{totals} | players {players_count}",
+        players=players,
+        copy_text=copy_text,
+        selected=False,
+        key=key,
+    )
+
+
 def _format_duration(seconds: float) -> str:
     if seconds < 0:
         seconds = 0
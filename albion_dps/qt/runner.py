@@ -4,9 +4,10 @@ import argparse
 import importlib.metadata
 import logging
 import os
-import queue
 import threading
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from pathlib import Path
 
 from albion_dps.capture import auto_detect_interface, capture_backend_available, list_interfaces
@@ -15,11 +16,13 @@ from albion_dps.capture.npcap_runtime import (
     detect_npcap_runtime,
 )
 from albion_dps.capture.startup_policy import decide_live_startup
-from albion_dps.domain import FameTracker, NameRegistry, PartyRegistry, load_item_resolver
+from albion_dps.domain import FameTracker, NameRegistry, PartyRegistry, load_item_resolver_async
+from albion_dps.domain.equipment_cache import EquipmentProfileCache
 from albion_dps.domain.item_db import ensure_game_databases
 from albion_dps.domain.map_resolver import load_map_resolver
 from albion_dps.market.service import MarketDataService
-from albion_dps.meter.session_meter import SessionMeter
+from albion_dps.meter.session_meter import SessionMeter, SessionSummary
+from albion_dps.meter.snapshot_delta import merge_snapshots
 from albion_dps.models import MeterSnapshot
 from albion_dps.pipeline import live_snapshots, replay_snapshots
 from albion_dps.protocol.combat_mapper import CombatEventMapper
@@ -29,10 +32,106 @@ from albion_dps.settings import AppSettings, load_app_settings, save_app_setting
 from albion_dps.update import check_for_updates
 
 
-SnapshotQueue = queue.Queue[MeterSnapshot | None]
+# Rolling DPS/HPS window resolution; keeps window memory independent of hit rate.
+ROLLING_BUCKET_SECONDS = 0.1
+# Producer snapshots are deltas; a full keyframe is sent every N snapshots.
+SNAPSHOT_KEYFRAME_INTERVAL = 30
+MARKET_PREVIEW_DEBOUNCE_MS = 150
+MARKET_CACHE_MAX_BYTES = 64 * 1024 * 1024
+MARKET_PREFETCH_SCOPE = "presets"
+MARKET_PREFETCH_DELAY_MS = 5000
 _UPDATE_CHECK_LOCK = threading.Lock()
 
 
+@dataclass(frozen=True)
+class SnapshotFrame:
+    snapshot: MeterSnapshot
+    history_changed: bool
+    coalesced: int
+
+
+class SnapshotMailbox:
+    """Latest-wins hand-off of meter snapshots from the producer to the GUI."""
+
+    def __init__(self, on_ready: Callable[[], None] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._on_ready = on_ready
+        self._snapshot: MeterSnapshot | None = None
+        self._history_version: int | None = None
+        self._history_changed = False
+        self._pending_coalesced = 0
+        self._coalesced_frames = 0
+        self._closed = False
+
+    @property
+    def coalesced_frames(self) -> int:
+        with self._lock:
+            return self._coalesced_frames
+
+    @property
+    def closed(self) -> bool:
+        """True once the producer finished and the last snapshot was taken."""
+        with self._lock:
+            return self._closed and self._snapshot is None
+
+    def put(self, snapshot: MeterSnapshot, *, history_version: int | None = None) -> None:
+        with self._lock:
+            was_empty = self._snapshot is None
+            if not was_empty:
+                self._pending_coalesced += 1
+                self._coalesced_frames += 1
+                snapshot = merge_snapshots(self._snapshot, snapshot)
+            self._snapshot = snapshot
+            if history_version is None or history_version != self._history_version:
+                self._history_changed = True
+            self._history_version = history_version
+        if was_empty and self._on_ready is not None:
+            self._on_ready()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        if self._on_ready is not None:
+            self._on_ready()
+
+    def take(self) -> SnapshotFrame | None:
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return None
+            frame = SnapshotFrame(
+                snapshot=snapshot,
+                history_changed=self._history_changed,
+                coalesced=self._pending_coalesced,
+            )
+            self._snapshot = None
+            self._history_changed = False
+            self._pending_coalesced = 0
+            return frame
+
+
+class RefreshLimiter:
+    """Spaces GUI refreshes at least ``1 / max_rate`` seconds apart."""
+
+    def __init__(
+        self, max_rate: float, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        self._interval = 1.0 / max_rate
+        self._clock = clock
+        self._last: float | None = None
+
+    def delay(self) -> float:
+        """Seconds to wait before the next refresh is allowed (0 if now)."""
+        if self._last is None:
+            return 0.0
+        return max(self._last + self._interval - self._clock(), 0.0)
+
+    def mark(self) -> None:
+        self._last = self._clock()
+
+
 def run_qt(args: argparse.Namespace) -> int:
     if args.qt_command == "live" and args.list_interfaces:
         for interface in list_interfaces():
@@ -55,20 +154,12 @@ def run_qt(args: argparse.Namespace) -> int:
 
     names, party, fame, meter, decoder, mapper = _build_runtime(args)
     ensure_game_databases(logger=logging.getLogger(__name__), interactive=True)
-    item_resolver = load_item_resolver(logger=logging.getLogger(__name__))
+    # Item databases are only needed once players show up; load them off the
+    # GUI path and resolve indices lazily from disk as equipment is observed.
+    item_resolver = load_item_resolver_async(on_demand=True, logger=logging.getLogger(__name__))
     map_resolver = load_map_resolver(logger=logging.getLogger(__name__))
     meter.map_lookup = map_resolver.name_for_index
-
-    def role_lookup(entity_id: int) -> str | None:
-        items = names.items_for(entity_id)
-        weapon = item_resolver.weapon_category_for_items(items)
-        if weapon:
-            return weapon
-        return item_resolver.role_for_items(items)
-
-    def weapon_lookup(entity_id: int):
-        items = names.items_for(entity_id)
-        return item_resolver.weapon_info_for_items(items)
+    equipment_profiles = EquipmentProfileCache(names, item_resolver)
     snapshots = _build_snapshot_stream(args, names, party, fame, meter, decoder, mapper)
     if snapshots is None:
         return 1
@@ -78,14 +169,7 @@ def run_qt(args: argparse.Namespace) -> int:
         logging.getLogger(__name__).error("QML not found: %s", qml_path)
         return 1
 
-    snapshot_queue: SnapshotQueue = queue.Queue()
     stop_event = threading.Event()
-    producer = threading.Thread(
-        target=_produce_snapshots,
-        args=(snapshots, snapshot_queue, stop_event),
-        daemon=True,
-    )
-    producer.start()
 
     _configure_windows_taskbar_identity("albion.command.desk")
     app = QGuiApplication([])
@@ -124,8 +208,8 @@ def run_qt(args: argparse.Namespace) -> int:
         top_n=args.top,
         history_limit=max(args.history, 1),
         set_mode_callback=meter.set_mode,
-        role_lookup=role_lookup,
-        weapon_lookup=weapon_lookup,
+        role_lookup=equipment_profiles.role_for,
+        weapon_lookup=equipment_profiles.weapon_for,
         update_auto_check=load_app_settings().update_auto_check,
     )
     class _UpdateNotifier(QObject):
@@ -140,11 +224,20 @@ def run_qt(args: argparse.Namespace) -> int:
     scanner_state = ScannerState()
     market_cache_path = Path("data") / "market_cache.sqlite3"
     market_cache_path.parent.mkdir(parents=True, exist_ok=True)
-    market_service = MarketDataService.with_default_cache(cache_path=market_cache_path)
+    market_service = MarketDataService.with_default_cache(
+        cache_path=market_cache_path,
+        background_writes=True,
+        compress=True,
+        max_bytes=MARKET_CACHE_MAX_BYTES,
+    )
     market_setup_state = MarketSetupState(
         service=market_service,
         logger=logging.getLogger(__name__),
         auto_refresh_prices=True,
+        background_price_fetch=True,
+        preview_debounce_ms=MARKET_PREVIEW_DEBOUNCE_MS,
+        prefetch_scope=MARKET_PREFETCH_SCOPE,
+        prefetch_delay_ms=MARKET_PREFETCH_DELAY_MS,
     )
     engine.rootContext().setContextProperty("uiState", state)
     engine.rootContext().setContextProperty("scannerState", scanner_state)
@@ -164,19 +257,42 @@ def run_qt(args: argparse.Namespace) -> int:
     if state.updateAutoCheck:
         _start_update_check(update_notifier)
 
-    def drain_queue() -> None:
+    class _SnapshotNotifier(QObject):
+        snapshotReady = Signal()
+
+    # The producer wakes the GUI thread through a queued signal only when a
+    # new snapshot lands; refreshes are then spaced by the max UI rate.
+    snapshot_notifier = _SnapshotNotifier()
+    mailbox = SnapshotMailbox(on_ready=snapshot_notifier.snapshotReady.emit)
+    refresh_limiter = RefreshLimiter(max(args.max_fps, 1.0))
+    refresh_timer = QTimer()
+    refresh_timer.setSingleShot(True)
+    history_cache: list[SessionSummary] = []
+
+    def drain_mailbox() -> None:
+        refresh_limiter.mark()
         _drain_snapshots(
-            snapshot_queue,
+            mailbox,
             state,
             meter=meter,
             fame=fame,
             stop_event=stop_event,
+            history_cache=history_cache,
         )
 
-    timer = QTimer()
-    timer.setInterval(100)
-    timer.timeout.connect(drain_queue)
-    timer.start()
+    def schedule_drain() -> None:
+        if not refresh_timer.isActive():
+            refresh_timer.start(int(refresh_limiter.delay() * 1000))
+
+    refresh_timer.timeout.connect(drain_mailbox)
+    snapshot_notifier.snapshotReady.connect(schedule_drain)
+    producer = threading.Thread(
+        target=_produce_snapshots,
+        args=(snapshots, mailbox, stop_event),
+        kwargs={"history_version": meter.history_version},
+        daemon=True,
+    )
+    producer.start()
     app.aboutToQuit.connect(scanner_state.shutdown)
     app.aboutToQuit.connect(market_setup_state.close)
     app.aboutToQuit.connect(stop_event.set)
@@ -220,6 +336,7 @@ def _build_snapshot_stream(
             fame_tracker=fame,
             event_mapper=mapper.map,
             snapshot_interval=1.0,
+            keyframe_interval=SNAPSHOT_KEYFRAME_INTERVAL,
         )
 
     if args.qt_command == "live":
@@ -291,6 +408,7 @@ def _build_snapshot_stream(
             fame_tracker=fame,
             event_mapper=mapper.map,
             snapshot_interval=1.0,
+            keyframe_interval=SNAPSHOT_KEYFRAME_INTERVAL,
         )
 
     logging.getLogger(__name__).error("Unknown qt command")
@@ -358,6 +476,7 @@ def _build_runtime(
     fame = FameTracker()
     meter = SessionMeter(
         window_seconds=10.0,
+        bucket_seconds=ROLLING_BUCKET_SECONDS,
         battle_timeout_seconds=args.battle_timeout,
         history_limit=max(args.history, 1),
         mode=args.mode,
@@ -372,46 +491,49 @@ def _build_runtime(
 
 def _produce_snapshots(
     snapshots: Iterable[MeterSnapshot],
-    snapshot_queue: SnapshotQueue,
+    mailbox: SnapshotMailbox,
     stop_event: threading.Event,
+    *,
+    history_version: Callable[[], int] | None = None,
 ) -> None:
     try:
         for snapshot in snapshots:
             if stop_event.is_set():
                 break
-            snapshot_queue.put(snapshot)
+            mailbox.put(
+                snapshot,
+                history_version=history_version() if history_version is not None else None,
+            )
     except Exception:
         logging.getLogger(__name__).exception("Snapshot stream terminated unexpectedly")
     finally:
-        snapshot_queue.put(None)
+        mailbox.close()
 
 
 def _drain_snapshots(
-    snapshot_queue: SnapshotQueue,
+    mailbox: SnapshotMailbox,
     state,
     *,
     meter: SessionMeter,
     fame: FameTracker,
     stop_event: threading.Event,
+    history_cache: list[SessionSummary],
 ) -> None:
-    while True:
-        try:
-            snapshot = snapshot_queue.get_nowait()
-        except queue.Empty:
-            return
-        if snapshot is None:
+    frame = mailbox.take()
+    if frame is None:
+        if mailbox.closed:
             stop_event.set()
-            return
-        names = snapshot.names or {}
-        state.update(
-            snapshot,
-            names=names,
-            history=meter.history(limit=state.historyLimit),
-            mode=meter.mode,
-            zone=meter.zone_label(),
-            fame_total=fame.total(),
-            fame_per_hour=fame.per_hour(),
-        )
+        return
+    if frame.history_changed or not history_cache:
+        history_cache[:] = meter.history(limit=state.historyLimit)
+    state.update(
+        frame.snapshot,
+        history=list(history_cache),
+        mode=meter.mode,
+        zone=meter.zone_label(),
+        fame_total=fame.total(),
+        fame_per_hour=fame.per_hour(),
+    )
 
 
 def _fallback_interface() -> str | None:
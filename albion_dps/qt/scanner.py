@@ -12,7 +12,16 @@ from collections import deque
 from datetime import datetime
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Property, Signal, Slot
+from PySide6.QtCore import (
+    Property,
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QTimer,
+    Qt,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QGuiApplication
 
 from albion_dps.capture import capture_backend_available
@@ -38,10 +47,103 @@ _ANSI_BARE_RE = re.compile(r"\[[0-9;]{1,6}m")
 _LOGRUS_RE = re.compile(r'^time="([^"]+)"\s+level=([a-zA-Z]+)\s+msg="(.*)"$')
 
 
+LOG_MAX_LINES = 800
+LOG_FLUSH_INTERVAL_MS = 50
+
+
+class ScannerLogModel(QAbstractListModel):
+    """Ring buffer of scanner log lines exposed as a list model.
+
+    Appended lines are buffered and flushed at most every `flush_interval_ms`
+    as one insert (plus one remove from the head when the buffer is full), so
+    a chatty client costs a couple of row notifications per flush instead of
+    a full text re-layout per line.
+    """
+
+    LineRole = Qt.UserRole + 1
+
+    countChanged = Signal()
+    flushed = Signal()
+
+    def __init__(
+        self,
+        max_lines: int = LOG_MAX_LINES,
+        *,
+        flush_interval_ms: int = LOG_FLUSH_INTERVAL_MS,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._lines: deque[str] = deque(maxlen=max(1, int(max_lines)))
+        self._pending: deque[str] = deque(maxlen=self._lines.maxlen)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(max(0, int(flush_interval_ms)))
+        self._flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, _parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        return len(self._lines)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < 0 or row >= len(self._lines):
+            return None
+        if role in (self.LineRole, Qt.DisplayRole):
+            return self._lines[row]
+        return None
+
+    def roleNames(self) -> dict[int, bytes]:  # type: ignore[override]
+        return {self.LineRole: b"line"}
+
+    @Property(int, notify=countChanged)
+    def count(self) -> int:
+        return len(self._lines)
+
+    def append(self, line: str) -> None:
+        self._pending.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def flush(self) -> None:
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending = list(self._pending)
+        self._pending.clear()
+        overflow = len(self._lines) + len(pending) - self._lines.maxlen
+        if overflow > 0:
+            removed = min(overflow, len(self._lines))
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            for _ in range(removed):
+                self._lines.popleft()
+            self.endRemoveRows()
+        start = len(self._lines)
+        self.beginInsertRows(QModelIndex(), start, start + len(pending) - 1)
+        self._lines.extend(pending)
+        self.endInsertRows()
+        self.countChanged.emit()
+        self.flushed.emit()
+
+    def clear(self) -> None:
+        self._flush_timer.stop()
+        self._pending.clear()
+        if not self._lines:
+            return
+        self.beginResetModel()
+        self._lines.clear()
+        self.endResetModel()
+        self.countChanged.emit()
+        self.flushed.emit()
+
+    def lines(self) -> list[str]:
+        return [*self._lines, *self._pending]
+
+
 class ScannerState(QObject):
     statusChanged = Signal()
     updateChanged = Signal()
-    logChanged = Signal()
     runningChanged = Signal()
     runtimeChanged = Signal()
     gitChanged = Signal()
@@ -61,7 +163,7 @@ class ScannerState(QObject):
         self._repo_url = DEFAULT_REPO_URL
         self._status_text = "idle"
         self._update_text = "not checked"
-        self._log_lines: deque[str] = deque(maxlen=800)
+        self._log_model = ScannerLogModel(parent=self)
         self._running = False
         self._runtime_state = RUNTIME_STATE_UNKNOWN
         self._runtime_detail = "Runtime status not checked yet."
@@ -97,9 +199,9 @@ class ScannerState(QObject):
     def updateText(self) -> str:
         return self._update_text
 
-    @Property(str, notify=logChanged)
-    def logText(self) -> str:
-        return "\n".join(self._log_lines)
+    @Property(QObject, constant=True)
+    def logModel(self) -> QObject:
+        return self._log_model
 
     @Property(bool, notify=runningChanged)
     def running(self) -> bool:
@@ -190,8 +292,19 @@ class ScannerState(QObject):
 
     @Slot()
     def clearLog(self) -> None:
-        self._log_lines.clear()
-        self.logChanged.emit()
+        self._log_model.clear()
+
+    @Slot()
+    def copyLog(self) -> None:
+        # The view renders one line per delegate, so whole-log copy goes through the model.
+        lines = self._log_model.lines()
+        if not lines:
+            self._append_warn("Scanner log is empty.")
+            return
+        try:
+            QGuiApplication.clipboard().setText("\n".join(lines))
+        except Exception as exc:
+            self._append_error(f"Failed to copy log to clipboard: {exc}")
 
     @Slot()
     def checkForUpdates(self) -> None:
@@ -663,8 +776,7 @@ class ScannerState(QObject):
         self._logSignal.emit(self._format_line("ERROR", message))
 
     def _append_log_line(self, message: str) -> None:
-        self._log_lines.append(message)
-        self.logChanged.emit()
+        self._log_model.append(message)
 
     def _normalize_external_line(self, message: str) -> str:
         cleaned = self._clean_ansi(message)
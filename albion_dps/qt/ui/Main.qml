@@ -508,7 +508,7 @@ ApplicationWindow {
                     updateText: scannerState.updateText
                     clientDir: scannerState.clientDir
                     scannerRunning: scannerState.running
-                    logText: scannerState.logText
+                    logModel: scannerState.logModel
                     captureRuntimeState: scannerState.captureRuntimeState
                     captureRuntimeDetail: scannerState.captureRuntimeDetail
                     captureRuntimeActionLabel: scannerState.captureRuntimeActionLabel
@@ -548,6 +548,10 @@ ApplicationWindow {
                         scannerState.stopScanner()
                         toastManager.showInfo("Scanner stopped", "Packet capture has been stopped")
                     }
+                    onCopyLog: function() {
+                        scannerState.copyLog()
+                        toastManager.showSuccess("Copied to clipboard", "Scanner log copied")
+                    }
                     onClearLog: function() {
                         scannerState.clearLog()
                         toastManager.showInfo("Log cleared", "Scanner log has been cleared")
@@ -605,6 +609,8 @@ ApplicationWindow {
                 marketStatusExpanded: marketStatusExpanded
                 marketDiagnosticsVisible: marketDiagnosticsVisible
                 diagnosticsText: marketSetupState.diagnosticsText
+                prefetchStatusText: marketSetupState.prefetchStatusText
+                prefetchActive: marketSetupState.prefetchActive
 
                 craftCity: marketSetupState.craftCity
                 defaultBuyCity: marketSetupState.defaultBuyCity
@@ -640,6 +646,10 @@ ApplicationWindow {
                 resultsSortKey: marketSetupState.resultsSortKey
                 marketBreakdownExpanded: marketBreakdownExpanded
                 breakdownModel: marketSetupState.breakdownModel
+                profitScanModel: marketSetupState.profitScanModel
+                profitScanSortKey: marketSetupState.profitScanSortKey
+                profitScanRunning: marketSetupState.profitScanRunning
+                profitScanStatusText: marketSetupState.profitScanStatusText
 
                 // Layout flags
                 compactControlHeight: compactControlHeight
@@ -702,6 +712,10 @@ ApplicationWindow {
                 onSetOutputPriceType: function(itemId, type) { marketSetupState.setOutputPriceType(itemId, type) }
                 onSetOutputManualPrice: function(itemId, price) { marketSetupState.setOutputManualPrice(itemId, price) }
                 onSetResultsSortKey: function(key) { marketSetupState.setResultsSortKey(key) }
+                onRunProfitScan: marketSetupState.runProfitScan()
+                onPrefetchCatalogPrices: marketSetupState.startPricePrefetch("catalog")
+                onSetProfitScanSortKey: function(key) { marketSetupState.setProfitScanSortKey(key) }
+                onAddRecipeToPlan: function(recipeId) { marketSetupState.addRecipeToPlan(recipeId) }
                 onCopyText: function(text) { root.copyText(text) }
                 }
             }
@@ -8,6 +8,7 @@ import "." // for Theme, AppButton, TableSurface access
  *
  * Displays:
  * - Diagnostic messages from market operations
+ * - Background price prefetch progress
  * - Clear button to reset diagnostics
  */
 TableSurface {
@@ -21,6 +22,7 @@ TableSurface {
 
     // Properties
     property string diagnosticsText: ""
+    property string prefetchStatusText: ""
 
     // Signals
     signal clearDiagnostics()
@@ -43,7 +45,18 @@ TableSurface {
                 font.pixelSize: 11
                 font.bold: true
             }
-            Item { Layout.fillWidth: true }
+            Text {
+                Layout.fillWidth: true
+                visible: root.prefetchStatusText.length > 0
+                text: root.prefetchStatusText
+                color: mutedColor
+                font.pixelSize: 10
+                elide: Text.ElideRight
+            }
+            Item {
+                Layout.fillWidth: true
+                visible: root.prefetchStatusText.length === 0
+            }
             AppButton {
                 text: "Clear"
                 implicitHeight: 20
@@ -0,0 +1,193 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+import "." // for Theme, AppButton, TableSurface access
+
+/**
+ * MarketProfitScan - Catalog-wide profit ranking
+ *
+ * Displays:
+ * - Top recipes across all selected cities, priced from the local cache
+ * - Opt-in catalog prefetch that fills the cache the scan reads
+ * - Sort buttons (margin, profit, silver per focus)
+ * - Per-row "Add" button to push a recipe into the craft plan
+ */
+TableSurface {
+    id: root
+    level: 1
+    clip: true
+
+    // Properties
+    property var scanModel: null
+    property string sortKey: "margin"
+    property bool running: false
+    property string statusText: ""
+    property bool prefetchActive: false
+
+    // Signals
+    signal runScan()
+    signal prefetchCatalog()
+    signal setSortKey(string key)
+    signal addRecipeToPlan(string recipeId)
+
+    // Formatting helpers (provided by MarketTab)
+    property var formatInt: function(value) { return String(value) }
+    property var formatFixed: function(value, decimals) { return Number(value).toFixed(decimals) }
+    property var signedValueColor: function(value) { return textColor }
+    property var tableRowColor: function(index) { return "transparent" }
+    property var itemLabelWithTierParts: function(label, tier, enchant) { return label }
+
+    // Access to theme
+    property var theme: null
+    property color textColor: theme.textPrimary
+    property color mutedColor: theme.textMuted
+
+    readonly property int cityWidth: 110
+    readonly property int numberWidth: 84
+    readonly property int addWidth: 44
+
+    ColumnLayout {
+        anchors.fill: parent
+        anchors.margins: 10
+        spacing: 8
+
+        RowLayout {
+            Layout.fillWidth: true
+            spacing: 6
+            Text {
+                text: "Profit scan"
+                color: textColor
+                font.pixelSize: 12
+                font.bold: true
+            }
+            AppButton {
+                text: root.running ? "Scanning..." : "Scan catalog"
+                enabled: !root.running
+                implicitHeight: 22
+                fontPixelSize: 11
+                onClicked: root.runScan()
+            }
+            AppButton {
+                text: "Cache catalog prices"
+                enabled: !root.prefetchActive
+                implicitHeight: 22
+                fontPixelSize: 11
+                onClicked: root.prefetchCatalog()
+            }
+            Repeater {
+                model: [
+                    { key: "margin", label: "Margin" },
+                    { key: "profit", label: "Profit" },
+                    { key: "silver_per_focus", label: "Silver/focus" }
+                ]
+                AppButton {
+                    text: modelData.label
+                    checkable: true
+                    checked: root.sortKey === modelData.key
+                    implicitHeight: 22
+                    fontPixelSize: 11
+                    onClicked: root.setSortKey(modelData.key)
+                }
+            }
+            Text {
+                Layout.fillWidth: true
+                text: root.statusText
+                color: mutedColor
+                font.pixelSize: 10
+                elide: Text.ElideRight
+            }
+        }
+
+        RowLayout {
+            Layout.fillWidth: true
+            spacing: 6
+            Text { text: "Item"; color: mutedColor; font.pixelSize: 10; Layout.fillWidth: true }
+            Text { text: "City"; color: mutedColor; font.pixelSize: 10; Layout.preferredWidth: root.cityWidth }
+            Text { text: "Cost"; color: mutedColor; font.pixelSize: 10; Layout.preferredWidth: root.numberWidth; horizontalAlignment: Text.AlignRight }
+            Text { text: "Revenue"; color: mutedColor; font.pixelSize: 10; Layout.preferredWidth: root.numberWidth; horizontalAlignment: Text.AlignRight }
+            Text { text: "Profit"; color: mutedColor; font.pixelSize: 10; Layout.preferredWidth: root.numberWidth; horizontalAlignment: Text.AlignRight }
+            Text { text: "Margin"; color: mutedColor; font.pixelSize: 10; Layout.preferredWidth: root.numberWidth; horizontalAlignment: Text.AlignRight }
+            Text { text: "Silver/focus"; color: mutedColor; font.pixelSize: 10; Layout.preferredWidth: root.numberWidth; horizontalAlignment: Text.AlignRight }
+            Item { Layout.preferredWidth: root.addWidth }
+        }
+
+        ListView {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            clip: true
+            model: root.scanModel
+            boundsBehavior: Flickable.StopAtBounds
+            ScrollBar.vertical: ScrollBar { policy: ScrollBar.AsNeeded }
+
+            delegate: Rectangle {
+                width: ListView.view.width
+                height: 24
+                color: root.tableRowColor(index)
+
+                RowLayout {
+                    anchors.fill: parent
+                    anchors.leftMargin: 4
+                    anchors.rightMargin: 4
+                    spacing: 6
+                    Text {
+                        Layout.fillWidth: true
+                        text: root.itemLabelWithTierParts(item, tier, enchant)
+                        color: textColor
+                        font.pixelSize: 11
+                        elide: Text.ElideRight
+                    }
+                    Text {
+                        Layout.preferredWidth: root.cityWidth
+                        text: city
+                        color: mutedColor
+                        font.pixelSize: 11
+                        elide: Text.ElideRight
+                    }
+                    Text {
+                        Layout.preferredWidth: root.numberWidth
+                        horizontalAlignment: Text.AlignRight
+                        text: root.formatInt(cost)
+                        color: textColor
+                        font.pixelSize: 11
+                    }
+                    Text {
+                        Layout.preferredWidth: root.numberWidth
+                        horizontalAlignment: Text.AlignRight
+                        text: root.formatInt(revenue)
+                        color: textColor
+                        font.pixelSize: 11
+                    }
+                    Text {
+                        Layout.preferredWidth: root.numberWidth
+                        horizontalAlignment: Text.AlignRight
+                        text: root.formatInt(profit)
+                        color: root.signedValueColor(profit)
+                        font.pixelSize: 11
+                        font.bold: true
+                    }
+                    Text {
+                        Layout.preferredWidth: root.numberWidth
+                        horizontalAlignment: Text.AlignRight
+                        text: root.formatFixed(marginPercent, 1) + "%"
+                        color: root.signedValueColor(marginPercent)
+                        font.pixelSize: 11
+                    }
+                    Text {
+                        Layout.preferredWidth: root.numberWidth
+                        horizontalAlignment: Text.AlignRight
+                        text: silverPerFocus > 0 ? root.formatFixed(silverPerFocus, 1) : "-"
+                        color: textColor
+                        font.pixelSize: 11
+                    }
+                    AppButton {
+                        Layout.preferredWidth: root.addWidth
+                        text: "Add"
+                        implicitHeight: 20
+                        fontPixelSize: 10
+                        onClicked: root.addRecipeToPlan(recipeId)
+                    }
+                }
+            }
+        }
+    }
+}
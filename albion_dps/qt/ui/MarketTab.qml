@@ -31,6 +31,8 @@ CardPanel {
     property bool marketStatusExpanded: false
     property bool marketDiagnosticsVisible: false
     property string diagnosticsText: ""
+    property string prefetchStatusText: ""
+    property bool prefetchActive: false
 
     property string craftCity: ""
     property string defaultBuyCity: ""
@@ -66,6 +68,10 @@ CardPanel {
     property string resultsSortKey: "profit"
     property bool marketBreakdownExpanded: false
     property var breakdownModel: null
+    property var profitScanModel: null
+    property string profitScanSortKey: "margin"
+    property bool profitScanRunning: false
+    property string profitScanStatusText: ""
     property real craftPlanPendingContentY: -1
 
     // Layout flags
@@ -142,6 +148,10 @@ CardPanel {
     signal setOutputPriceType(var itemId, string type)
     signal setOutputManualPrice(var itemId, string price)
     signal setResultsSortKey(string key)
+    signal runProfitScan()
+    signal prefetchCatalogPrices()
+    signal setProfitScanSortKey(string key)
+    signal addRecipeToPlan(string recipeId)
     signal copyText(string text)
 
     // Helper functions
@@ -284,6 +294,7 @@ CardPanel {
             textColor: root.textColor
             mutedColor: root.mutedColor
             diagnosticsText: root.diagnosticsText
+            prefetchStatusText: root.prefetchStatusText
             onClearDiagnostics: root.clearDiagnostics()
         }
 
@@ -347,6 +358,17 @@ CardPanel {
                 cornerRadius: shellTabRadius
                 labelPixelSize: 11
             }
+            ShellTabButton {
+                id: marketScanTab
+                text: "Scan"
+                activeColor: accentColor
+                inactiveColor: shellTabIdleBackground
+                activeTextColor: shellTabActiveText
+                inactiveTextColor: textColor
+                borderColor: borderColor
+                cornerRadius: shellTabRadius
+                labelPixelSize: 11
+            }
         }
 
         // Tab content
@@ -569,6 +591,27 @@ CardPanel {
                     }
                 }
             }
+
+            // Scan Tab
+            MarketProfitScan {
+                theme: root.theme
+                textColor: root.textColor
+                mutedColor: root.mutedColor
+                scanModel: root.profitScanModel
+                sortKey: root.profitScanSortKey
+                running: root.profitScanRunning
+                statusText: root.profitScanStatusText
+                prefetchActive: root.prefetchActive
+                formatInt: root.formatInt
+                formatFixed: root.formatFixed
+                signedValueColor: root.signedValueColor
+                tableRowColor: root.tableRowColor
+                itemLabelWithTierParts: root.itemLabelWithTierParts
+                onRunScan: root.runProfitScan()
+                onPrefetchCatalog: root.prefetchCatalogPrices()
+                onSetSortKey: function(key) { root.setProfitScanSortKey(key) }
+                onAddRecipeToPlan: function(recipeId) { root.addRecipeToPlan(recipeId) }
+            }
         }
     }
 }
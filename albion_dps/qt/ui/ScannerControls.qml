@@ -11,6 +11,7 @@ import "." // for AppButton access
  * - Start scanner
  * - Start scanner (sudo)
  * - Stop scanner
+ * - Copy log
  * - Clear log
  */
 Flow {
@@ -28,6 +29,7 @@ Flow {
     signal startScanner()
     signal startScannerSudo()
     signal stopScanner()
+    signal copyLog()
     signal clearLog()
 
     AppButton {
@@ -60,6 +62,11 @@ Flow {
         enabled: root.scannerRunning
         onClicked: root.stopScanner()
     }
+    AppButton {
+        text: "Copy log"
+        compact: true
+        onClicked: root.copyLog()
+    }
     AppButton {
         text: "Clear log"
         compact: true
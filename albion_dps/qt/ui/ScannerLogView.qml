@@ -6,7 +6,7 @@ import "." // for TableSurface access
  * ScannerLogView - Log output area for scanner diagnostics
  *
  * Displays:
- * - Scrollable text area with scanner logs
+ * - Scrollable list of scanner log lines (ring-buffer model)
  * - Auto-scroll to latest log entry
  * - Empty state message when no logs
  */
@@ -16,49 +16,47 @@ TableSurface {
     clip: true
 
     // Properties to bind to parent state
-    property string logText: ""
+    property var logModel: null
 
     // Access to theme (injected by parent)
     property var theme: null
     property color textColor: theme.textPrimary
 
-    ScrollView {
-        id: scannerLogView
+    ListView {
+        id: scannerLogList
         anchors.fill: parent
         anchors.margins: 8
-        ScrollBar.horizontal.policy: ScrollBar.AlwaysOff
+        clip: true
+        model: root.logModel
+        boundsBehavior: Flickable.StopAtBounds
+        flickableDirection: Flickable.AutoFlickIfNeeded
+        contentWidth: contentItem.childrenRect.width
+        ScrollBar.vertical: ScrollBar {}
 
-        TextArea {
-            id: scannerLogArea
-            text: root.logText
+        // Follow the tail only while the view is already at the bottom.
+        property bool followTail: true
+        onMovementEnded: followTail = atYEnd
+        onCountChanged: {
+            if (followTail)
+                Qt.callLater(positionViewAtEnd)
+        }
+        Component.onCompleted: Qt.callLater(positionViewAtEnd)
+
+        delegate: TextEdit {
+            text: model.line
             readOnly: true
+            selectByMouse: true
             wrapMode: Text.NoWrap
             color: root.textColor
             font.family: "Consolas"
             font.pixelSize: 11
-            selectByMouse: true
-
-            function followTail() {
-                cursorPosition = length
-                if (scannerLogView.contentItem
-                        && scannerLogView.contentItem.contentHeight !== undefined
-                        && scannerLogView.contentItem.height !== undefined) {
-                    scannerLogView.contentItem.contentY = Math.max(
-                        0,
-                        scannerLogView.contentItem.contentHeight - scannerLogView.contentItem.height
-                    )
-                }
-            }
-
-            onTextChanged: Qt.callLater(followTail)
-            Component.onCompleted: Qt.callLater(followTail)
         }
     }
 
     // Empty state message
     Text {
         anchors.centerIn: parent
-        visible: root.logText.length === 0
+        visible: scannerLogList.count === 0
         text: "Scanner log is empty. Run a scanner action to see diagnostics."
         color: root.theme.textSecondary
         font.pixelSize: 11
@@ -18,6 +18,7 @@ import "." // for CardPanel access
  * - startScanner(): Fired when user clicks Start scanner
  * - startScannerSudo(): Fired when user clicks Start scanner (sudo)
  * - stopScanner(): Fired when user clicks Stop scanner
+ * - copyLog(): Fired when user clicks Copy log
  * - clearLog(): Fired when user clicks Clear log
  * - refreshCaptureRuntimeStatus(): Fired when user refreshes runtime diagnostics
  * - openCaptureRuntimeAction(): Fired when user clicks runtime action button
@@ -32,7 +33,7 @@ CardPanel {
     property string updateText: ""
     property string clientDir: ""
     property bool scannerRunning: false
-    property string logText: ""
+    property var logModel: null
     property string captureRuntimeState: "unknown"
     property string captureRuntimeDetail: ""
     property string captureRuntimeActionLabel: ""
@@ -54,6 +55,7 @@ CardPanel {
     signal startScanner()
     signal startScannerSudo()
     signal stopScanner()
+    signal copyLog()
     signal clearLog()
     signal refreshCaptureRuntimeStatus()
     signal openCaptureRuntimeAction()
@@ -292,6 +294,7 @@ CardPanel {
             onStartScanner: root.startScanner()
             onStartScannerSudo: root.startScannerSudo()
             onStopScanner: root.stopScanner()
+            onCopyLog: root.copyLog()
             onClearLog: root.clearLog()
         }
 
@@ -302,7 +305,7 @@ CardPanel {
             Layout.fillHeight: true
             theme: root.theme
             textColor: root.textColor
-            logText: root.logText
+            logModel: root.logModel
         }
     }
 }
@@ -0,0 +1 @@
+mapping = {'T4_MAIN_MACE': 'MACE'}
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+
+from albion_dps.meter.aggregate import RollingMeter
+from albion_dps.meter.array_meter import ArrayRollingMeter
+from albion_dps.meter.session_meter import SessionMeter
+from albion_dps.models import CombatEvent
+
+
+def _assert_totals_close(left: dict, right: dict) -> None:
+    assert left.keys() == right.keys()
+    for source_id, stats in left.items():
+        for key in ("damage", "heal", "dps", "hps"):
+            assert abs(stats[key] - right[source_id][key]) < 1e-6, (source_id, key)
+
+
+def test_array_meter_matches_rolling_meter() -> None:
+    rng = random.Random(3)
+    reference = RollingMeter(window_seconds=10.0, session_timeout_seconds=5.0)
+    meter = ArrayRollingMeter(window_seconds=10.0, session_timeout_seconds=5.0)
+    ts = 0.0
+    for _ in range(2000):
+        ts += rng.choice((0.01, 0.05, 0.2, 6.0 if rng.random() < 0.002 else 0.1))
+        event = CombatEvent(ts, rng.randrange(150), 1, rng.randint(1, 500), rng.choice(("damage", "heal")))
+        reference.push(event)
+        meter.push(event)
+        if rng.random() < 0.05:
+            _assert_totals_close(meter.snapshot().totals, reference.snapshot().totals)
+    reference.touch(ts + 4.0)
+    meter.touch(ts + 4.0)
+    _assert_totals_close(meter.snapshot().totals, reference.snapshot().totals)
+
+
+def test_array_meter_table_is_column_aligned() -> None:
+    meter = ArrayRollingMeter(window_seconds=10.0)
+    meter.push(CombatEvent(0.0, 7, 2, 100, "damage"))
+    meter.push(CombatEvent(1.0, 9, 2, 50, "heal"))
+
+    table = meter.snapshot_table()
+    assert table.source_ids == (7, 9)
+    assert list(table.damage) == [100.0, 0.0]
+    assert list(table.hps) == [0.0, 5.0]
+
+
+def test_array_meter_deltas_reconstruct_full_state() -> None:
+    meter = ArrayRollingMeter(window_seconds=10.0, session_timeout_seconds=20.0)
+    state: dict[int, dict[str, float]] = {}
+
+    meter.push(CombatEvent(0.0, 1, 2, 100, "damage"))
+    meter.push(CombatEvent(0.5, 2, 2, 10, "damage"))
+    meter.snapshot_delta().apply(state)
+
+    meter.push(CombatEvent(1.0, 2, 2, 30, "damage"))
+    delta = meter.snapshot_delta()
+    assert delta.changed.source_ids == (2,)
+    delta.apply(state)
+    _assert_totals_close(state, meter.snapshot().totals)
+
+    meter.touch(10.6)
+    delta = meter.snapshot_delta()
+    assert not delta.reset
+    assert delta.changed.source_ids == (1, 2)
+    delta.apply(state)
+    _assert_totals_close(state, meter.snapshot().totals)
+    assert meter.snapshot_delta().changed.source_ids == ()
+
+    meter.push(CombatEvent(40.0, 3, 2, 5, "damage"))
+    delta = meter.snapshot_delta()
+    assert delta.reset
+    delta.apply(state)
+    assert set(state) == {3}
+
+
+def test_session_meter_accepts_array_meter_factory() -> None:
+    meter = SessionMeter(
+        history_limit=5,
+        mode="manual",
+        meter_factory=lambda window: ArrayRollingMeter(window_seconds=window, session_timeout_seconds=None),
+    )
+    meter.toggle_manual()
+    meter.push(CombatEvent(1.0, 1, 2, 25, "damage"))
+    assert meter.snapshot().totals[1]["damage"] == 25.0
+    meter.toggle_manual()
+
+    history = meter.history()
+    assert len(history) == 1
+    assert history[0].total_damage == 25.0
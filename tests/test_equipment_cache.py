@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from albion_dps.domain.equipment_cache import EquipmentProfileCache
+from albion_dps.domain.item_resolver import ItemResolver
+from albion_dps.domain.name_registry import NAME_SUBTYPE_EQUIPMENT, NameRegistry
+
+
+class _CountingResolver(ItemResolver):
+    calls: int = 0
+    loaded: bool = True
+
+    def weapon_info_for_items(self, item_ids):
+        self.calls += 1
+        if not self.loaded:
+            return None
+        return super().weapon_info_for_items(item_ids)
+
+    def ready(self) -> bool:
+        return self.loaded
+
+
+def _equip(names: NameRegistry, entity_id: int, items: list[int]) -> None:
+    names._apply_event({252: NAME_SUBTYPE_EQUIPMENT, 0: entity_id, 2: items})
+
+
+def _resolver() -> _CountingResolver:
+    return _CountingResolver(index_to_unique={1: "T4_2H_HOLYSTAFF", 2: "T6_MAIN_SWORD@2"})
+
+
+def test_equipment_cache_resolves_on_equipment_event() -> None:
+    names = NameRegistry()
+    resolver = _resolver()
+    cache = EquipmentProfileCache(names, resolver)
+
+    _equip(names, 10, [1, 5])
+    assert resolver.calls == 1
+
+    for _ in range(5):
+        assert cache.role_for(10) == "holystaff"
+        weapon = cache.weapon_for(10)
+        assert weapon is not None and weapon.unique == "T4_2H_HOLYSTAFF"
+    assert resolver.calls == 1
+    assert cache.role_for(99) is None
+
+
+def test_equipment_cache_invalidated_by_equipment_change() -> None:
+    names = NameRegistry()
+    resolver = _resolver()
+    cache = EquipmentProfileCache(names, resolver)
+
+    _equip(names, 10, [1])
+    _equip(names, 10, [1])
+    assert names.equipment_version(10) == 1
+    _equip(names, 10, [2])
+    assert names.equipment_version(10) == 2
+
+    assert cache.role_for(10) == "sword"
+    weapon = cache.weapon_for(10)
+    assert weapon is not None and (weapon.tier, weapon.enchant) == (6, 2)
+
+
+def test_equipment_cache_refreshes_entries_resolved_before_ready() -> None:
+    names = NameRegistry()
+    resolver = _resolver()
+    resolver.loaded = False
+    cache = EquipmentProfileCache(names, resolver)
+
+    _equip(names, 10, [1])
+    assert cache.weapon_for(10) is None
+
+    resolver.loaded = True
+    weapon = cache.weapon_for(10)
+    assert weapon is not None and weapon.unique == "T4_2H_HOLYSTAFF"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from albion_dps.domain.item_resolver import load_item_resolver
+import threading
+
+from albion_dps.domain.item_resolver import AsyncItemResolver, ItemResolver, load_item_resolver
 from tests.support_temp import mk_test_dir
 
 
@@ -55,3 +57,57 @@ def test_item_resolver_role_from_category_mapping_py() -> None:
         category_path=mapping_path,
     )
     assert resolver.role_for_items([7]) == "tank"
+
+
+def test_item_resolver_on_demand_resolves_only_seen_indices() -> None:
+    tmp_path = mk_test_dir("item_resolver")
+    indexed_path = tmp_path / "indexedItems.json"
+    indexed_path.write_text(
+        '[\n  {"Index":"1","UniqueName":"T4_2H_HOLYSTAFF","LocalizedNames":{"EN-US":"Great Holy Staff"}},\n'
+        '  {"Index":"2","UniqueName":"T5_MAIN_SWORD@1","LocalizedNames":{"EN-US":"Broadsword é"}}\n]',
+        encoding="utf-8",
+    )
+
+    resolver = load_item_resolver(indexed_path=indexed_path, items_path=None, on_demand=True)
+    assert resolver.item_index is not None
+    assert resolver.index_to_unique == {}
+
+    info = resolver.weapon_info_for_items([2])
+    assert info is not None
+    assert info.unique == "T5_MAIN_SWORD@1"
+    assert info.name == "Broadsword é"
+    assert (info.tier, info.enchant) == (5, 1)
+    assert resolver.index_to_unique == {2: "T5_MAIN_SWORD@1"}
+    assert resolver.role_for_items([1]) == "heal"
+    assert resolver.role_for_items([3]) is None
+
+
+def test_item_resolver_on_demand_falls_back_for_keyed_layout() -> None:
+    tmp_path = mk_test_dir("item_resolver")
+    indexed_path = tmp_path / "indexedItems.json"
+    indexed_path.write_text(
+        '{"items":[{"Index":"4","UniqueName":"T4_MAIN_MACE"}]}',
+        encoding="utf-8",
+    )
+
+    resolver = load_item_resolver(indexed_path=indexed_path, items_path=None, on_demand=True)
+    assert resolver.item_index is None
+    assert resolver.role_for_items([4]) == "tank"
+
+
+def test_async_item_resolver_answers_none_until_loaded() -> None:
+    release = threading.Event()
+    loaded = ItemResolver(index_to_unique={1: "T4_2H_HOLYSTAFF"})
+
+    def loader() -> ItemResolver:
+        release.wait(5.0)
+        return loaded
+
+    resolver = AsyncItemResolver(loader).start()
+    assert resolver.ready() is False
+    assert resolver.role_for_items([1]) is None
+    assert resolver.weapon_info_for_items([1]) is None
+
+    release.set()
+    assert resolver.wait(5.0) is True
+    assert resolver.role_for_items([1]) == "heal"
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
 import pytest
 
-from albion_dps.market.aod_client import AODataClient
+from albion_dps.market.aod_client import (
+    AODataClient,
+    AODataConnectionPool,
+    AODataHTTPError,
+    AODataRateLimiter,
+)
 from albion_dps.market.models import MarketRegion
 
 
@@ -189,3 +201,349 @@ def test_fetch_prices_retries_with_smaller_batches_on_414() -> None:
     assert len(rows) == 3
     assert any("/stats/prices/T4_MAIN_SWORD,T4_MAIN_AXE,T4_MAIN_MACE.json" in url for url in called)
     assert any("/stats/prices/T4_MAIN_SWORD.json" in url for url in called)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay_seconds = 0.05
+    connections: set[tuple[str, int]] = set()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        cls = type(self)
+        with cls.lock:
+            cls.connections.add(self.client_address)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(cls.delay_seconds)
+            item_part = self.path.split("/stats/prices/", 1)[1].split(".json", 1)[0]
+            body = json.dumps(
+                [
+                    {"item_id": item_id, "city": "Bridgewatch", "quality": 1, "sell_price_min": 100}
+                    for item_id in item_part.split(",")
+                ]
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return
+
+
+@pytest.fixture
+def stand_in_server():
+    _StandInHandler.connections = set()
+    _StandInHandler.in_flight = 0
+    _StandInHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_prices_runs_batches_concurrently_over_pooled_connections(stand_in_server) -> None:
+    item_ids = [f"T4_ITEM_{idx:03d}" for idx in range(120)]
+    client = AODataClient(
+        max_prices_url_length=300,
+        max_concurrency=3,
+        base_urls={MarketRegion.EUROPE: stand_in_server},
+    )
+    try:
+        started = time.perf_counter()
+        rows = client.fetch_prices(region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"])
+        elapsed = time.perf_counter() - started
+        # A second refresh reuses the idle keep-alive connections.
+        client.fetch_prices(region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"])
+    finally:
+        client.close()
+
+    stats = client.last_request_stats
+    batch_count = len(stats.batches)
+    assert [row.item_id for row in rows] == item_ids
+    assert batch_count >= 6
+    assert stats.success
+    assert all(batch.success and batch.elapsed_ms > 0 for batch in stats.batches)
+    assert sum(batch.item_count for batch in stats.batches) == len(item_ids)
+    assert _StandInHandler.max_in_flight == 3
+    assert elapsed < batch_count * _StandInHandler.delay_seconds
+    assert client.connection_pool is not None
+    assert client.connection_pool.connections_opened <= 3
+    assert len(_StandInHandler.connections) <= 3
+
+
+class _ProxyAndRedirectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    seen: list[tuple[str, str | None]] = []
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        type(self).seen.append((self.path, self.headers.get("Proxy-Authorization")))
+        path = urlsplit(self.path).path
+        if path == "/moved.json":
+            self._reply(302, b"", location="/data.json")
+        elif path == "/loop.json":
+            self._reply(307, b"", location="/loop.json")
+        elif path == "/not-modified.json":
+            self._reply(304, b"")
+        else:
+            self._reply(200, b'[{"ok": true}]')
+
+    def _reply(self, status: int, body: bytes, *, location: str | None = None) -> None:
+        self.send_response(status)
+        if location is not None:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return
+
+
+@pytest.fixture
+def proxy_and_redirect_server():
+    _ProxyAndRedirectHandler.seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyAndRedirectHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connection_pool_sends_plain_http_through_configured_proxy(proxy_and_redirect_server) -> None:
+    pool = AODataConnectionPool(proxies={"http": f"http://user:p%40ss@{proxy_and_redirect_server}"})
+    try:
+        payload = pool.fetch_json("http://aod.invalid/data.json?x=1", 5.0, "test-agent")
+    finally:
+        pool.close()
+
+    assert payload == [{"ok": True}]
+    token = base64.b64encode(b"user:p@ss").decode("ascii")
+    assert _ProxyAndRedirectHandler.seen == [("http://aod.invalid/data.json?x=1", f"Basic {token}")]
+
+
+def test_connection_pool_applies_timeout_to_reused_sockets(proxy_and_redirect_server) -> None:
+    pool = AODataConnectionPool(proxies={})
+    try:
+        pool.fetch_json(f"http://{proxy_and_redirect_server}/data.json", 5.0, "test-agent")
+        conn, reused = pool._acquire(("http", proxy_and_redirect_server), 1.5)
+    finally:
+        pool.close()
+
+    assert reused
+    assert conn.sock.gettimeout() == 1.5
+    conn.close()
+
+
+def test_connection_pool_tunnels_https_through_proxy_unless_bypassed() -> None:
+    pool = AODataConnectionPool(proxies={"https": "http://proxy.local:3128", "no": "bypass.local"})
+    try:
+        tunnelled, _ = pool._acquire(("https", "aod.invalid"), 5.0)
+        direct, _ = pool._acquire(("https", "bypass.local"), 5.0)
+    finally:
+        pool.close()
+
+    assert (tunnelled.host, tunnelled.port) == ("proxy.local", 3128)
+    assert (tunnelled._tunnel_host, tunnelled._tunnel_port) == ("aod.invalid", 443)
+    assert direct.host == "bypass.local"
+    assert direct._tunnel_host is None
+
+
+def test_connection_pool_follows_redirects_and_surfaces_other_3xx(proxy_and_redirect_server) -> None:
+    base = f"http://{proxy_and_redirect_server}"
+    pool = AODataConnectionPool(proxies={})
+    try:
+        assert pool.fetch_json(f"{base}/moved.json", 5.0, "test-agent") == [{"ok": True}]
+        with pytest.raises(AODataHTTPError, match="304") as not_modified:
+            pool.fetch_json(f"{base}/not-modified.json", 5.0, "test-agent")
+        with pytest.raises(AODataHTTPError, match="redirects") as looped:
+            pool.fetch_json(f"{base}/loop.json", 5.0, "test-agent")
+    finally:
+        pool.close()
+
+    assert [path for path, _auth in _ProxyAndRedirectHandler.seen[:2]] == ["/moved.json", "/data.json"]
+    assert not_modified.value.status == 304
+    assert looped.value.status == 307
+
+
+def test_fetch_prices_records_bisected_batches_as_success() -> None:
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        item_part = url.split("/stats/prices/", 1)[1].split(".json", 1)[0]
+        if "," in item_part:
+            raise RuntimeError("HTTP Error 414: Request-URI Too Large")
+        return [{"item_id": item_part, "city": "Bridgewatch", "quality": 1}]
+
+    client = AODataClient(fetch_json=fake_fetch_json, max_retries=0)
+    rows = client.fetch_prices(
+        region=MarketRegion.EUROPE,
+        item_ids=["T4_A", "T4_B"],
+        locations=["Bridgewatch"],
+    )
+
+    stats = client.last_request_stats
+    assert [row.item_id for row in rows] == ["T4_A", "T4_B"]
+    assert stats.success
+    assert [batch.item_count for batch in stats.batches] == [2, 1, 1]
+    assert [batch.success for batch in stats.batches] == [False, True, True]
+
+
+def test_split_price_batches_matches_full_url_lengths() -> None:
+    client = AODataClient(fetch_json=lambda *_args: [], max_prices_url_length=400)
+    base = "https://europe.albion-online-data.com"
+    params = {"locations": "Bridgewatch,Martlock", "qualities": "1,2"}
+    item_ids = [f"T{4 + idx % 5}_ITEM_{'X' * (idx % 17)}_{idx}" for idx in range(300)]
+
+    batches = client._split_price_batches(base=base, item_ids=item_ids, params=params)
+
+    assert [item for batch in batches for item in batch] == item_ids
+    for idx, batch in enumerate(batches):
+        assert len(client._build_prices_url(base=base, item_ids=batch, params=params)) <= 400
+        if idx + 1 < len(batches):
+            grown = batch + batches[idx + 1][:1]
+            assert len(client._build_prices_url(base=base, item_ids=grown, params=params)) > 400
+
+
+def test_fetch_prices_learns_host_url_limit_from_414() -> None:
+    rejected: list[str] = []
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        if len(url) > 300:
+            rejected.append(url)
+            raise RuntimeError("HTTP Error 414: Request-URI Too Large")
+        item_part = url.split("/stats/prices/", 1)[1].split(".json", 1)[0]
+        return [{"item_id": item_id, "city": "Bridgewatch", "quality": 1} for item_id in item_part.split(",")]
+
+    item_ids = [f"T4_MAIN_SWORD_{idx:02d}" for idx in range(40)]
+    client = AODataClient(fetch_json=fake_fetch_json, max_prices_url_length=1800, max_retries=0)
+    first = client.fetch_prices(region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"])
+    assert rejected
+    rejected.clear()
+    second = client.fetch_prices(region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"])
+
+    assert [row.item_id for row in first] == item_ids
+    assert [row.item_id for row in second] == item_ids
+    assert rejected == []
+    assert all(batch.success for batch in client.last_request_stats.batches)
+
+
+def test_rate_limiter_queues_requests_across_windows() -> None:
+    now = {"value": 0.0}
+    slept: list[float] = []
+
+    def sleeper(seconds: float) -> None:
+        slept.append(seconds)
+
+    limiter = AODataRateLimiter(((2, 1.0), (3, 10.0)), clock=lambda: now["value"], sleeper=sleeper)
+
+    assert [limiter.acquire("host") for _ in range(2)] == [0.0, 0.0]
+    # Third request waits for the short window; the fourth exhausts the long one.
+    assert limiter.acquire("host") == pytest.approx(0.5)
+    assert limiter.acquire("host") == pytest.approx(10.0 / 3.0)
+    # Other hosts have their own buckets.
+    assert limiter.acquire("other") == 0.0
+
+    now["value"] = 20.0
+    limiter.block("host", 7.0)
+    assert limiter.acquire("host") == pytest.approx(7.0)
+    assert slept == pytest.approx([0.5, 10.0 / 3.0, 7.0])
+
+
+def test_rate_limiter_lets_foreground_requests_pass_background_ones() -> None:
+    now = {"value": 0.0}
+    order: list[str] = []
+
+    def sleeper(seconds: float) -> None:
+        if order == ["foreground"]:
+            # The foreground caller would sleep on its own thread.
+            return
+        if not order:
+            # A foreground request arrives while the background caller backs off.
+            order.append("foreground")
+            assert limiter.acquire("host") == pytest.approx(1.0)
+            order.append("foreground done")
+        now["value"] += seconds
+
+    limiter = AODataRateLimiter(((1, 1.0),), clock=lambda: now["value"], sleeper=sleeper)
+    assert limiter.acquire("host") == 0.0
+    waited = limiter.acquire("host", background=True)
+    order.append("background")
+
+    # The background caller did not reserve ahead, so it waited behind both
+    # the first token and the foreground reservation made meanwhile.
+    assert order == ["foreground", "foreground done", "background"]
+    assert waited == pytest.approx(2.0)
+    assert now["value"] == pytest.approx(2.0)
+
+
+def test_fetch_prices_treats_only_429_status_as_rate_limited() -> None:
+    slept: list[float] = []
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (url, timeout_seconds, user_agent)
+        raise RuntimeError("item T4_429_SWORD: too many requests in payload")
+
+    client = AODataClient(fetch_json=fake_fetch_json, max_retries=0, sleeper=slept.append)
+    with pytest.raises(RuntimeError, match="T4_429_SWORD"):
+        client.fetch_prices(region=MarketRegion.EUROPE, item_ids=["T4_MAIN_SWORD"], locations=["Bridgewatch"])
+
+    assert slept == []
+    assert client.last_request_stats.batches[0].attempts == 1
+
+
+def test_fetch_prices_waits_out_429_without_using_retries() -> None:
+    calls: list[str] = []
+    slept: list[float] = []
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        calls.append(url)
+        if len(calls) <= 2:
+            raise AODataHTTPError(429, "Too Many Requests", retry_after=3.0 if len(calls) == 1 else None)
+        return [{"item_id": "T4_MAIN_SWORD", "city": "Bridgewatch", "quality": 1}]
+
+    client = AODataClient(
+        fetch_json=fake_fetch_json,
+        max_retries=0,
+        rate_limit_default_wait_seconds=5.0,
+        sleeper=slept.append,
+    )
+    rows = client.fetch_prices(region=MarketRegion.EUROPE, item_ids=["T4_MAIN_SWORD"], locations=["Bridgewatch"])
+
+    assert len(rows) == 1
+    assert len(calls) == 3
+    assert slept == [pytest.approx(3.0, abs=0.1), pytest.approx(5.0, abs=0.1)]
+    batch = client.last_request_stats.batches[0]
+    assert batch.success and batch.attempts == 1
+    assert batch.rate_limit_wait_ms == pytest.approx(8000.0, abs=200.0)
+
+
+def test_fetch_prices_fails_after_rate_limit_retries() -> None:
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (url, timeout_seconds, user_agent)
+        raise AODataHTTPError(429, "Too Many Requests")
+
+    client = AODataClient(
+        fetch_json=fake_fetch_json,
+        max_retries=0,
+        max_rate_limit_retries=2,
+        sleeper=lambda _seconds: None,
+    )
+    with pytest.raises(RuntimeError, match="429"):
+        client.fetch_prices(region=MarketRegion.EUROPE, item_ids=["T4_MAIN_SWORD"], locations=["Bridgewatch"])
@@ -58,3 +58,132 @@ def test_sqlite_cache_clear_expired() -> None:
             assert cache.get_entry("fresh") is not None
     finally:
         shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_sqlite_cache_get_many_set_many() -> None:
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        with SQLiteCache(cache_path) as cache:
+            cache.set_many({f"key-{idx}": {"value": idx} for idx in range(1200)}, ttl_seconds=60)
+            cache.set("expired", {"value": -1}, ttl_seconds=0.0)
+            keys = [f"key-{idx}" for idx in range(0, 1200, 3)] + ["missing", "expired"]
+            entries = cache.get_many(keys)
+            assert len(entries) == 400
+            assert entries["key-600"].payload == {"value": 600}
+            assert "expired" in cache.get_many(keys, allow_expired=True)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_sqlite_cache_background_writes_are_readable_and_persisted() -> None:
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        cache = SQLiteCache(cache_path, background_writes=True, commit_interval=60.0)
+        cache.set_many({"a": [1], "b": [2]}, ttl_seconds=60)
+        cache.set("a", [3], ttl_seconds=60)
+        # Queued rows are visible before the writer commits them.
+        assert cache.get_entry("a").payload == [3]
+        assert set(cache.get_many(["a", "b"])) == {"a", "b"}
+        cache.close()
+
+        with SQLiteCache(cache_path) as reopened:
+            assert reopened.get_entry("a").payload == [3]
+            assert reopened.get_entry("b").payload == [2]
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_sqlite_cache_writer_thread_commits_periodically() -> None:
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        with SQLiteCache(cache_path, background_writes=True, commit_interval=0.01) as cache:
+            cache.set("key", {"v": 1}, ttl_seconds=60)
+            deadline = time.time() + 2.0
+            with SQLiteCache(cache_path) as reader:
+                while reader.get_entry("key") is None and time.time() < deadline:
+                    time.sleep(0.01)
+                assert reader.get_entry("key") is not None
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_sqlite_cache_compressed_payloads_read_legacy_rows() -> None:
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        with SQLiteCache(cache_path) as plain:
+            plain.set("legacy", {"rows": [1, 2, 3]}, ttl_seconds=60)
+        with SQLiteCache(cache_path, compress=True) as cache:
+            payload = [{"item_id": "T4_MAIN_SWORD", "city": "Bridgewatch"}] * 200
+            cache.set("compressed", payload, ttl_seconds=60)
+            assert cache.get_entry("legacy").payload == {"rows": [1, 2, 3]}
+            assert cache.get_entry("compressed").payload == payload
+            assert cache.payload_bytes() < 1000
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_sqlite_cache_evicts_least_recently_read_rows_over_cap() -> None:
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        with SQLiteCache(cache_path, max_bytes=1500, maintenance_interval=3600) as cache:
+            for idx in range(10):
+                cache.set(f"key-{idx}", "x" * 200, ttl_seconds=60)
+                time.sleep(0.002)
+            assert cache.get_entry("key-0") is not None
+            evicted = cache.maintain()
+            remaining = set(cache.get_many(f"key-{idx}" for idx in range(10)))
+            assert cache.payload_bytes() <= 1500
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    assert evicted >= 1
+    # key-0 was read most recently, so the oldest unread rows go first.
+    assert "key-0" in remaining
+    assert "key-1" not in remaining
+    assert "key-9" in remaining
+
+
+def test_sqlite_cache_counts_non_ascii_payloads_in_bytes() -> None:
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        with SQLiteCache(cache_path) as cache:
+            cache.set("clé", "é" * 100, ttl_seconds=60)
+            size = cache.payload_bytes()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # json.dumps keeps non-ASCII as UTF-8 text: 2 bytes per "é" plus the quotes.
+    assert size == len("clé".encode("utf-8")) + 202
+
+
+def test_sqlite_cache_migrates_json_only_schema() -> None:
+    import sqlite3
+
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        cache_path = tmp_dir / "market_cache.sqlite3"
+        conn = sqlite3.connect(str(cache_path))
+        conn.execute(
+            "CREATE TABLE market_cache (cache_key TEXT PRIMARY KEY, payload_json TEXT NOT NULL,"
+            " expires_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        conn.execute("INSERT INTO market_cache VALUES('old', '[1]', ?, ?)", (time.time() + 60, time.time()))
+        conn.commit()
+        conn.close()
+        with SQLiteCache(cache_path, compress=True, max_bytes=10_000) as cache:
+            assert cache.get_entry("old").payload == [1]
+            cache.set("new", [2], ttl_seconds=60)
+            assert cache.get_entry("new").payload == [2]
+            # The full VACUUM that enables auto_vacuum waits for maintenance.
+            assert cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+            cache.maintain()
+            assert cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+            assert cache.get_entry("old").payload == [1]
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from albion_dps.market.aod_client import MarketPriceRecord
 from albion_dps.market.engine import (
     BatchCraftRequest,
@@ -8,7 +10,9 @@ from albion_dps.market.engine import (
     compute_output_valuations,
     compute_batch_profit,
     compute_run_profit,
+    compile_catalog,
     effective_return_fraction,
+    scan_catalog_profits,
 )
 from albion_dps.market.models import (
     CraftSetup,
@@ -703,3 +707,132 @@ def test_build_craft_runs_batch_and_aggregate_profit() -> None:
     assert total.input_cost > 0
     assert total.output_value > 0
     assert total.focus_used == float((2 + 3) * recipe.focus_per_craft)
+
+
+def test_scan_catalog_profits_matches_per_recipe_runs() -> None:
+    from dataclasses import replace
+
+    sword_recipe = _build_recipe()
+    bar = sword_recipe.components[0].item
+    # Refining recipe with an unpriced-value output (fee estimated from price).
+    bar_recipe = Recipe(
+        item=replace(bar, item_value=None),
+        station="Smelter",
+        components=(RecipeComponent(item=replace(bar, unique_name="T4_ORE"), quantity=2.0),),
+        outputs=(RecipeOutput(item=replace(bar, item_value=None), quantity=1.0),),
+        focus_per_craft=0,
+    )
+    price_index = _build_price_index()
+    for city in ("Bridgewatch", "Martlock"):
+        for key, quote in list(price_index.items()):
+            price_index[(key[0], city, key[2])] = replace(quote, city=city)
+        price_index[("T4_ORE", city, 1)] = replace(
+            price_index[("T4_PLANKS", city, 1)], item_id="T4_ORE", buy_price_max=300
+        )
+    price_index[("T4_MAIN_SWORD", "Martlock", 1)] = replace(
+        price_index[("T4_MAIN_SWORD", "Martlock", 1)], sell_price_min=24000
+    )
+    setup = CraftSetup(
+        region=MarketRegion.EUROPE,
+        craft_city="Bridgewatch",
+        station_fee_percent=300.0,
+        market_tax_percent=6.5,
+        daily_bonus_percent=10.0,
+        quality=1,
+    )
+    catalog = compile_catalog([sword_recipe, bar_recipe])
+
+    rows = scan_catalog_profits(
+        catalog,
+        setup=setup,
+        price_index=price_index,
+        craft_cities=["Bridgewatch", "Martlock"],
+        runs=5,
+        sort_key="profit",
+        limit=10,
+    )
+
+    assert len(rows) == 4
+    assert [row.net_profit for row in rows] == sorted((row.net_profit for row in rows), reverse=True)
+    assert (rows[0].recipe, rows[0].craft_city) == (sword_recipe, "Martlock")
+    for row in rows:
+        row_setup = replace(
+            setup,
+            craft_city=row.craft_city,
+            default_buy_city=row.craft_city,
+            default_sell_city=row.craft_city,
+        )
+        run = build_craft_run(recipe=row.recipe, quantity=5, setup=row_setup, price_index=price_index)
+        expected = compute_run_profit(run)
+        assert row.input_cost == pytest.approx(expected.input_cost)
+        assert row.output_value == pytest.approx(expected.output_value)
+        assert row.station_fee == pytest.approx(expected.station_fee)
+        assert row.market_tax == pytest.approx(expected.market_tax)
+        assert row.margin_percent == pytest.approx(expected.margin_percent)
+        assert row.focus_used == expected.focus_used
+        raw_cost = sum(line.unit_price * c.quantity * 5 for line, c in zip(run.inputs, row.recipe.components))
+        assert row.return_savings == pytest.approx(raw_cost - expected.input_cost)
+
+    focus_rows = scan_catalog_profits(
+        catalog,
+        setup=setup,
+        price_index=price_index,
+        craft_cities=["Bridgewatch", "Martlock"],
+        sort_key="silver_per_focus",
+    )
+    assert {row.recipe for row in focus_rows} == {sword_recipe}
+
+    # Unpriced items are skipped unless explicitly kept.
+    del price_index[("T4_ORE", "Martlock", 1)]
+    rows = scan_catalog_profits(catalog, setup=setup, price_index=price_index, craft_cities=["Martlock"])
+    assert [row.recipe for row in rows] == [sword_recipe]
+    rows = scan_catalog_profits(
+        catalog, setup=setup, price_index=price_index, craft_cities=["Martlock"], require_prices=False
+    )
+    assert len(rows) == 2
+
+
+def test_build_craft_runs_batch_parallel_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    from dataclasses import replace
+
+    from albion_dps.market import engine
+
+    monkeypatch.setattr(engine, "PARALLEL_BATCH_MIN_REQUESTS", 16)
+    recipe = _build_recipe()
+    setup = CraftSetup(
+        region=MarketRegion.EUROPE,
+        craft_city="Bridgewatch",
+        default_buy_city="Bridgewatch",
+        default_sell_city="Bridgewatch",
+        station_fee_percent=6.0,
+        market_tax_percent=4.0,
+        quality=1,
+    )
+    price_index = _build_price_index()
+    # A second sell city, so per-request output cities resolve to different quotes.
+    price_index[("T4_MAIN_SWORD", "Martlock", 1)] = replace(
+        price_index[("T4_MAIN_SWORD", "Bridgewatch", 1)],
+        city="Martlock",
+        sell_price_min=17000,
+    )
+    requests = [
+        BatchCraftRequest(
+            recipe=recipe,
+            quantity=1 + idx % 5,
+            output_cities={"T4_MAIN_SWORD": "Martlock" if idx % 2 else "Bridgewatch"},
+            manual_input_prices={"T4_PLANKS": 450} if idx % 7 == 0 else None,
+        )
+        for idx in range(67)
+    ]
+
+    serial = build_craft_runs_batch(setup=setup, requests=requests, price_index=price_index)
+    parallel = build_craft_runs_batch(
+        setup=setup,
+        requests=requests,
+        price_index=price_index,
+        max_workers=2,
+        chunk_size=10,
+    )
+
+    assert parallel == serial
+    assert compute_batch_profit(parallel) == compute_batch_profit(serial)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import threading
+
+from albion_dps.market.aod_client import AODataClient
+from albion_dps.market.cache import SQLiteCache
+from albion_dps.market.models import MarketRegion
+from albion_dps.market.prefetch import PrefetchProgress, prefetch_prices
+from albion_dps.market.service import MarketDataService
+
+
+def _fake_fetch_json(requested: list[list[str]], *, fail_item: str = ""):
+    def fetch(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        item_ids = url.split("/stats/prices/", 1)[1].split(".json", 1)[0].split(",")
+        requested.append(item_ids)
+        if fail_item in item_ids:
+            raise RuntimeError("HTTP Error 503: Service Unavailable")
+        return [{"item_id": item_id, "city": "Bridgewatch", "quality": 1, "sell_price_min": 100} for item_id in item_ids]
+
+    return fetch
+
+
+def test_prefetch_warms_cache_in_chunks_and_skips_warm_keys(tmp_path) -> None:
+    requested: list[list[str]] = []
+    item_ids = [f"T4_ITEM_{idx:02d}" for idx in range(10)]
+    updates: list[PrefetchProgress] = []
+    with SQLiteCache(tmp_path / "cache.sqlite3") as cache:
+        service = MarketDataService(client=AODataClient(fetch_json=_fake_fetch_json(requested)), cache=cache)
+        service.get_prices(region=MarketRegion.EUROPE, item_ids=item_ids[:4], locations=["Bridgewatch"])
+        requested.clear()
+
+        first = prefetch_prices(
+            service,
+            region=MarketRegion.EUROPE,
+            item_ids=item_ids,
+            locations=["Bridgewatch"],
+            chunk_size=4,
+            progress=updates.append,
+        )
+        second = prefetch_prices(service, region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"])
+
+    assert [item for batch in requested for item in batch] == item_ids[4:]
+    assert [update.done_items for update in updates] == [4, 8, 10]
+    assert first.finished and not first.cancelled
+    assert (first.cached_keys, first.fetched_keys) == (4, 6)
+    assert (second.cached_keys, second.fetched_keys) == (10, 0)
+
+
+def test_prefetch_keeps_expired_keys_when_stale_rows_are_allowed(tmp_path) -> None:
+    requested: list[list[str]] = []
+    item_ids = ["T4_ITEM_00", "T4_ITEM_01"]
+    with SQLiteCache(tmp_path / "cache.sqlite3") as cache:
+        service = MarketDataService(client=AODataClient(fetch_json=_fake_fetch_json(requested)), cache=cache)
+        service.get_prices(
+            region=MarketRegion.EUROPE, item_ids=item_ids[:1], locations=["Bridgewatch"], ttl_seconds=0.0
+        )
+        requested.clear()
+
+        lenient = prefetch_prices(
+            service, region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"], allow_stale=True
+        )
+        strict = prefetch_prices(service, region=MarketRegion.EUROPE, item_ids=item_ids, locations=["Bridgewatch"])
+
+    assert requested == [["T4_ITEM_01"], ["T4_ITEM_00"]]
+    assert (lenient.cached_keys, lenient.fetched_keys) == (1, 1)
+    assert (strict.cached_keys, strict.fetched_keys) == (1, 1)
+
+
+def test_prefetch_counts_failed_chunks_and_stops_when_cancelled() -> None:
+    requested: list[list[str]] = []
+    service = MarketDataService(
+        client=AODataClient(fetch_json=_fake_fetch_json(requested, fail_item="T4_B"), max_retries=0),
+        cache=None,
+    )
+    failed = prefetch_prices(
+        service,
+        region=MarketRegion.EUROPE,
+        item_ids=["T4_A", "T4_B", "T4_C"],
+        locations=["Bridgewatch"],
+        chunk_size=1,
+    )
+    assert failed.failed_chunks == 1
+    assert failed.done_items == 3
+    assert "503" in failed.last_error
+
+    cancelled = threading.Event()
+    requested.clear()
+    stopped = prefetch_prices(
+        service,
+        region=MarketRegion.EUROPE,
+        item_ids=["T4_A", "T4_C", "T4_D"],
+        locations=["Bridgewatch"],
+        chunk_size=1,
+        cancelled=cancelled,
+        progress=lambda _progress: cancelled.set(),
+    )
+    assert requested == [["T4_A"]]
+    assert stopped.cancelled and stopped.finished
+    assert stopped.done_items == 1
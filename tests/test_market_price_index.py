@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+
+from albion_dps.market.aod_client import MarketPriceRecord
+from albion_dps.market.price_index import PriceIndex, item_id_candidates
+
+
+def _linear_quote(price_index, *, item_id: str, city: str, quality: int, mode: str | None):
+    """Reference: candidate lookups at quality and 1, then a full scan of the index."""
+
+    def has_price(quote: MarketPriceRecord) -> bool:
+        if mode == "buy_order":
+            return quote.buy_price_max > 0
+        if mode == "sell_order":
+            return quote.sell_price_min > 0
+        return quote.buy_price_max > 0 or quote.sell_price_min > 0
+
+    candidates = item_id_candidates(item_id)
+    fallback = None
+    for candidate_id in candidates:
+        for candidate_quality in (quality, 1):
+            quote = price_index.get((candidate_id, city, candidate_quality))
+            if quote is None:
+                continue
+            if has_price(quote):
+                return quote
+            fallback = fallback or quote
+    for (candidate_id, candidate_city, _quality), quote in price_index.items():
+        if candidate_city == city and candidate_id in candidates:
+            if has_price(quote):
+                return quote
+            fallback = fallback or quote
+    return fallback
+
+
+def test_price_index_matches_linear_lookup() -> None:
+    rng = random.Random(7)
+    ids = ["T4_METALBAR", "T4_METALBAR@2", "T4_METALBAR_LEVEL2", "T4_METALBAR_LEVEL2@2", "T5_PLANKS@1"]
+    cities = ["Bridgewatch", "Martlock"]
+    records: dict[tuple[str, str, int], MarketPriceRecord] = {}
+    for _ in range(40):
+        item_id, city, quality = rng.choice(ids), rng.choice(cities), rng.randint(1, 5)
+        records[(item_id, city, quality)] = MarketPriceRecord(
+            item_id=item_id,
+            city=city,
+            quality=quality,
+            sell_price_min=rng.choice([0, 0, 100, 200]),
+            buy_price_max=rng.choice([0, 0, 90, 180]),
+            sell_price_min_date="",
+            buy_price_max_date="",
+        )
+    index = PriceIndex(records)
+
+    assert len(index) == len(records)
+    assert dict(index) == records
+    for item_id in [*ids, "T5_PLANKS_LEVEL1", "T6_UNKNOWN", ""]:
+        for city in [*cities, "Lymhurst"]:
+            for quality in range(1, 6):
+                for mode in (None, "buy_order", "sell_order"):
+                    expected = _linear_quote(records, item_id=item_id, city=city, quality=quality, mode=mode)
+                    assert index.quote(item_id, city, quality, preferred_mode=mode) is expected
+
+
+def test_price_index_of_reuses_existing_index() -> None:
+    index = PriceIndex({})
+    assert PriceIndex.of(index) is index
+    assert index.quote("T4_METALBAR", "Bridgewatch", 1) is None
+    assert item_id_candidates("T4_METALBAR_LEVEL3") == (
+        "T4_METALBAR_LEVEL3",
+        "T4_METALBAR_LEVEL3@3",
+        "T4_METALBAR",
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 import shutil
 import uuid
@@ -587,3 +588,323 @@ def test_market_setup_state_plan_row_city_and_daily_bonus_affect_preview() -> No
     rrr_value = model.data(model_index, model.ReturnRateRole)
     assert city_value == "Martlock"
     assert rrr_value is not None
+
+
+def _builtin_catalog(_self) -> market_state.RecipeCatalog:
+    recipe = MarketSetupState._build_builtin_recipe()
+    return market_state.RecipeCatalog(recipes={recipe.item.unique_name: recipe})
+
+
+def _qt_app():
+    from PySide6.QtGui import QGuiApplication
+
+    # Workers report back through queued signals, so tests need a running app;
+    # without a display it must use the offscreen platform (as in test_qt_smoke).
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return QGuiApplication.instance() or QGuiApplication([])
+
+
+def _wait_for_price_fetch(state: MarketSetupState) -> None:
+    app = _qt_app()
+    state._price_pool.waitForDone(5000)
+    app.processEvents()
+
+
+def test_market_setup_state_background_fetch_renders_fallback_then_live(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(MarketSetupState, "_load_catalog", _builtin_catalog)
+    service = _FakeMarketService()
+    state = MarketSetupState(
+        service=service,
+        auto_refresh_prices=False,
+        background_price_fetch=True,
+    )
+    state.addCurrentRecipeToPlan()
+    state.setActiveMarketTab(1)
+
+    # Preview is already built from fallback prices while the fetch runs.
+    assert state.pricesSource == "loading"
+    assert state.priceFetchInProgress is True
+    assert state.outputsTotalValue > 0
+
+    _wait_for_price_fetch(state)
+
+    assert service.calls == 1
+    assert state.pricesSource == "live"
+    assert state.priceFetchInProgress is False
+    state.close()
+
+
+def test_market_setup_state_background_fetch_drops_superseded_results(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+
+    monkeypatch.setattr(MarketSetupState, "_load_catalog", _builtin_catalog)
+    gate = threading.Event()
+
+    class _SlowService(_FakeMarketService):
+        def get_price_index(self, **kwargs):
+            gate.wait(5)
+            return super().get_price_index(**kwargs)
+
+    service = _SlowService()
+    state = MarketSetupState(
+        service=service,
+        auto_refresh_prices=False,
+        background_price_fetch=True,
+    )
+    state.addCurrentRecipeToPlan()
+    state.setActiveMarketTab(1)
+    state._next_live_fetch_not_before = 0.0
+    state.refreshPrices()
+    gate.set()
+
+    _wait_for_price_fetch(state)
+
+    assert state.pricesSource == "live"
+    assert state.diagnosticsText.count("Prices loaded from live") == 1
+    state.close()
+
+
+def test_market_setup_state_debounced_edits_rebuild_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(MarketSetupState, "_load_catalog", _builtin_catalog)
+    service = _FakeMarketService()
+    state = MarketSetupState(
+        service=service,
+        auto_refresh_prices=False,
+        preview_debounce_ms=50,
+    )
+    state.addCurrentRecipeToPlan()
+    state._flush_preview()
+    rebuilds: list[bool] = []
+    price_lookups: list[bool] = []
+    original_rebuild = state._rebuild_preview
+    original_price_index = state._current_price_index
+
+    def counting_rebuild(**kwargs):
+        rebuilds.append(kwargs.get("reuse_price_index", False))
+        return original_rebuild(**kwargs)
+
+    def counting_price_index(*args, **kwargs):
+        price_lookups.append(True)
+        return original_price_index(*args, **kwargs)
+
+    monkeypatch.setattr(state, "_rebuild_preview", counting_rebuild)
+    monkeypatch.setattr(state, "_current_price_index", counting_price_index)
+
+    state.setCraftRuns(3)
+    state.setCraftRuns(4)
+    state.setCraftRuns(5)
+    assert rebuilds == []
+    state._flush_preview()
+    assert rebuilds == [False]
+    assert len(price_lookups) == 1
+
+    # Preference-only edits reuse the resolved price index.
+    inputs = state.inputsModel
+    item_id = inputs.data(inputs.index(0, 0), inputs.ItemIdRole)
+    current = inputs.data(inputs.index(0, 0), inputs.PriceTypeRole)
+    state.setInputPriceType(item_id, "average" if current != "average" else "sell_order")
+    state._flush_preview()
+    assert rebuilds == [False, True]
+    assert len(price_lookups) == 1
+
+    # Results-only edits re-sort without a rebuild.
+    state.setResultsSortKey("revenue")
+    state._flush_preview()
+    assert rebuilds == [False, True]
+    state.close()
+
+
+def test_market_setup_state_recomputes_only_invalidated_plan_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from dataclasses import replace
+
+    base = MarketSetupState._build_builtin_recipe()
+    variant = replace(base, item=replace(base.item, unique_name=f"{base.item.unique_name}@1"))
+
+    def catalog(_self) -> market_state.RecipeCatalog:
+        return market_state.RecipeCatalog(
+            recipes={base.item.unique_name: base, variant.item.unique_name: variant}
+        )
+
+    monkeypatch.setattr(MarketSetupState, "_load_catalog", catalog)
+    built: list[str] = []
+    original_build = market_state.build_craft_run
+
+    def counting_build(**kwargs):
+        built.append(kwargs["recipe"].item.unique_name)
+        return original_build(**kwargs)
+
+    monkeypatch.setattr(market_state, "build_craft_run", counting_build)
+    state = MarketSetupState(service=_FakeMarketService(), auto_refresh_prices=False)
+    state.addRecipeToPlan(base.item.unique_name)
+    state.addRecipeToPlan(variant.item.unique_name)
+    rows = {row.recipe_id: row for row in state._craft_plan_rows}
+    total_before = state.outputsTotalValue
+
+    variant_row = rows[variant.item.unique_name]
+    built.clear()
+    state.setPlanRowRuns(variant_row.row_id, variant_row.runs + 5)
+    assert built == [variant.item.unique_name]
+    assert state.outputsTotalValue > total_before
+
+    built.clear()
+    state.setPlanRowRuns(variant_row.row_id, variant_row.runs + 5)
+    state.setResultsSortKey("margin")
+    assert built == []
+
+    # Both recipes share their items, so a price preference edit touches both rows.
+    item_id = base.components[0].item.unique_name
+    state.setInputManualPrice(item_id, "123")
+    assert sorted(built) == sorted([base.item.unique_name, variant.item.unique_name])
+    state.close()
+
+
+def test_recipe_search_index_matches_linear_filter_and_ranks_prefixes() -> None:
+    rows = [
+        market_state.RecipeOptionRow(
+            recipe_id=f"T{tier}_{base}" + (f"@{enchant}" if enchant else ""),
+            display_name=f"{label} {tier}.{enchant}",
+            tier=tier,
+            enchant=enchant,
+        )
+        for tier in range(4, 9)
+        for enchant in range(0, 4)
+        for base, label in (
+            ("MAIN_SWORD", "Broadsword"),
+            ("2H_CLAYMORE", "Claymore"),
+            ("METALBAR", "Steel Bar"),
+            ("OFF_SHIELD", "Shield"),
+        )
+    ]
+    index = market_state._RecipeSearchIndex(rows)
+
+    for query in ("", "sw", "swo", "sword", "t5 sword", "6.2", "t7 bar", "clay more", "zzz", "ield 4"):
+        recipe_filter = market_state._parse_recipe_filter(query)
+        for enchant in (None, 1):
+            # Reference: plain linear scan with the index's substring semantics.
+            expected = {
+                row.recipe_id
+                for row in rows
+                if (recipe_filter.tier is None or row.tier == recipe_filter.tier)
+                and (recipe_filter.enchant is None or row.enchant == recipe_filter.enchant)
+                and all(term in f"{row.display_name} {row.recipe_id}".lower() for term in recipe_filter.terms)
+                and (enchant is None or row.enchant == enchant)
+            }
+            found = index.search(recipe_filter, enchant=enchant)
+            assert {row.recipe_id for row in found} == expected, (query, enchant)
+
+    # Name prefix matches ("Steel Bar", "Shield") rank ahead of substring matches.
+    ranked = index.search(market_state._parse_recipe_filter("s"))
+    assert ranked[0].display_name.lower().startswith("s")
+    ranked = index.search(market_state._parse_recipe_filter("sword"))
+    assert {row.recipe_id.split("_", 1)[1].split("@")[0] for row in ranked} == {"MAIN_SWORD"}
+
+
+def test_recipe_options_model_narrows_previous_matches() -> None:
+    rows = [
+        market_state.RecipeOptionRow(recipe_id="T4_MAIN_SWORD", display_name="Broadsword", tier=4, enchant=0),
+        market_state.RecipeOptionRow(recipe_id="T4_2H_CLAYMORE", display_name="Claymore", tier=4, enchant=0),
+        market_state.RecipeOptionRow(recipe_id="T5_MAIN_SWORD", display_name="Broadsword", tier=5, enchant=0),
+    ]
+    model = market_state.RecipeOptionsModel()
+    model.set_items(rows)
+    model.set_query("s")
+    assert model.recipe_ids() == ["T4_MAIN_SWORD", "T5_MAIN_SWORD"]
+
+    checked: list[int] = []
+
+    class _RecordingHaystacks(list):
+        def __getitem__(self, idx):
+            checked.append(idx)
+            return super().__getitem__(idx)
+
+    index = model._search_index
+    index._haystacks = _RecordingHaystacks(index._haystacks)
+    # "sw" has no trigram, so only the narrowing from "s" limits the candidates.
+    model.set_query("sw")
+    assert model.recipe_ids() == ["T4_MAIN_SWORD", "T5_MAIN_SWORD"]
+    assert 1 not in checked
+
+    checked.clear()
+    model.set_query("cl")
+    assert model.recipe_ids() == ["T4_2H_CLAYMORE"]
+    assert 1 in checked
+
+
+def test_market_setup_state_prefetch_waits_for_idle_and_reports_progress(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import time
+
+    from albion_dps.market.aod_client import AODataClient
+    from albion_dps.market.service import MarketDataService
+
+    monkeypatch.setattr(MarketSetupState, "_load_catalog", _builtin_catalog)
+    requested: list[str] = []
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        requested.append(url)
+        return []
+
+    app = _qt_app()
+    service = MarketDataService(client=AODataClient(fetch_json=fake_fetch_json), cache=None)
+    state = MarketSetupState(service=service, auto_refresh_prices=False)
+    # Simulate a foreground fetch in progress: the prefetch must not start requesting.
+    state._prefetch_idle.clear()
+    state.startPricePrefetch("catalog")
+    assert state.prefetchActive is True
+    time.sleep(0.3)
+    assert requested == []
+
+    state._prefetch_idle.set()
+    state._prefetch_pool.waitForDone(5000)
+    app.processEvents()
+
+    assert requested
+    assert state.prefetchActive is False
+    assert state.prefetchStatusText.startswith("Price cache done (catalog)")
+    assert "Price prefetch done (catalog)" in state.diagnosticsText
+    state.close()
+
+
+def test_market_setup_state_profit_scan_ranks_catalog_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(MarketSetupState, "_load_catalog", _builtin_catalog)
+    seen: list[dict] = []
+
+    class _RecordingService(_FakeMarketService):
+        def get_price_index(self, **kwargs):
+            seen.append(kwargs)
+            return super().get_price_index(**kwargs)
+
+    app = _qt_app()
+    state = MarketSetupState(service=_RecordingService(), auto_refresh_prices=False)
+    state.runProfitScan()
+    assert state.profitScanRunning is True
+    state._profit_scan_pool.waitForDone(5000)
+    app.processEvents()
+
+    model = state.profitScanModel
+    assert state.profitScanRunning is False
+    assert seen and seen[-1]["allow_live"] is False
+    assert model.rowCount() >= 1
+    first = model.index(0, 0)
+    assert model.data(first, model.RecipeIdRole) == "T4_MAIN_SWORD"
+    assert model.data(first, model.ProfitRole) != 0
+    assert state.profitScanStatusText.startswith("Top ")
+
+    state.setProfitScanSortKey("profit")
+    state._profit_scan_pool.waitForDone(5000)
+    app.processEvents()
+    assert state.profitScanSortKey == "profit"
+    assert state.profitScanStatusText == f"Top {model.rowCount()} by profit."
+    state.close()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import shutil
+import threading
 import time
 import uuid
 from pathlib import Path
@@ -228,3 +229,154 @@ def test_service_cache_only_mode_returns_empty_without_live_call() -> None:
     assert rows == []
     assert call_count["value"] == 0
     assert service.last_prices_meta.source == "cache_miss"
+
+
+def test_service_fetches_only_missing_price_keys() -> None:
+    requested_urls: list[str] = []
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        requested_urls.append(url)
+        path, _, query = url.partition("?")
+        item_ids = path.rsplit("/", 1)[-1].removesuffix(".json").split(",")
+        params = dict(part.split("=", 1) for part in query.split("&"))
+        locations = params["locations"].replace("%2C", ",").split(",")
+        return [
+            {
+                "item_id": item_id,
+                "city": location,
+                # T4_NO_DATA only has a quality 2 row, so its quality 1 key is known-empty.
+                "quality": 2 if item_id == "T4_NO_DATA" else 1,
+                "sell_price_min": 1000,
+                "buy_price_max": 900,
+                "sell_price_min_date": "",
+                "buy_price_max_date": "",
+            }
+            for item_id in item_ids
+            for location in locations
+        ]
+
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        client = AODataClient(fetch_json=fake_fetch_json)
+        with SQLiteCache(tmp_dir / "cache.sqlite3") as cache:
+            service = MarketDataService(client=client, cache=cache)
+            service.get_prices(
+                region=MarketRegion.EUROPE,
+                item_ids=["T4_MAIN_SWORD", "T4_METALBAR", "T4_NO_DATA"],
+                locations=["Bridgewatch"],
+            )
+            assert service.last_prices_meta.source == "live"
+
+            # New item: only that item is fetched; known-empty keys stay cached.
+            rows = service.get_prices(
+                region=MarketRegion.EUROPE,
+                item_ids=["T4_MAIN_SWORD", "T4_METALBAR", "T4_NO_DATA", "T4_PLANKS"],
+                locations=["Bridgewatch"],
+            )
+            assert len(rows) == 3
+            assert "T4_PLANKS" in requested_urls[-1]
+            assert "T4_MAIN_SWORD" not in requested_urls[-1]
+            assert service.last_prices_meta.source == "cache+live"
+            assert service.last_prices_meta.cached_keys == 3
+            assert service.last_prices_meta.fetched_keys == 1
+
+            # New city: every item is fetched once, for that city only.
+            rows = service.get_prices(
+                region=MarketRegion.EUROPE,
+                item_ids=["T4_MAIN_SWORD", "T4_METALBAR"],
+                locations=["Bridgewatch", "Lymhurst"],
+            )
+            assert len(rows) == 4
+            assert len(requested_urls) == 3
+            assert "Lymhurst" in requested_urls[-1]
+            assert "Bridgewatch" not in requested_urls[-1]
+
+            service.get_prices(
+                region=MarketRegion.EUROPE,
+                item_ids=["T4_MAIN_SWORD", "T4_METALBAR"],
+                locations=["Lymhurst", "Bridgewatch"],
+            )
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    assert len(requested_urls) == 3
+    assert service.last_prices_meta.source == "cache"
+
+
+def test_service_caches_known_empty_price_keys_briefly_and_only_when_covered() -> None:
+    requested_urls: list[str] = []
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        requested_urls.append(url)
+        return [
+            # Covered: the item/city came back, just not at quality 1.
+            {"item_id": "T4_MAIN_SWORD", "city": "Bridgewatch", "quality": 2, "sell_price_min": 1200},
+            # Not covered: AO Data spelled the id differently, so T4_METALBAR@1 got no row.
+            {"item_id": "T4_METALBAR_LEVEL1@1", "city": "Bridgewatch", "quality": 1, "sell_price_min": 900},
+        ]
+
+    def fetch(service: MarketDataService) -> None:
+        service.get_prices(
+            region=MarketRegion.EUROPE,
+            item_ids=["T4_MAIN_SWORD", "T4_METALBAR@1"],
+            locations=["Bridgewatch"],
+            allow_stale=False,
+        )
+
+    tmp_dir = _make_local_tmp_dir()
+    try:
+        client = AODataClient(fetch_json=fake_fetch_json)
+        with SQLiteCache(tmp_dir / "cache.sqlite3") as cache:
+            service = MarketDataService(client=client, cache=cache, negative_ttl_seconds=0.2)
+            fetch(service)
+            fetch(service)
+            assert len(requested_urls) == 2
+            assert "T4_METALBAR@1" in requested_urls[-1]
+            assert "T4_MAIN_SWORD" not in requested_urls[-1]
+            assert service.last_prices_meta.cached_keys == 1
+
+            time.sleep(0.3)
+            fetch(service)
+            assert len(requested_urls) == 3
+            assert "T4_MAIN_SWORD" in requested_urls[-1]
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_service_joins_identical_in_flight_price_fetches() -> None:
+    calls: list[str] = []
+    release = threading.Event()
+
+    def fake_fetch_json(url: str, timeout_seconds: float, user_agent: str):
+        _ = (timeout_seconds, user_agent)
+        calls.append(url)
+        release.wait(timeout=5.0)
+        return [{"item_id": "T4_MAIN_SWORD", "city": "Bridgewatch", "quality": 1, "sell_price_min": 1200}]
+
+    client = AODataClient(fetch_json=fake_fetch_json)
+    service = MarketDataService(client=client, cache=None)
+    results: list[int] = []
+
+    def worker() -> None:
+        rows = service.get_prices(
+            region=MarketRegion.EUROPE,
+            item_ids=["T4_MAIN_SWORD"],
+            locations=["Bridgewatch"],
+        )
+        results.append(len(rows))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5.0
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5.0)
+
+    assert results == [1, 1, 1, 1]
+    assert len(calls) == 1
@@ -53,3 +53,38 @@ def test_meter_touch_expires_dps_window() -> None:
     assert snapshot.totals[1]["damage"] == 100.0
     assert abs(snapshot.totals[1]["dps"] - 0.0) < 1e-6
     assert abs(snapshot.totals[1]["hps"] - 0.0) < 1e-6
+
+
+def test_meter_bucketed_window_bounds_memory() -> None:
+    meter = RollingMeter(window_seconds=10.0, session_timeout_seconds=None, bucket_seconds=0.5)
+    for idx in range(5000):
+        meter.push(CombatEvent(idx * 0.004, 1 + idx % 50, 2, 10, "damage"))
+
+    assert len(meter._damage_window) <= int(10.0 / 0.5) + 1
+    snapshot = meter.snapshot()
+    assert snapshot.totals[1]["damage"] == 1000.0
+
+
+def test_meter_bucketed_window_error_bound() -> None:
+    exact = RollingMeter(window_seconds=10.0, session_timeout_seconds=None)
+    bucketed = RollingMeter(window_seconds=10.0, session_timeout_seconds=None, bucket_seconds=0.1)
+    for idx in range(3000):
+        event = CombatEvent(idx * 0.01, 1, 2, 7, "damage")
+        exact.push(event)
+        bucketed.push(event)
+
+    for now in (15.0, 20.05, 29.99, 30.0, 40.1):
+        exact_dps = exact.snapshot(now=now).totals[1]["dps"]
+        bucketed_dps = bucketed.snapshot(now=now).totals[1]["dps"]
+        # At most one bucket (0.1s of hits) late to expire.
+        assert 0.0 <= bucketed_dps - exact_dps <= (7 * 10 + 1e-6) / 10.0
+
+
+def test_meter_bucketed_window_ignores_hits_older_than_window() -> None:
+    meter = RollingMeter(window_seconds=10.0, session_timeout_seconds=None, bucket_seconds=0.1)
+    meter.push(CombatEvent(30.0, 1, 2, 100, "damage"))
+    meter.push(CombatEvent(5.0, 1, 2, 50, "damage"))
+
+    snapshot = meter.snapshot()
+    assert snapshot.totals[1]["damage"] == 150.0
+    assert abs(snapshot.totals[1]["dps"] - 10.0) < 1e-6
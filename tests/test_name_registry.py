@@ -68,3 +68,38 @@ def test_name_registry_id_name_mapping() -> None:
     names = registry.snapshot()
 
     assert names[84367] == "D4dits"
+
+
+def test_name_registry_names_version_tracks_changes() -> None:
+    registry = NameRegistry()
+    assert registry.names_version() == 0
+
+    registry.record(10, "Alice")
+    version = registry.names_version()
+    assert version > 0
+
+    registry.lookup(10)
+    registry.snapshot()
+    assert registry.names_version() == version
+
+    registry.record(11, "Bob")
+    assert registry.names_version() > version
+
+
+def test_name_registry_names_version_ignores_repeated_values() -> None:
+    registry = NameRegistry()
+    guid_message = PhotonMessage(opcode=1, event_code=1, payload=bytes.fromhex(_GUID_NAME_PAYLOAD_HEX))
+    link_message = PhotonMessage(opcode=1, event_code=1, payload=bytes.fromhex(_GUID_LINK_PAYLOAD_HEX))
+
+    registry.record(10, "Alice")
+    registry.observe(guid_message)
+    registry.observe(link_message)
+    version = registry.names_version()
+
+    registry.record(10, "Alice")
+    registry.observe(guid_message)
+    registry.observe(link_message)
+    assert registry.names_version() == version
+
+    registry.record(10, "Alicia")
+    assert registry.names_version() > version
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from albion_dps.meter.session_meter import SessionEntry, SessionSummary
+from albion_dps.qt import models
+from albion_dps.qt.models import _build_history_rows, _HistoryRowCache
+
+
+def _summary(start_ts: float, damage: float = 100.0, label: str = "123") -> SessionSummary:
+    return SessionSummary(
+        mode="battle",
+        start_ts=start_ts,
+        end_ts=start_ts + 10.0,
+        duration=10.0,
+        label=None,
+        entries=[
+            SessionEntry(
+                label=label, damage=damage, heal=0.0, dps=damage / 10.0, hps=0.0, source_id=123
+            )
+        ],
+        total_damage=damage,
+        total_heal=0.0,
+        reason="timeout",
+    )
+
+
+@pytest.fixture
+def format_calls(monkeypatch) -> list[float]:
+    calls: list[float] = []
+    original = models._format_history_row
+
+    def counting(summary, **kwargs):
+        calls.append(summary.start_ts)
+        return original(summary, **kwargs)
+
+    monkeypatch.setattr(models, "_format_history_row", counting)
+    return calls
+
+
+def test_history_rows_format_each_summary_once(format_calls) -> None:
+    cache = _HistoryRowCache()
+    history = [_summary(20.0), _summary(0.0)]
+
+    first = _build_history_rows(history, names={}, limit=5, cache=cache)
+    second = _build_history_rows(history, names={}, limit=5, selected_index=1, cache=cache)
+
+    assert format_calls == [20.0, 0.0]
+    assert [row.selected for row in second] == [False, True]
+    assert [row.label for row in second] == [row.label for row in first]
+
+
+def test_history_rows_rebuild_replaced_summary_and_name_changes(format_calls) -> None:
+    cache = _HistoryRowCache()
+    older = _summary(0.0)
+    history = [_summary(20.0), older]
+    _build_history_rows(history, names={}, limit=5, cache=cache)
+
+    # Same key, new object (e.g. relabelled by the meter) is reformatted.
+    history = [_summary(20.0, label="Alice"), older]
+    rows = _build_history_rows(history, names={}, limit=5, cache=cache)
+    assert format_calls == [20.0, 0.0, 20.0]
+    assert "Alice" in rows[0].players
+
+    cache.names_changed()
+    rows = _build_history_rows(history, names={123: "Bob"}, limit=5, cache=cache)
+    assert format_calls == [20.0, 0.0, 20.0, 20.0, 0.0]
+    assert "Bob" in rows[1].players
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from albion_dps.qt.models import HistoryModel, HistoryRow, PlayerModel, PlayerRow
+
+
+def _player(name: str, dps: float, bar: float = 1.0) -> PlayerRow:
+    return PlayerRow(
+        name=name,
+        damage=dps * 10,
+        heal=0.0,
+        dps=dps,
+        hps=0.0,
+        bar_ratio=bar,
+        role="dps",
+        color="#fff",
+        weapon_name="",
+        weapon_tier="",
+        weapon_icon="",
+    )
+
+
+def _record(model) -> list[tuple]:
+    events: list[tuple] = []
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.rowsInserted.connect(lambda _parent, first, last: events.append(("insert", first, last)))
+    model.rowsRemoved.connect(lambda _parent, first, last: events.append(("remove", first, last)))
+    model.rowsMoved.connect(lambda *_args: events.append(("move",)))
+    model.dataChanged.connect(
+        lambda top, _bottom, roles: events.append(("changed", top.row(), tuple(roles)))
+    )
+    return events
+
+
+def _names(model: PlayerModel) -> list[str]:
+    return [model.data(model.index(row, 0), PlayerModel.NameRole) for row in range(model.rowCount())]
+
+
+def test_player_model_emits_changed_roles_only() -> None:
+    model = PlayerModel()
+    model.set_items([_player("a", 10.0), _player("b", 5.0, 0.5)])
+    events = _record(model)
+
+    model.set_items([_player("a", 12.0), _player("b", 5.0, 0.5)])
+
+    assert events == [("changed", 0, (PlayerModel.DamageRole, PlayerModel.DpsRole))]
+
+
+def test_player_model_moves_inserts_and_removes_without_reset() -> None:
+    model = PlayerModel()
+    model.set_items([_player("a", 10.0), _player("b", 5.0), _player("c", 1.0)])
+    events = _record(model)
+
+    model.set_items([_player("c", 20.0), _player("d", 8.0), _player("a", 10.0)])
+
+    assert _names(model) == ["c", "d", "a"]
+    assert ("reset",) not in events
+    assert ("remove", 1, 1) in events
+    assert ("move",) in events
+    assert ("insert", 1, 1) in events
+
+
+def test_player_model_diff_matches_target_order_randomized() -> None:
+    rng = random.Random(11)
+    model = PlayerModel()
+    pool = [chr(ord("a") + idx) for idx in range(12)]
+    for _ in range(200):
+        names = rng.sample(pool, rng.randint(0, len(pool)))
+        model.set_items([_player(name, rng.random()) for name in names])
+        assert _names(model) == names
+
+
+def test_history_model_keys_rows_by_summary_key() -> None:
+    model = HistoryModel()
+    first = HistoryRow("battle 00:10", "meta", "p", "copy", False, key=("battle", 1.0))
+    second = HistoryRow("battle 00:05", "meta", "p", "copy", False, key=("battle", 2.0))
+    model.set_items([first])
+    events = _record(model)
+
+    model.set_items([second, HistoryRow("battle 00:10", "meta", "p", "copy", True, key=("battle", 1.0))])
+
+    assert events == [("insert", 0, 0), ("changed", 1, (HistoryModel.SelectedRole,))]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from albion_dps.qt.scanner import ScannerLogModel
+
+
+def test_log_model_batches_appends_into_one_insert() -> None:
+    model = ScannerLogModel(max_lines=5, flush_interval_ms=50)
+    inserts: list[tuple[int, int]] = []
+    removes: list[tuple[int, int]] = []
+    model.rowsInserted.connect(lambda _parent, first, last: inserts.append((first, last)))
+    model.rowsRemoved.connect(lambda _parent, first, last: removes.append((first, last)))
+
+    for idx in range(3):
+        model.append(f"line {idx}")
+    assert model.rowCount() == 0
+    assert model.lines() == ["line 0", "line 1", "line 2"]
+
+    model.flush()
+    assert inserts == [(0, 2)]
+    assert model.rowCount() == 3
+
+    for idx in range(3, 7):
+        model.append(f"line {idx}")
+    model.flush()
+    assert removes == [(0, 1)]
+    assert inserts[-1] == (1, 4)
+    assert model.lines() == [f"line {idx}" for idx in range(2, 7)]
+    index = model.index(0, 0)
+    assert model.data(index, ScannerLogModel.LineRole) == "line 2"
+
+
+def test_log_model_keeps_only_newest_pending_lines_and_clears() -> None:
+    model = ScannerLogModel(max_lines=3)
+    model.append("old")
+    model.flush()
+    for idx in range(10):
+        model.append(f"line {idx}")
+    model.flush()
+    assert model.lines() == ["line 7", "line 8", "line 9"]
+    assert model.count == 3
+
+    model.append("pending")
+    model.clear()
+    assert model.rowCount() == 0
+    assert model.lines() == []
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from albion_dps.meter.session_meter import SessionMeter
+from albion_dps.meter.timeline import TimelineRecorder
+from albion_dps.models import CombatEvent
+
+
+def test_timeline_recorder_bins_samples_per_source() -> None:
+    recorder = TimelineRecorder(100.0, resolution=1.0, max_points=10)
+    recorder.add(100.2, 1, "damage", 10)
+    recorder.add(100.9, 1, "damage", 5)
+    recorder.add(102.5, 2, "heal", 8)
+
+    timeline = recorder.freeze(103.0)
+    assert timeline.points == 3
+    assert list(timeline.sources[1].damage) == [15.0, 0.0, 0.0]
+    assert list(timeline.sources[2].heal) == [0.0, 0.0, 8.0]
+    assert timeline.hps_series(2) == [0.0, 0.0, 8.0]
+    assert timeline.dps_series(99) == [0.0, 0.0, 0.0]
+
+
+def test_timeline_recorder_downsamples_to_stay_bounded() -> None:
+    recorder = TimelineRecorder(0.0, resolution=1.0, max_points=8)
+    for second in range(100):
+        recorder.add(second + 0.5, 1, "damage", 1)
+
+    timeline = recorder.freeze(100.0)
+    assert timeline.points <= 8
+    assert timeline.resolution == 16.0
+    assert sum(timeline.sources[1].damage) == 100.0
+    assert timeline.dps_series(1)[0] == 1.0
+
+
+def test_session_summary_carries_timeline() -> None:
+    meter = SessionMeter(history_limit=5, mode="manual", timeline_resolution=0.5)
+    meter.toggle_manual()
+    meter.push(CombatEvent(0.2, 1, 2, 40, "damage"))
+    meter.push(CombatEvent(1.1, 1, 2, 10, "damage"))
+    meter.push(CombatEvent(1.2, 3, 1, 20, "heal"))
+    meter.toggle_manual()
+
+    summary = meter.history()[0]
+    timeline = summary.timeline
+    assert timeline is not None
+    assert timeline.resolution == 0.5
+    assert list(timeline.sources[1].damage) == [40.0, 0.0, 10.0]
+    assert timeline.hps_series(3)[2] == 40.0
+
+
+def test_merged_history_event_updates_timeline() -> None:
+    meter = SessionMeter(history_limit=5, mode="battle")
+    meter.push(CombatEvent(10.0, 1, 2, 10, "damage"))
+    meter.push(CombatEvent(13.0, 1, 2, 10, "damage"))
+    meter.end_session()
+
+    assert meter.merge_event_into_history(CombatEvent(11.5, 7, 2, 30, "damage"))
+    timeline = meter.history()[0].timeline
+    assert timeline is not None
+    assert timeline.sources[7].damage[1] == 30.0
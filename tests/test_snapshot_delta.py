@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from pcap_fixtures import resolve_pcap
+
+import pytest
+
+from albion_dps.domain import NameRegistry, PartyRegistry
+from albion_dps.meter.session_meter import SessionMeter
+from albion_dps.meter.snapshot_delta import (
+    SnapshotAssembler,
+    SnapshotDeltaEncoder,
+    merge_snapshots,
+)
+from albion_dps.models import MeterSnapshot
+from albion_dps.pipeline import replay_snapshots
+from albion_dps.protocol.combat_mapper import CombatEventMapper
+from albion_dps.protocol.photon_decode import PhotonDecoder
+from albion_dps.protocol.registry import default_registry
+
+
+class _Names:
+    def __init__(self) -> None:
+        self.names: dict[int, str] = {}
+        self.version = 0
+        self.snapshots = 0
+
+    def set(self, entity_id: int, name: str) -> None:
+        self.names[entity_id] = name
+        self.version += 1
+
+    def snapshot(self) -> dict[int, str]:
+        self.snapshots += 1
+        return dict(self.names)
+
+    def names_version(self) -> int:
+        return self.version
+
+
+def _full(ts: float, totals: dict[int, float]) -> MeterSnapshot:
+    return MeterSnapshot(
+        timestamp=ts,
+        totals={source_id: {"damage": value, "heal": 0.0} for source_id, value in totals.items()},
+    )
+
+
+def test_encoder_emits_only_changes_between_keyframes() -> None:
+    names = _Names()
+    names.set(1, "Alice")
+    encoder = SnapshotDeltaEncoder(keyframe_interval=3)
+
+    first = encoder.encode(_full(1.0, {1: 10.0, 2: 5.0}), name_source=names)
+    second = encoder.encode(_full(2.0, {1: 20.0, 2: 5.0}), name_source=names)
+    names.set(2, "Bob")
+    third = encoder.encode(_full(3.0, {1: 20.0}), name_source=names)
+    fourth = encoder.encode(_full(4.0, {1: 30.0}), name_source=names)
+
+    assert first.keyframe and first.names == {1: "Alice"}
+    assert second.keyframe is False
+    assert set(second.totals) == {1}
+    assert second.names == {}
+    assert third.totals == {}
+    assert third.removed == (2,)
+    assert third.names == {2: "Bob"}
+    assert fourth.keyframe is True
+    assert fourth.names == {1: "Alice", 2: "Bob"}
+    # Name table is only copied on keyframes or after a name change.
+    assert names.snapshots == 3
+
+
+def test_assembler_and_merge_rebuild_full_state() -> None:
+    names = _Names()
+    encoder = SnapshotDeltaEncoder(keyframe_interval=10)
+    fulls = [
+        _full(1.0, {1: 10.0}),
+        _full(2.0, {1: 10.0, 2: 3.0}),
+        _full(3.0, {2: 4.0}),
+        _full(4.0, {2: 4.0, 3: 1.0}),
+    ]
+    deltas = []
+    for idx, snapshot in enumerate(fulls):
+        names.set(idx, f"P{idx}")
+        deltas.append(encoder.encode(snapshot, name_source=names))
+
+    assembler = SnapshotAssembler()
+    for full, delta in zip(fulls, deltas):
+        rebuilt = assembler.apply(delta)
+        assert rebuilt.totals == full.totals
+
+    merged = merge_snapshots(merge_snapshots(deltas[1], deltas[2]), deltas[3])
+    coalesced = SnapshotAssembler()
+    coalesced.apply(deltas[0])
+    rebuilt = coalesced.apply(merged)
+    assert rebuilt.totals == fulls[-1].totals
+    assert rebuilt.names == {0: "P0", 1: "P1", 2: "P2", 3: "P3"}
+
+
+def test_replay_delta_stream_matches_full_stream() -> None:
+    pcap_path = resolve_pcap("albion_combat_27_party.pcap")
+    if not pcap_path.exists():
+        pytest.skip(f"Missing PCAP fixture: {pcap_path}")
+
+    def run(keyframe_interval: int | None) -> list[MeterSnapshot]:
+        names = NameRegistry()
+        meter = SessionMeter(mode="battle", history_limit=20, name_lookup=names.lookup)
+        return list(
+            replay_snapshots(
+                pcap_path,
+                PhotonDecoder(registry=default_registry()),
+                meter,
+                name_registry=names,
+                party_registry=PartyRegistry(),
+                event_mapper=CombatEventMapper(clamp_overkill=True).map,
+                snapshot_interval=0.0,
+                keyframe_interval=keyframe_interval,
+            )
+        )
+
+    full = run(None)
+    deltas = run(25)
+    assert len(full) == len(deltas)
+    assert any(not snapshot.keyframe for snapshot in deltas)
+    assembler = SnapshotAssembler()
+    for expected, delta in zip(full, deltas):
+        rebuilt = assembler.apply(delta)
+        assert rebuilt.totals == expected.totals
+        assert rebuilt.names == expected.names
+
+
+@pytest.mark.parametrize("meter_kind", ["rolling", "array", "session"])
+def test_encode_meter_rebuilds_full_state_from_dirty_rows(meter_kind: str) -> None:
+    from albion_dps.meter import ArrayRollingMeter, RollingMeter
+    from albion_dps.models import CombatEvent
+
+    if meter_kind == "rolling":
+        meter = RollingMeter(window_seconds=2.0, session_timeout_seconds=5.0)
+    elif meter_kind == "array":
+        meter = ArrayRollingMeter(window_seconds=2.0, session_timeout_seconds=5.0)
+    else:
+        meter = SessionMeter(window_seconds=2.0, mode="manual")
+        meter.toggle_manual()
+    full_calls = 0
+    full_snapshot = meter.snapshot
+
+    def counting_snapshot(*args, **kwargs):
+        nonlocal full_calls
+        full_calls += 1
+        return full_snapshot(*args, **kwargs)
+
+    encoder = SnapshotDeltaEncoder(keyframe_interval=50)
+    assembler = SnapshotAssembler()
+    # Bursts on a few sources, an idle gap (timeout reset for the plain meters) and new sources.
+    schedule = [(0.5 * step, 1 + step % 3) for step in range(8)] + [
+        (12.0 + 0.5 * step, 4 + step % 2) for step in range(6)
+    ]
+    for ts, source_id in schedule:
+        meter.push(CombatEvent(timestamp=ts, source_id=source_id, target_id=99, amount=10.0 + ts, kind="damage"))
+        if hasattr(meter, "touch"):
+            meter.touch(ts)
+        meter.snapshot = counting_snapshot
+        delta = encoder.encode_meter(meter, timestamp=ts)
+        del meter.snapshot
+        rebuilt = assembler.apply(delta)
+        expected = meter.snapshot().totals
+        assert rebuilt.totals == expected
+    # Full snapshots only for the first keyframe and resets.
+    assert full_calls <= 2
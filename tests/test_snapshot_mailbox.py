@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+
+from albion_dps.meter.session_meter import SessionMeter
+from albion_dps.models import CombatEvent, MeterSnapshot
+from albion_dps.qt.runner import (
+    RefreshLimiter,
+    SnapshotMailbox,
+    _drain_snapshots,
+    _produce_snapshots,
+)
+
+
+def _snapshot(ts: float) -> MeterSnapshot:
+    return MeterSnapshot(timestamp=ts, totals={})
+
+
+class _RecordingState:
+    historyLimit = 5
+
+    def __init__(self) -> None:
+        self.updates: list[tuple[float, list]] = []
+
+    def update(self, snapshot, *, history, **_kwargs) -> None:
+        self.updates.append((snapshot.timestamp, history))
+
+
+class _Fame:
+    def total(self) -> int:
+        return 0
+
+    def per_hour(self) -> int:
+        return 0
+
+
+def test_mailbox_keeps_only_latest_snapshot_and_counts_coalesced() -> None:
+    mailbox = SnapshotMailbox()
+    for ts in (1.0, 2.0, 3.0):
+        mailbox.put(_snapshot(ts), history_version=0)
+
+    frame = mailbox.take()
+
+    assert frame is not None
+    assert frame.snapshot.timestamp == 3.0
+    assert frame.coalesced == 2
+    assert mailbox.coalesced_frames == 2
+    assert mailbox.take() is None
+
+
+def test_mailbox_history_change_survives_coalescing() -> None:
+    mailbox = SnapshotMailbox()
+    mailbox.put(_snapshot(1.0), history_version=0)
+    assert mailbox.take().history_changed is True
+
+    mailbox.put(_snapshot(2.0), history_version=1)
+    mailbox.put(_snapshot(3.0), history_version=1)
+    frame = mailbox.take()
+    assert frame.snapshot.timestamp == 3.0
+    assert frame.history_changed is True
+
+    mailbox.put(_snapshot(4.0), history_version=1)
+    assert mailbox.take().history_changed is False
+
+
+def test_mailbox_closed_after_last_snapshot_taken() -> None:
+    mailbox = SnapshotMailbox()
+    _produce_snapshots([_snapshot(1.0), _snapshot(2.0)], mailbox, threading.Event())
+
+    assert mailbox.closed is False
+    assert mailbox.take().snapshot.timestamp == 2.0
+    assert mailbox.closed is True
+
+
+def test_drain_applies_one_update_and_reuses_history() -> None:
+    meter = SessionMeter(mode="battle")
+    meter.push(CombatEvent(10.0, 1, 2, 100, "damage"))
+    meter.end_session()
+    mailbox = SnapshotMailbox()
+    state = _RecordingState()
+    stop_event = threading.Event()
+    history_cache: list = []
+
+    def drain() -> None:
+        _drain_snapshots(
+            mailbox,
+            state,
+            meter=meter,
+            fame=_Fame(),
+            stop_event=stop_event,
+            history_cache=history_cache,
+        )
+
+    for ts in (11.0, 12.0, 13.0):
+        mailbox.put(_snapshot(ts), history_version=meter.history_version())
+    drain()
+    mailbox.put(_snapshot(14.0), history_version=meter.history_version())
+    drain()
+    drain()
+    mailbox.close()
+    drain()
+
+    assert [ts for ts, _history in state.updates] == [13.0, 14.0]
+    assert all(len(history) == 1 for _ts, history in state.updates)
+    assert stop_event.is_set()
+
+
+def test_mailbox_notifies_only_when_snapshot_becomes_available() -> None:
+    wakeups: list[int] = []
+    mailbox = SnapshotMailbox(on_ready=lambda: wakeups.append(1))
+
+    mailbox.put(_snapshot(1.0))
+    mailbox.put(_snapshot(2.0))
+    assert len(wakeups) == 1
+
+    mailbox.take()
+    mailbox.put(_snapshot(3.0))
+    mailbox.close()
+    assert len(wakeups) == 3
+
+
+def test_refresh_limiter_spaces_refreshes_by_max_rate() -> None:
+    now = [100.0]
+    limiter = RefreshLimiter(20.0, clock=lambda: now[0])
+
+    assert limiter.delay() == 0.0
+    limiter.mark()
+    now[0] += 0.01
+    assert abs(limiter.delay() - 0.04) < 1e-9
+    now[0] += 0.1
+    assert limiter.delay() == 0.0
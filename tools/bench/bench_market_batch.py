@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from albion_dps.market.aod_client import MarketPriceRecord  # noqa: E402
+from albion_dps.market.engine import BatchCraftRequest, build_craft_runs_batch  # noqa: E402
+from albion_dps.market.models import (  # noqa: E402
+    CraftSetup,
+    ItemRef,
+    MarketRegion,
+    Recipe,
+    RecipeComponent,
+    RecipeOutput,
+)
+
+_CITIES = ("Bridgewatch", "Caerleon", "Fort Sterling", "Lymhurst", "Martlock", "Thetford", "Brecilien")
+
+
+def _catalog(recipes: int, seed: int) -> list[Recipe]:
+    rng = random.Random(seed)
+    resources = [
+        ItemRef(unique_name=f"T{4 + idx % 5}_RESOURCE_{idx}", tier=4 + idx % 5, item_value=100 + idx)
+        for idx in range(120)
+    ]
+    out: list[Recipe] = []
+    for idx in range(recipes):
+        item = ItemRef(unique_name=f"T{4 + idx % 5}_ITEM_{idx}", tier=4 + idx % 5, item_value=1000 + idx)
+        components = tuple(
+            RecipeComponent(item=resource, quantity=float(rng.randint(4, 24)), returnable=rng.random() > 0.1)
+            for resource in rng.sample(resources, rng.randint(1, 4))
+        )
+        out.append(
+            Recipe(
+                item=item,
+                station="Forge",
+                city_bonus=rng.choice(_CITIES),
+                components=components,
+                outputs=(RecipeOutput(item=item, quantity=1.0),),
+                focus_per_craft=rng.randint(50, 900),
+            )
+        )
+    return out
+
+
+def _price_index(recipes: list[Recipe], seed: int) -> dict[tuple[str, str, int], MarketPriceRecord]:
+    rng = random.Random(seed)
+    item_ids = sorted(
+        {recipe.item.unique_name for recipe in recipes}
+        | {component.item.unique_name for recipe in recipes for component in recipe.components}
+    )
+    return {
+        (item_id, city, 1): MarketPriceRecord(
+            item_id=item_id,
+            city=city,
+            quality=1,
+            sell_price_min=rng.randint(100, 90_000),
+            buy_price_max=rng.randint(100, 90_000),
+            sell_price_min_date="2026-02-20T10:00:00",
+            buy_price_max_date="2026-02-20T09:55:00",
+        )
+        for item_id in item_ids
+        for city in _CITIES
+    }
+
+
+def _requests(recipes: list[Recipe], runs: int) -> list[BatchCraftRequest]:
+    # Every recipe once per sell city, as when picking the best city for each output.
+    return [
+        BatchCraftRequest(
+            recipe=recipe,
+            quantity=runs,
+            output_cities={output.item.unique_name: city for output in recipe.outputs},
+        )
+        for recipe in recipes
+        for city in _CITIES
+    ]
+
+
+def _timed(label: str, rounds: int, fn) -> tuple[float, object]:
+    result = None
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"- {label}: {elapsed * 1000:.1f} ms", flush=True)
+    return elapsed, result
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare serial and process-pool build_craft_runs_batch.")
+    parser.add_argument("--recipes", type=int, default=300, help="Recipes in the plan.")
+    parser.add_argument("--runs", type=int, default=10, help="Crafts per request.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[2, 4],
+        help="Process pool sizes to compare against the serial path.",
+    )
+    parser.add_argument("--chunk-size", type=int, default=None, help="Requests per shard (default: auto).")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed repetitions to average.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    recipes = _catalog(args.recipes, args.seed)
+    price_index = _price_index(recipes, args.seed)
+    requests = _requests(recipes, args.runs)
+    setup = CraftSetup(
+        region=MarketRegion.EUROPE,
+        craft_city="Martlock",
+        default_buy_city="Martlock",
+        default_sell_city="Martlock",
+        station_fee_percent=10.0,
+        market_tax_percent=4.0,
+    )
+    print(
+        f"[bench] {len(recipes)} recipes x {len(_CITIES)} sell cities = {len(requests)} runs, "
+        f"{len(price_index)} quotes",
+        flush=True,
+    )
+    serial_s, serial = _timed(
+        "serial",
+        args.rounds,
+        lambda: build_craft_runs_batch(setup=setup, requests=requests, price_index=price_index),
+    )
+    for workers in args.workers:
+        parallel_s, parallel = _timed(
+            f"{workers} workers",
+            args.rounds,
+            lambda: build_craft_runs_batch(
+                setup=setup,
+                requests=requests,
+                price_index=price_index,
+                max_workers=workers,
+                chunk_size=args.chunk_size,
+            ),
+        )
+        if parallel != serial:
+            print(f"  results differ from serial with {workers} workers", flush=True)
+            return 1
+        print(f"  speedup x{serial_s / parallel_s:.2f}, results identical", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
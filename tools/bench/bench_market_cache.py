@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from albion_dps.market.cache import DEFAULT_COMPRESS_MIN_BYTES, SQLiteCache  # noqa: E402
+
+_CITIES = ("Bridgewatch", "Caerleon", "Fort Sterling", "Lymhurst", "Martlock", "Thetford", "Brecilien")
+
+
+def _price_payloads(items: int, seed: int) -> dict[str, object]:
+    rng = random.Random(seed)
+    payloads: dict[str, object] = {}
+    for idx in range(items):
+        item_id = f"T{4 + idx % 5}_ITEM_{idx}"
+        for city in _CITIES:
+            payloads[f"market:price:europe:{item_id}:{city}:1"] = {
+                "item_id": item_id,
+                "city": city,
+                "quality": 1,
+                "sell_price_min": rng.randint(100, 90_000),
+                "buy_price_max": rng.randint(100, 90_000),
+                "sell_price_min_date": "2026-02-20T10:00:00",
+                "buy_price_max_date": "2026-02-20T09:55:00",
+            }
+    return payloads
+
+
+def _chart_payloads(charts: int, points: int, seed: int) -> dict[str, object]:
+    rng = random.Random(seed)
+    return {
+        f"market:charts:{idx}": [
+            {
+                "timestamp": f"2026-02-{1 + point % 28:02d}T{point % 24:02d}:00:00",
+                "item_count": rng.randint(0, 500),
+                "avg_price": rng.randint(100, 90_000),
+            }
+            for point in range(points)
+        ]
+        for idx in range(charts)
+    }
+
+
+def _run(
+    label: str,
+    payloads: dict[str, object],
+    *,
+    compress: bool,
+    compress_min_bytes: int,
+    rounds: int,
+) -> None:
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_market_cache_"))
+    try:
+        path = tmp_dir / "cache.sqlite3"
+        keys = list(payloads)
+        with SQLiteCache(path, compress=compress, compress_min_bytes=compress_min_bytes) as cache:
+            start = time.perf_counter()
+            cache.set_many(payloads, ttl_seconds=3600)
+            write_s = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(rounds):
+                cache.get_many(keys)
+            read_s = (time.perf_counter() - start) / rounds
+            payload_bytes = cache.payload_bytes()
+        file_bytes = sum(item.stat().st_size for item in tmp_dir.iterdir())
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(
+        f"- {label} ({f'zlib >= {compress_min_bytes} B' if compress else 'json'}): write {write_s * 1000:.1f} ms, "
+        f"read {read_s * 1000:.1f} ms, payload {payload_bytes / 1024:.0f} KiB, "
+        f"files {file_bytes / 1024:.0f} KiB",
+        flush=True,
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare JSON and zlib payload encodings in SQLiteCache.")
+    parser.add_argument("--items", type=int, default=1500, help="Items cached per city (price rows).")
+    parser.add_argument("--charts", type=int, default=200, help="Chart payloads.")
+    parser.add_argument("--points", type=int, default=720, help="Points per chart payload.")
+    parser.add_argument(
+        "--compress-min-bytes",
+        type=int,
+        default=DEFAULT_COMPRESS_MIN_BYTES,
+        help="Smallest JSON payload stored compressed (0 compresses everything).",
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Full read passes to average.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    prices = _price_payloads(args.items, args.seed)
+    charts = _chart_payloads(args.charts, args.points, args.seed)
+    print(
+        f"[bench] {len(prices)} price rows, {len(charts)} charts x {args.points} points",
+        flush=True,
+    )
+    for label, payloads in (("prices", prices), ("charts", charts)):
+        for compress in (False, True):
+            _run(
+                label,
+                payloads,
+                compress=compress,
+                compress_min_bytes=args.compress_min_bytes,
+                rounds=args.rounds,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from albion_dps.meter.aggregate import RollingMeter  # noqa: E402
+from albion_dps.meter.array_meter import ArrayRollingMeter  # noqa: E402
+from albion_dps.models import CombatEvent  # noqa: E402
+
+
+def _build_events(sources: int, seconds: float, hits_per_second: float, seed: int) -> list[CombatEvent]:
+    rng = random.Random(seed)
+    count = int(seconds * hits_per_second)
+    step = 1.0 / hits_per_second
+    events: list[CombatEvent] = []
+    for idx in range(count):
+        source_id = 1000 + rng.randrange(sources)
+        kind = "heal" if rng.random() < 0.2 else "damage"
+        events.append(CombatEvent(idx * step, source_id, 1, rng.randint(50, 900), kind))
+    return events
+
+
+def _run(meter, events: list[CombatEvent], snapshot_every: float, mode: str) -> tuple[float, int]:
+    next_snapshot = 0.0
+    snapshots = 0
+    start = time.perf_counter()
+    for event in events:
+        meter.push(event)
+        if event.timestamp >= next_snapshot:
+            if mode == "delta":
+                meter.snapshot_delta(event.timestamp)
+            elif mode == "table":
+                meter.snapshot_table(event.timestamp)
+            else:
+                meter.snapshot(event.timestamp)
+            snapshots += 1
+            next_snapshot = event.timestamp + snapshot_every
+    return time.perf_counter() - start, snapshots
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare RollingMeter and ArrayRollingMeter throughput.")
+    parser.add_argument("--sources", type=int, default=120, help="Simultaneous source ids.")
+    parser.add_argument("--seconds", type=float, default=120.0, help="Simulated fight length.")
+    parser.add_argument("--hits-per-second", type=float, default=400.0)
+    parser.add_argument("--snapshot-every", type=float, default=0.1, help="Snapshot interval (seconds).")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    events = _build_events(args.sources, args.seconds, args.hits_per_second, args.seed)
+    print(
+        f"[bench] {len(events)} events, {args.sources} sources, snapshot every {args.snapshot_every}s",
+        flush=True,
+    )
+    cases = [
+        ("RollingMeter.snapshot", RollingMeter(session_timeout_seconds=None), "dict"),
+        (
+            "RollingMeter.snapshot (0.1s buckets)",
+            RollingMeter(session_timeout_seconds=None, bucket_seconds=0.1),
+            "dict",
+        ),
+        ("ArrayRollingMeter.snapshot", ArrayRollingMeter(session_timeout_seconds=None), "dict"),
+        ("ArrayRollingMeter.snapshot_table", ArrayRollingMeter(session_timeout_seconds=None), "table"),
+        ("ArrayRollingMeter.snapshot_delta", ArrayRollingMeter(session_timeout_seconds=None), "delta"),
+    ]
+    for label, meter, mode in cases:
+        elapsed, snapshots = _run(meter, events, args.snapshot_every, mode)
+        per_tick_us = (elapsed / snapshots * 1e6) if snapshots else 0.0
+        print(
+            f"- {label}: {elapsed:.3f}s total, {snapshots} snapshots, {per_tick_us:.1f}us per tick",
+            flush=True,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())